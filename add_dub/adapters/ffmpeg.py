@@ -5,52 +5,116 @@ import time
 import subprocess
 import add_dub.helpers.number as _n
 import sys
+import tempfile
+import threading
+from contextlib import nullcontext
 from pathlib import Path
+from typing import Optional
+import add_dub.io.fs as io_fs
+from add_dub.adapters.probe_cache import cached_probe
 from add_dub.core.options import DubOptions
 from add_dub.logger import (log_call, log_time)
 from add_dub.i18n import t
 
+# Ducking dans le mux : taille des trames audio sur lesquelles l'enveloppe est évaluée
+DUCK_FRAME_SAMPLES = 256
+
+# Batch parallèle : plafond global de processus ffmpeg simultanés (None = illimité)
+_FFMPEG_SLOTS: Optional[threading.BoundedSemaphore] = None
+_SHOW_PROGRESS = True
+
+
+def set_ffmpeg_limit(max_procs: Optional[int], show_progress: bool = True) -> None:
+    """
+    Plafonne le nombre de ffmpeg lancés en même temps par run_ffmpeg_with_percentage.
+    show_progress=False coupe l'affichage du pourcentage (illisible avec plusieurs vidéos en parallèle).
+    """
+    global _FFMPEG_SLOTS, _SHOW_PROGRESS
+    _FFMPEG_SLOTS = threading.BoundedSemaphore(max_procs) if max_procs and max_procs > 0 else None
+    _SHOW_PROGRESS = show_progress
+
+
+def ffmpeg_slot():
+    """
+    Contexte à prendre autour de tout lancement de ffmpeg (no-op hors batch parallèle).
+    """
+    return _FFMPEG_SLOTS or nullcontext()
+
 
 def run_ffmpeg_with_percentage(cmd, duration_source):
     """
     cmd : liste FFmpeg déjà contenant -nostats -progress pipe:1
     duration_source : fichier dont on prend la durée (ex: la vidéo d'entrée)
     """
+    duration = _format_duration_sec(ffprobe_json(duration_source))
+
+    with ffmpeg_slot():
+        p = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,          # flux -progress
+            stderr=subprocess.DEVNULL,
+            text=True, encoding="utf-8", errors="replace",
+            bufsize=1
+        )
+
+        try:
+            for line in p.stdout:
+                if not _SHOW_PROGRESS:
+                    continue
+                if line.startswith("out_time_ms="):
+                    val_str = line.split("=", 1)[1].strip()
+                    try:
+                        micro_s = float(val_str)
+                        if duration > 0:
+                            pct = (micro_s / (duration * 10000.0))
+                            print(f"\r{pct:.0f}%", end="", flush=True)
+                    except ValueError:
+                        pass
+                elif line.strip() == "progress=end":
+                    print("\r100%")
+                    break
+        finally:
+            rc = p.wait()
+            if rc != 0:
+                raise subprocess.CalledProcessError(rc, cmd)
+
+def _ffprobe_json(media_path):
+    cmd = [
+        "ffprobe", "-v", "error",
+        "-print_format", "json",
+        "-show_streams", "-show_format",
+        media_path,
+    ]
     try:
-        duration = float(subprocess.check_output(
-            ["ffprobe", "-v", "error", "-show_entries", "format=duration",
-             "-of", "default=nw=1:nk=1", duration_source],
+        result = subprocess.run(
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
             text=True, encoding="utf-8", errors="replace"
-        ).strip())
+        )
+        if result.returncode != 0 or not result.stdout:
+            return None
+        return json.loads(result.stdout)
     except Exception:
-        duration = 0.0
-
-    p = subprocess.Popen(
-        cmd,
-        stdout=subprocess.PIPE,          # flux -progress
-        stderr=subprocess.DEVNULL,
-        text=True, encoding="utf-8", errors="replace",
-        bufsize=1
-    )
+        return None
+
+
+def ffprobe_json(media_path):
+    """
+    Sortie JSON de ffprobe (streams + format), mise en cache par fichier
+    (chemin, taille, mtime). {} si la sonde échoue.
+    """
+    return cached_probe("ffprobe", media_path, _ffprobe_json) or {}
+
 
+def _to_sec(value) -> float:
     try:
-        for line in p.stdout:
-            if line.startswith("out_time_ms="):
-                val_str = line.split("=", 1)[1].strip()
-                try:
-                    micro_s = float(val_str)
-                    if duration > 0:
-                        pct = (micro_s / (duration * 10000.0))
-                        print(f"\r{pct:.0f}%", end="", flush=True)
-                except ValueError:
-                    pass
-            elif line.strip() == "progress=end":
-                print("\r100%")
-                break
-    finally:
-        rc = p.wait()
-        if rc != 0:
-            raise subprocess.CalledProcessError(rc, cmd)
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _format_duration_sec(data) -> float:
+    return _to_sec((data.get("format") or {}).get("duration"))
+
 
 @log_time
 @log_call()
@@ -58,17 +122,7 @@ def get_track_info(video_fullpath):
     """
     Retourne la liste des streams 'audio' (objets JSON ffprobe).
     """
-    cmd = [
-        "ffprobe", "-v", "error",
-        "-print_format", "json",
-        "-show_streams",
-        video_fullpath,
-    ]
-    result = subprocess.run(
-        cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
-        text=True, encoding="utf-8", errors="replace"
-    )
-    data = json.loads(result.stdout) if result.stdout else {}
+    data = ffprobe_json(video_fullpath)
     audio_tracks = []
     for stream in data.get("streams", []):
         if stream.get("codec_type") == "audio":
@@ -104,32 +158,60 @@ def extract_audio_track(video_fullpath, audio_track_index, output_wav, duration_
 
 
 
+@log_time
+@log_call()
+def probe_duration_ms(media_path, stream_index=None):
+    """
+    Durée (ms) d'un média via ffprobe, sans décoder : durée du flux 'stream_index'
+    si elle est connue, sinon celle du conteneur. None si indéterminable.
+    """
+    data = ffprobe_json(media_path)
+    values = []
+    if stream_index is not None:
+        for stream in data.get("streams", []):
+            if str(stream.get("index")) == str(stream_index):
+                values.append(_to_sec(stream.get("duration")))
+                break
+    values.append(_format_duration_sec(data))
+    for val in values:
+        if val > 0:
+            return int(val * 1000)
+    return None
+
+
 @log_time
 @log_call(exclude="subtitle_srt_path")
 def dub_in_one_pass(
     *,
     video_fullpath: str,
-    bg_wav: str,                 # audio1_wav (BG)
+    bg_wav: Optional[str],       # audio1_wav (BG) ; None → piste 'audio_stream_index' de la source
     tts_wav: str,                # audio2_wav (TTS)
-    original_wav: str,           # WAV de l'audio d'origine (déjà extrait)
+    original_wav: Optional[str], # WAV de l'audio d'origine ; None → piste prise dans la source
     subtitle_srt_path: str,
     output_video_path: str,
     opts: DubOptions,
+    bg_volume_expr: Optional[str] = None,
+    audio_stream_index: Optional[int] = None,
 ):
     """
     Fait en UNE PASSE :
+      - ducking du BG si bg_volume_expr est fourni (volume=...:eval=frame, cf. ducking.build_ffmpeg_volume_expr),
       - mix BG+TTS (amix) avec volumes,
       - encode le mix au codec cible (audio_codec_args),
       - encode l'audio original au même codec,
       - applique les offsets (vidéo et sous-titres),
       - mux dans le conteneur final avec métadonnées/dispositions.
 
-    Entrées:
-      0: (avec -itsoffset) vidéo source
-      1: bg_wav
-      2: tts_wav
-      3: original_wav (sera encodé comme piste audio #1)
-      4: (avec -itsoffset) sous-titres SRT
+    Entrées (dans l'ordre, indices attribués au fil de l'eau):
+      - (avec -itsoffset) vidéo source
+      - bg_wav
+      - tts_wav
+      - original_wav (sera encodé comme piste audio #1)
+      - (avec -itsoffset) sous-titres SRT
+    Si bg_wav / original_wav valent None, la piste 'audio_stream_index' est lue
+    directement dans la source (entrée vidéo si offset vidéo nul, sinon la source
+    est ajoutée une seule fois sans décalage) : pas de WAV intermédiaire.
+    opts.orig_audio_copy : la piste originale lue dans la source est copiée sans réencodage.
     Sorties mappées:
       - 0:v:0  (copié ou transcodé selon extension)
     """
@@ -151,45 +233,89 @@ def dub_in_one_pass(
     else:
         copy_video = ["-c:v", "copy"]
 
+    # Entrées
+    input_args = ["-itsoffset", str(offset_video_s), "-i", video_fullpath]
+    n_inputs = 1
+    source_in = 0 if offset_video_s == 0 else None
+
+    def _add_input(args):
+        nonlocal n_inputs
+        input_args.extend(args)
+        n_inputs += 1
+        return n_inputs - 1
+
+    def _source_input():
+        nonlocal source_in
+        if source_in is None:
+            source_in = _add_input(["-i", video_fullpath])
+        return source_in
+
+    if (bg_wav is None or original_wav is None) and audio_stream_index is None:
+        raise ValueError("audio_stream_index requis pour lire l'audio dans la source")
+
+    if bg_wav:
+        bg_label = f"{_add_input(['-i', bg_wav])}:a"
+    else:
+        bg_label = f"{_source_input()}:{audio_stream_index}"
+    tts_label = f"{_add_input(['-i', tts_wav])}:a"
+    if original_wav:
+        orig_map = f"{_add_input(['-i', original_wav])}:a:0"
+        copy_orig = False
+    else:
+        orig_map = f"{_source_input()}:{audio_stream_index}"
+        copy_orig = bool(getattr(opts, "orig_audio_copy", False))
+    sub_in = _add_input(["-itsoffset", str(offset_s), "-i", subtitle_srt_path])
+
+    # Enveloppe de ducking (trames courtes pour des rampes fluides)
+    duck = ""
+    if bg_volume_expr:
+        duck = f",asetnsamples=n={DUCK_FRAME_SAMPLES}:p=0,volume='{bg_volume_expr}':eval=frame"
+
     # Mix en s16/stereo et resample asynchrone, volumes appliqués
     filter_str = (
-        f"[1:a]aformat=sample_fmts=s16:channel_layouts=stereo,aresample=async=1,volume={opts.bg_mix}[bg];"
-        f"[2:a]aformat=sample_fmts=s16:channel_layouts=stereo,aresample=async=1,volume={opts.tts_mix}[tts];"
+        f"[{bg_label}]aformat=sample_fmts=s16:channel_layouts=stereo,aresample=async=1,volume={opts.bg_mix}{duck}[bg];"
+        f"[{tts_label}]aformat=sample_fmts=s16:channel_layouts=stereo,aresample=async=1,volume={opts.tts_mix}[tts];"
         f"[bg][tts]amix=inputs=2:duration=longest:dropout_transition=0[a_mix]"
     )
 
+    # Une expression de ducking peut dépasser la limite de ligne de commande (Windows : 32767)
+    script_path = None
+    if bg_volume_expr:
+        fd, script_path = tempfile.mkstemp(prefix="filter_", suffix=".txt", dir=io_fs.TMP_DIR)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(filter_str)
+        filter_args = ["-filter_complex_script", script_path]
+    else:
+        filter_args = ["-filter_complex", filter_str]
+
     # Construction commande unique
     cmd = [
         "ffmpeg", "-y",
         "-hide_banner", "-loglevel", "error",
         "-nostats", "-progress", "pipe:1",
 
-        # 0: vidéo (avec offset vidéo)
-        "-itsoffset", str(offset_video_s), "-i", video_fullpath,
-
-        # 1: BG wav, 2: TTS wav, 3: original wav
-        "-i", bg_wav,
-        "-i", tts_wav,
-        "-i", original_wav,
-
-        # 4: sous-titres (avec offset ST)
-        "-itsoffset", str(offset_s), "-i", subtitle_srt_path,
+        # vidéo (avec offset vidéo), BG, TTS, original, sous-titres (avec offset ST)
+        *input_args,
 
-        # Filter pour fabriquer [a_mix]
-        "-filter_complex", filter_str,
+        # Filter pour fabriquer [a_mix] (script fichier si l'expression de ducking est longue)
+        *filter_args,
 
         # Mapping sorties
         "-map", "0:v:0",
         "-map", "[a_mix]",   # audio 0 (dub)
-        "-map", "3:a:0",     # audio 1 (original)
-        "-map", "4:0",       # sous-titres
+        "-map", orig_map,    # audio 1 (original)
+        "-map", f"{sub_in}:0",  # sous-titres
 
     ] + copy_video + [
         # Audio: même codec/paramètres pour TOUTES les pistes audio
         # (audio_codec_args est appliqué globalement à -c:a)
         "-c:a", opts.audio_codec, "-b:a", f"{int(opts.audio_bitrate)}k", 
+    ] + (
+        # Piste originale copiée telle quelle depuis la source
+        ["-c:a:1", "copy"] if copy_orig else
         # Force stéréo pour la piste audio 1 (original encodé), la 0 sort déjà en stéréo du mix
-        "-ac:a:1", "2",
+        ["-ac:a:1", "2"]
+    ) + [
 
         # Codec des sous-titres
         "-c:s:0", opts.sub_codec,
@@ -209,5 +335,12 @@ def dub_in_one_pass(
     ]
 
     # Barre de progression (basée sur la durée vidéo)
-    run_ffmpeg_with_percentage(cmd, duration_source=video_fullpath)
+    try:
+        run_ffmpeg_with_percentage(cmd, duration_source=video_fullpath)
+    finally:
+        if script_path:
+            try:
+                os.remove(script_path)
+            except Exception:
+                pass
     return output_video_path
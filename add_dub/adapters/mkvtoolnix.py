@@ -6,6 +6,8 @@ import subprocess
 import tempfile
 from pathlib import Path
 
+from add_dub.adapters.probe_cache import cached_probe
+
 def _find_exe(candidates):
     for c in candidates:
         p = shutil.which(c)
@@ -15,7 +17,7 @@ def _find_exe(candidates):
             return c
     return None
 
-def mkvmerge_identify_json(video_path):
+def _mkvmerge_identify(video_path):
     mkvmerge = _find_exe([
         "mkvmerge",
         r"C:\Program Files\MKVToolNix\mkvmerge.exe",
@@ -33,6 +35,12 @@ def mkvmerge_identify_json(video_path):
     except Exception:
         return None
 
+def mkvmerge_identify_json(video_path):
+    """
+    Sortie JSON de `mkvmerge -J`, mise en cache par fichier (chemin, taille, mtime).
+    """
+    return cached_probe("mkvmerge", video_path, _mkvmerge_identify)
+
 def mkv_has_subtitle_track(video_path):
     info = mkvmerge_identify_json(video_path)
     if not info:
@@ -69,26 +77,18 @@ def audio_video_offset_ms(video_path, audio_track_id):
 
     Retourne un int (ms). Positif = audio commence après la vidéo.
     """
-    mkvmerge = _find_exe([
-        "mkvmerge",
-        r"C:\Program Files\MKVToolNix\mkvmerge.exe",
-        r"C:\Program Files (x86)\MKVToolNix\mkvmerge.exe",
-    ])
     mkvextract = _find_exe([
         "mkvextract",
         r"C:\Program Files\MKVToolNix\mkvextract.exe",
         r"C:\Program Files (x86)\MKVToolNix\mkvextract.exe",
     ])
-    if not mkvmerge or not mkvextract:
+    if not mkvextract:
         raise FileNotFoundError("mkvmerge ou mkvextract introuvable")
 
     # Obtenir l'ID de la piste vidéo de référence
-    result = subprocess.run(
-        [mkvmerge, "-J", video_path],
-        stdout=subprocess.PIPE, stderr=subprocess.PIPE,
-        text=True, encoding="utf-8", errors="replace", check=True
-    )
-    info = json.loads(result.stdout)
+    info = mkvmerge_identify_json(video_path)
+    if info is None:
+        raise RuntimeError("Identification mkvmerge impossible")
     video_ids = sorted(t["id"] for t in info.get("tracks", []) if t.get("type") == "video")
     if not video_ids:
         raise RuntimeError("Aucune piste vidéo trouvée")
@@ -0,0 +1,112 @@
+# add_dub/adapters/probe_cache.py
+"""
+Cache des identifications de médias (mkvmerge -J, ffprobe -show_streams -show_format).
+
+Clé : chemin absolu + taille + date de modification. Une entrée n'est servie que si
+le fichier n'a pas changé ; sinon la sonde est relancée et l'entrée remplacée.
+
+  - en mémoire pour le processus (un seul appel par fichier et par outil),
+  - sur disque (~/.cache/add_dub/probe.json), écrit par flush() (fin de scan, fin
+    de programme) : un second scan d'une bibliothèque ne relance aucun processus.
+
+Les échecs (outil absent, fichier illisible) ne sont jamais mis en cache.
+"""
+from __future__ import annotations
+
+import os
+import json
+import uuid
+import atexit
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from add_dub.io.fs import join_cache
+
+CACHE_FILE = "probe.json"
+
+_LOCK = threading.Lock()
+_ENTRIES: Optional[Dict[str, dict]] = None
+_DIRTY = False
+
+
+def _cache_path() -> str:
+    return join_cache(CACHE_FILE)
+
+
+def _sig(path: str) -> Optional[Tuple[str, list]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return os.path.normcase(os.path.abspath(path)), [st.st_size, st.st_mtime_ns]
+
+
+def _entries() -> Dict[str, dict]:
+    global _ENTRIES
+    if _ENTRIES is None:
+        try:
+            with open(_cache_path(), "r", encoding="utf-8") as f:
+                _ENTRIES = dict(json.load(f).get("files") or {})
+        except Exception:
+            _ENTRIES = {}
+    return _ENTRIES
+
+
+def cached_probe(tool: str, path: str, probe: Callable[[str], Any]) -> Any:
+    """
+    Résultat de probe(path) pour l'outil 'tool', servi depuis le cache si le fichier
+    n'a pas changé. Un résultat None (échec) n'est pas mémorisé.
+    """
+    global _DIRTY
+    sig = _sig(path)
+    if sig is None:
+        return probe(path)
+    key, stamp = sig
+    with _LOCK:
+        entry = _entries().get(key)
+        if entry and entry.get("sig") == stamp and tool in entry:
+            return entry[tool]
+
+    result = probe(path)
+    if result is None:
+        return None
+
+    with _LOCK:
+        entries = _entries()
+        entry = entries.get(key)
+        if not entry or entry.get("sig") != stamp:
+            entry = {"sig": stamp}
+            entries[key] = entry
+        entry[tool] = result
+        _DIRTY = True
+    return result
+
+
+def flush() -> None:
+    """
+    Écrit le cache sur disque s'il a changé (entrées des fichiers disparus retirées).
+    Jamais bloquant.
+    """
+    global _DIRTY
+    with _LOCK:
+        if not _DIRTY or _ENTRIES is None:
+            return
+        data = {k: dict(v) for k, v in _ENTRIES.items() if os.path.exists(k)}
+        _DIRTY = False
+
+    path = _cache_path()
+    tmp = f"{path}.{uuid.uuid4().hex}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"version": 1, "files": data}, f, ensure_ascii=False)
+        os.replace(tmp, path)
+    except Exception:
+        try:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+        except Exception:
+            pass
+
+
+atexit.register(flush)
@@ -37,12 +37,17 @@ def parse_args(argv: List[str]) -> Tuple[argparse.Namespace, List[str]]:
     g_io.add_argument("--preserve-tree", "-t", action="store_true", help=t("help_preserve_tree"))
     g_io.add_argument("--overwrite", action="store_true", help=t("help_overwrite"))
     g_io.add_argument("--skip-existing", action="store_true", help=t("help_skip_existing"))
+    g_io.add_argument("--resume", action="store_true", help=t("help_resume"))
     g_io.add_argument("--dry-run", action="store_true", help=t("help_dry_run"))
+    g_io.add_argument("--jobs", "-j", type=int, metavar="N", default=fused["batch_jobs"], help=t("help_jobs"))
+    g_io.add_argument("--ffmpeg-jobs", type=int, metavar="N", default=fused["ffmpeg_jobs"], help=t("help_ffmpeg_jobs"))
+    g_io.add_argument("--tts-jobs", type=int, metavar="N", default=fused["tts_jobs"], help=t("help_tts_jobs"))
 
     # 2. Audio Configuration
     g_audio = parser.add_argument_group(t("grp_audio"))
     g_audio.add_argument("--tts-engine", choices=["onecore", "edge", "gtts"], default=fused["tts_engine"], help=t("help_tts_engine"))
     g_audio.add_argument("--voice", metavar="ID", default=fused["voice"], help=t("help_voice"))
+    g_audio.add_argument("--edge-concurrency", type=int, metavar="N", default=fused["edge_concurrency"], help=t("help_edge_concurrency"))
     g_audio.add_argument("--audio-index", type=int, metavar="IDX", default=None, help=t("help_audio_index"))
     g_audio.add_argument("--audio-codec", metavar="CODEC", default=fused["audio_codec"], 
                          choices=["ac3", "aac", "libopus", "opus", "flac", "libvorbis", "vorbis", "pcm_s16le"],
@@ -69,6 +74,7 @@ def parse_args(argv: List[str]) -> Tuple[argparse.Namespace, List[str]]:
     g_mix.add_argument("--min-rate-tts", type=float, metavar="RATE", default=fused["min_rate_tts"], help=t("help_min_rate_tts"))
     g_mix.add_argument("--max-rate-tts", type=float, metavar="RATE", default=fused["max_rate_tts"], help=t("help_max_rate_tts"))
     g_mix.add_argument("--limit-duration-sec", type=int, metavar="SEC", default=None, help=t("help_limit_duration"))
+    g_mix.add_argument("--no-tts-cache", action="store_true", help=t("help_no_tts_cache"))
 
     args, unknown = parser.parse_known_args(argv)
 
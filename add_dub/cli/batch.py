@@ -8,12 +8,15 @@ from dataclasses import replace
 from add_dub.io.fs import ensure_base_dirs, INPUT_DIR, set_base_dirs
 from add_dub.core.options import DubOptions
 from add_dub.core.pipeline import process_one_video
+from add_dub.core.scheduler import BatchScheduler
+from add_dub.core.tts_pool import TTSWorkerPool
 from add_dub.core.subtitles import (
     list_input_videos,
     resolve_srt_for_video,
     find_sidecar_srt,
     _srt_in_srt_dir_for_video,
 )
+from add_dub.core.library import VIDEO_EXTS, scan_videos, video_item, walk_videos
 from add_dub.core.codecs import final_audio_codec_args, subtitle_codec_for_container
 from add_dub.core.tts_generate import generate_dub_audio
 from add_dub.core.tts_registry import (
@@ -21,6 +24,7 @@ from add_dub.core.tts_registry import (
     resolve_voice_with_fallbacks,
 )
 from add_dub.adapters.ffmpeg import get_track_info  # ffprobe
+from add_dub.adapters.mkvtoolnix import mkvmerge_identify_json
 from add_dub.config.opts_loader import load_options
 from add_dub.i18n import t
 
@@ -55,14 +59,21 @@ def _gather_targets(paths: Optional[List[str]], recursive: bool, preserve_tree:
     - Sinon, accepte fichiers/dossiers absolus ou relatifs; peut parcourir récursivement.
     """
     ensure_base_dirs()
-    results: List[Tuple[str, str]] = []
+    items = []
 
     if not paths:
         for name in list_input_videos():
-            results.append((os.path.join(io_fs.INPUT_DIR, name), ""))
-        return results
+            items.append(video_item(os.path.join(io_fs.INPUT_DIR, name)))
+        return _scan_targets(items)
 
-    exts = (".mkv", ".mp4", ".avi", ".mov")
+    def _add_dir(d: str) -> None:
+        if recursive:
+            rel_base = os.path.dirname(d.rstrip(os.sep)) if preserve_tree else None
+            items.extend(walk_videos(d, recursive=True, rel_base=rel_base))
+        else:
+            items.extend(walk_videos(d))
+
+    exts = VIDEO_EXTS
     for p in paths:
         if not p:
             continue
@@ -70,54 +81,41 @@ def _gather_targets(paths: Optional[List[str]], recursive: bool, preserve_tree:
 
         # Fichier vidéo direct
         if os.path.isfile(p) and p.lower().endswith(exts):
-            results.append((p, ""))
+            items.append(video_item(p))
             continue
 
         # Dossier
         if os.path.isdir(p):
-            if recursive:
-                base_parent = os.path.dirname(p.rstrip(os.sep)) if preserve_tree else p
-                for root, _dirs, files in os.walk(p):
-                    rel_dir = ""
-                    if preserve_tree:
-                        rel = os.path.relpath(root, base_parent)
-                        rel_dir = "" if rel == "." else rel
-                    for f in files:
-                        if f.lower().endswith(exts):
-                            results.append((os.path.join(root, f), rel_dir))
-            else:
-                for f in os.listdir(p):
-                    if f.lower().endswith(exts):
-                        results.append((os.path.join(p, f), ""))
+            _add_dir(p)
             continue
 
         # Nom relatif par rapport à INPUT_DIR (ex: juste "foo.mkv")
         candidate = os.path.join(io_fs.INPUT_DIR, p)
         if os.path.isfile(candidate) and candidate.lower().endswith(exts):
-            results.append((candidate, ""))
+            items.append(video_item(candidate))
         elif os.path.isdir(candidate):
             if recursive:
-                base_parent = os.path.dirname(candidate.rstrip(os.sep)) if preserve_tree else candidate
-                for root, _dirs, files in os.walk(candidate):
-                    rel_dir = ""
-                    if preserve_tree:
-                        rel = os.path.relpath(root, base_parent)
-                        rel_dir = "" if rel == "." else rel
-                    for f in files:
-                        if f.lower().endswith(exts):
-                            results.append((os.path.join(root, f), rel_dir))
+                _add_dir(candidate)
             else:
                 for name in list_input_videos():
-                    results.append((os.path.join(io_fs.INPUT_DIR, name), ""))
+                    items.append(video_item(os.path.join(io_fs.INPUT_DIR, name)))
 
     # Déduplique en préservant l'ordre
     seen = set()
-    dedup: List[Tuple[str, str]] = []
-    for x in results:
+    dedup = []
+    for x in items:
         if x[0] not in seen:
             seen.add(x[0])
             dedup.append(x)
-    return dedup
+    return _scan_targets(dedup)
+
+
+def _scan_targets(items) -> List[Tuple[str, str]]:
+    """
+    Sonde les pistes audio de toutes les cibles en parallèle (cache ffprobe chaud
+    pour choose_audio_track), sans filtrer la liste.
+    """
+    return [(e.path, e.rel_dir) for e in scan_videos(items, probe_audio=True)]
 
 
 from add_dub.core.ui import ConsoleUI
@@ -228,8 +226,59 @@ def _make_options(args) -> DubOptions:
         batch_mode=True,
         overwrite=args.overwrite,
         skip_existing=getattr(args, "skip_existing", False),
+        resume=getattr(args, "resume", False),
+        tts_cache=fused["tts_cache"] and not getattr(args, "no_tts_cache", False),
+        tts_cache_max_mb=fused["tts_cache_max_mb"],
+        tts_handoff=fused["tts_handoff"],
+        edge_async=fused["edge_async"],
+        edge_concurrency=args.edge_concurrency,
+        edge_timeout_s=fused["edge_timeout_s"],
+        stretch_backend=fused["stretch_backend"],
+        ducking_mode=fused["ducking_mode"],
+        orig_audio_passthrough=fused["orig_audio_passthrough"],
+        orig_audio_copy=fused["orig_audio_copy"],
+        tts_workers=fused["tts_workers"],
+        batch_jobs=args.jobs,
+        ffmpeg_jobs=args.ffmpeg_jobs,
+        tts_jobs=args.tts_jobs,
+        tts_job_timeout_s=fused["tts_job_timeout_s"],
+        tts_max_retries=fused["tts_max_retries"],
+        redub_manifest=fused["redub_manifest"],
+        translate_compute_type=fused["translate_compute_type"],
+        translate_merge_sentences=fused["translate_merge_sentences"],
+        translate_stream=fused["translate_stream"],
+        translation_memory=fused["translation_memory"],
+        translation_memory_max_mb=fused["translation_memory_max_mb"],
     )
 
+def _translation_pairs(targets: List[Tuple[str, str]], opts: DubOptions, args):
+    """
+    Paires (source, cible) que le batch va traduire : langue source imposée, sinon
+    devinée par vidéo (nom, SRT disponible, langue déclarée de la piste MKV).
+    """
+    from add_dub.core.translation import guess_source_lang
+
+    target = opts.translate_to
+    forced = str(opts.translate_from or "").strip().lower()
+    if forced and forced != "auto":
+        yield forced, target
+        return
+
+    mode = (getattr(args, "sub_mode", "auto") or "auto").lower()
+    try:
+        sub_index = max(0, int(getattr(args, "sub_index", 0)))
+    except Exception:
+        sub_index = 0
+    for video, _rel in targets:
+        srt = None
+        if mode != "mkv":
+            srt = _srt_in_srt_dir_for_video(video) or find_sidecar_srt(video)
+        info = mkvmerge_identify_json(video) if not srt and video.lower().endswith(".mkv") else None
+        src = guess_source_lang(video, srt, info, sub_index if mode == "mkv" else 0)
+        if src and src != target:
+            yield src, target
+
+
 def main(args) -> int:
     # Applique les dossiers depuis options.conf (pas de prompt en batch)
     _apply_dirs_from_conf()
@@ -244,15 +293,52 @@ def main(args) -> int:
     svcs = _build_services(args)
     opts = _make_options(args)
 
-    any_error = False
-    for path, rel_dir in targets:
-        print(t("cli_batch_start", path=path))
+    # Pool TTS persistant : workers préchauffés une fois, réutilisés pour toutes les vidéos
+    pool = None
+    if not args.dry_run and not (opts.tts_engine == "edge" and opts.edge_async):
+        pool = TTSWorkerPool(opts.tts_engine, opts.tts_workers)
+        pool.warm()
+        svcs = replace(svcs, tts_executor=pool)
 
+    # Modèles de traduction chargés en tâche de fond, résidents pour toutes les vidéos
+    if not args.dry_run and opts.translate and opts.translate_to:
+        try:
+            from add_dub.core.translation import preload_translators
+            preload_translators(_translation_pairs(targets, opts, args), opts.translate_compute_type)
+        except Exception:
+            pass
+    try:
+        return _run_targets(args, targets, svcs, opts)
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _run_targets(args, targets: List[Tuple[str, str]], svcs: Services, opts: DubOptions) -> int:
+    def _out_dir_for(rel_dir: str) -> Optional[str]:
         if rel_dir:
             base_out = args.output_dir or io_fs.OUTPUT_DIR
-            out_dir = os.path.join(base_out, rel_dir)
-        else:
-            out_dir = args.output_dir or None
+            return os.path.join(base_out, rel_dir)
+        return args.output_dir or None
+
+    if not args.dry_run and opts.batch_jobs > 1 and len(targets) > 1:
+        scheduler = BatchScheduler(
+            svcs,
+            opts,
+            jobs=opts.batch_jobs,
+            tts_jobs=opts.tts_jobs,
+            ffmpeg_jobs=opts.ffmpeg_jobs,
+            limit_duration_sec=args.limit_duration_sec,
+        )
+        results = scheduler.run([(path, _out_dir_for(rel_dir)) for path, rel_dir in targets])
+        failed = sum(1 for r in results if not r)
+        print(t("cli_batch_summary", ok=len(results) - failed, failed=failed))
+        return 1 if failed else 0
+
+    any_error = False
+    for path, rel_dir in targets:
+        print(t("cli_batch_start", path=path))
+        out_dir = _out_dir_for(rel_dir)
 
         if args.dry_run:
             sub_choice = svcs.choose_subtitle_source(path)
@@ -74,4 +74,33 @@ TRANSLATE = False
 TRANSLATE_TO = "fr"
 TRANSLATE_FROM = None
 REUSE_TRANSLATED_SUBS = True
+TRANSLATION_MEMORY = True       # mémoire de traduction persistante (~/.cache/add_dub/translation_memory.sqlite)
+TRANSLATION_MEMORY_MAX_MB = 64  # au-delà : éviction des entrées les moins récemment utilisées
+TRANSLATE_MERGE_SENTENCES = False  # traduction par phrases : répliques regroupées puis redécoupées
+TRANSLATE_STREAM = True  # synthèse TTS lancée au fil de la traduction (SRT traduit écrit à la fin)
+
+# PERFORMANCE
+VOICE_CACHE_TTL_H = 24          # validité du catalogue de voix mis en cache sur disque (heures)
+SCAN_WORKERS = 8                # sondes mkvmerge/ffprobe simultanées lors du scan des vidéos d'entrée
+TRANSLATE_INTER_THREADS = 0     # traduction : lots décodés en parallèle (0 = auto selon les cœurs)
+TRANSLATE_INTRA_THREADS = 0     # traduction : threads par lot (0 = auto)
+TRANSLATE_MAX_BATCH_TOKENS = 2048  # traduction : taille max d'un lot, en tokens
+TTS_CACHE = True                # cache disque des segments TTS (~/.cache/add_dub/tts_segments)
+TTS_CACHE_MAX_MB = 2048         # au-delà : éviction LRU
+TTS_HANDOFF = "pcm"             # "pcm" : segments renvoyés en mémoire ; "wav" : un fichier par segment
+EDGE_ASYNC = True               # Edge : une seule boucle asyncio au lieu d'un pool de processus
+EDGE_CONCURRENCY = 32           # Edge : flux simultanés
+EDGE_TIMEOUT_S = 30.0           # Edge : timeout par réplique
+STRETCH_BACKEND = "wsola"       # "wsola" : time-stretch NumPy en mémoire ; "ffmpeg" : atempo
+DUCKING_MODE = "stream"         # "stream" : par blocs (mémoire constante) ; "memory" : piste entière ; "ffmpeg" : dans le mux
+ORIG_AUDIO_PASSTHROUGH = True   # piste originale du MKV lue dans la source (pas de WAV relu)
+ORIG_AUDIO_COPY = False         # piste originale copiée sans réencodage (si passthrough)
+TTS_WORKERS = 0                 # processus TTS par vidéo (0 = auto : min(20, nb de CPU))
+BATCH_JOBS = 1                  # batch : vidéos traitées en parallèle (1 = séquentiel)
+FFMPEG_JOBS = 2                 # batch : processus ffmpeg simultanés
+TTS_JOBS = 1                    # batch : vidéos en synthèse TTS simultanément
+TTS_JOB_TIMEOUT_S = 60.0        # TTS (pool de processus) : délai max d'une réplique avant relance
+TTS_MAX_RETRIES = 2             # TTS : relances d'une réplique bloquée/en échec (puis silence)
+REDUB_MANIFEST = True           # re-doublage incrémental : seules les répliques modifiées sont re-synthétisées
+TRANSLATE_COMPUTE_TYPE = "default"  # traduction : "int8" = mémoire réduite, décodage CPU plus rapide
 
@@ -32,6 +32,40 @@ def _normalized_tts_engine(raw: str | None) -> str:
     return "onecore"
 
 
+def _normalized_handoff(raw: str | None) -> str:
+    """
+    Mode de transfert des segments TTS worker → parent : "pcm" (défaut) ou "wav".
+    """
+    s = str(raw or "").strip().lower()
+    return s if s in ("pcm", "wav") else "pcm"
+
+
+def _normalized_stretch_backend(raw: str | None) -> str:
+    """
+    Backend de changement de vitesse TTS : "wsola" (NumPy, défaut) ou "ffmpeg" (atempo).
+    """
+    s = str(raw or "").strip().lower()
+    return s if s in ("wsola", "ffmpeg") else "wsola"
+
+
+def _normalized_ducking_mode(raw: str | None) -> str:
+    """
+    Mode de ducking : "stream" (par blocs, défaut), "memory" (piste entière en mémoire)
+    ou "ffmpeg" (enveloppe de volume appliquée pendant le mux final, sans WAV intermédiaire).
+    """
+    s = str(raw or "").strip().lower()
+    return s if s in ("stream", "memory", "ffmpeg") else "stream"
+
+
+def _normalized_compute_type(raw: str | None) -> str:
+    """
+    Type de calcul CTranslate2 : "default" (poids du modèle), "int8" (mémoire réduite,
+    décodage CPU plus rapide), "int8_float32" ou "float32".
+    """
+    s = str(raw or "").strip().lower()
+    return s if s in ("default", "int8", "int8_float32", "float32") else "default"
+
+
 def effective_values(root: str | None = None) -> Dict[str, Any]:
     """
     Retourne les **valeurs scalaires effectives** (options.conf > defaults.py) destinées
@@ -69,6 +103,29 @@ def effective_values(root: str | None = None) -> Dict[str, Any]:
         if translate_from.lower() == "auto" or not translate_from:
             translate_from = None
 
+    tts_cache = bool(_conf_value(opts, "tts_cache", getattr(cfg, "TTS_CACHE", True)))
+    tts_cache_max_mb = int(_conf_value(opts, "tts_cache_max_mb", getattr(cfg, "TTS_CACHE_MAX_MB", 2048)))
+    tts_handoff = _normalized_handoff(_conf_value(opts, "tts_handoff", getattr(cfg, "TTS_HANDOFF", "pcm")))
+    edge_async = bool(_conf_value(opts, "edge_async", getattr(cfg, "EDGE_ASYNC", True)))
+    edge_concurrency = int(_conf_value(opts, "edge_concurrency", getattr(cfg, "EDGE_CONCURRENCY", 32)))
+    edge_timeout_s = float(_conf_value(opts, "edge_timeout_s", getattr(cfg, "EDGE_TIMEOUT_S", 30.0)))
+    stretch_backend = _normalized_stretch_backend(_conf_value(opts, "stretch_backend", getattr(cfg, "STRETCH_BACKEND", "wsola")))
+    ducking_mode = _normalized_ducking_mode(_conf_value(opts, "ducking_mode", getattr(cfg, "DUCKING_MODE", "stream")))
+    orig_audio_passthrough = bool(_conf_value(opts, "orig_audio_passthrough", getattr(cfg, "ORIG_AUDIO_PASSTHROUGH", True)))
+    orig_audio_copy = bool(_conf_value(opts, "orig_audio_copy", getattr(cfg, "ORIG_AUDIO_COPY", False)))
+    tts_workers = int(_conf_value(opts, "tts_workers", getattr(cfg, "TTS_WORKERS", 0)))
+    batch_jobs = int(_conf_value(opts, "batch_jobs", getattr(cfg, "BATCH_JOBS", 1)))
+    ffmpeg_jobs = int(_conf_value(opts, "ffmpeg_jobs", getattr(cfg, "FFMPEG_JOBS", 2)))
+    tts_jobs = int(_conf_value(opts, "tts_jobs", getattr(cfg, "TTS_JOBS", 1)))
+    tts_job_timeout_s = float(_conf_value(opts, "tts_job_timeout_s", getattr(cfg, "TTS_JOB_TIMEOUT_S", 60.0)))
+    tts_max_retries = int(_conf_value(opts, "tts_max_retries", getattr(cfg, "TTS_MAX_RETRIES", 2)))
+    redub_manifest = bool(_conf_value(opts, "redub_manifest", getattr(cfg, "REDUB_MANIFEST", True)))
+    translate_compute_type = _normalized_compute_type(_conf_value(opts, "translate_compute_type", getattr(cfg, "TRANSLATE_COMPUTE_TYPE", "default")))
+    translate_merge_sentences = bool(_conf_value(opts, "translate_merge_sentences", getattr(cfg, "TRANSLATE_MERGE_SENTENCES", False)))
+    translate_stream = bool(_conf_value(opts, "translate_stream", getattr(cfg, "TRANSLATE_STREAM", True)))
+    translation_memory = bool(_conf_value(opts, "translation_memory", getattr(cfg, "TRANSLATION_MEMORY", True)))
+    translation_memory_max_mb = int(_conf_value(opts, "translation_memory_max_mb", getattr(cfg, "TRANSLATION_MEMORY_MAX_MB", 64)))
+
     # ↓↓↓ nouveaux (dirs)
     input_dir = str(_conf_value(opts, "input_dir", getattr(cfg, "INPUT_DIR", "input")))
     output_dir = str(_conf_value(opts, "output_dir", getattr(cfg, "OUTPUT_DIR", "output")))
@@ -98,6 +155,28 @@ def effective_values(root: str | None = None) -> Dict[str, Any]:
         "translate_to": translate_to,
         "translate_from": translate_from,
         "language": language,
+        "tts_cache": tts_cache,
+        "tts_cache_max_mb": tts_cache_max_mb,
+        "tts_handoff": tts_handoff,
+        "edge_async": edge_async,
+        "edge_concurrency": edge_concurrency,
+        "edge_timeout_s": edge_timeout_s,
+        "stretch_backend": stretch_backend,
+        "ducking_mode": ducking_mode,
+        "orig_audio_passthrough": orig_audio_passthrough,
+        "orig_audio_copy": orig_audio_copy,
+        "tts_workers": tts_workers,
+        "batch_jobs": batch_jobs,
+        "ffmpeg_jobs": ffmpeg_jobs,
+        "tts_jobs": tts_jobs,
+        "tts_job_timeout_s": tts_job_timeout_s,
+        "tts_max_retries": tts_max_retries,
+        "redub_manifest": redub_manifest,
+        "translate_compute_type": translate_compute_type,
+        "translate_merge_sentences": translate_merge_sentences,
+        "translate_stream": translate_stream,
+        "translation_memory": translation_memory,
+        "translation_memory_max_mb": translation_memory_max_mb,
     }
 
 
@@ -160,4 +239,26 @@ def build_default_opts() -> DubOptions:
         translate_from=translate_from,
         reuse_translated_subs=reuse_translated_subs,
         ask_reuse_subs=ask_reuse_subs,
+        tts_cache=bool(_conf_value(opts, "tts_cache", getattr(cfg, "TTS_CACHE", True))),
+        tts_cache_max_mb=int(_conf_value(opts, "tts_cache_max_mb", getattr(cfg, "TTS_CACHE_MAX_MB", 2048))),
+        tts_handoff=_normalized_handoff(_conf_value(opts, "tts_handoff", getattr(cfg, "TTS_HANDOFF", "pcm"))),
+        edge_async=bool(_conf_value(opts, "edge_async", getattr(cfg, "EDGE_ASYNC", True))),
+        edge_concurrency=int(_conf_value(opts, "edge_concurrency", getattr(cfg, "EDGE_CONCURRENCY", 32))),
+        edge_timeout_s=float(_conf_value(opts, "edge_timeout_s", getattr(cfg, "EDGE_TIMEOUT_S", 30.0))),
+        stretch_backend=_normalized_stretch_backend(_conf_value(opts, "stretch_backend", getattr(cfg, "STRETCH_BACKEND", "wsola"))),
+        ducking_mode=_normalized_ducking_mode(_conf_value(opts, "ducking_mode", getattr(cfg, "DUCKING_MODE", "stream"))),
+        orig_audio_passthrough=bool(_conf_value(opts, "orig_audio_passthrough", getattr(cfg, "ORIG_AUDIO_PASSTHROUGH", True))),
+        orig_audio_copy=bool(_conf_value(opts, "orig_audio_copy", getattr(cfg, "ORIG_AUDIO_COPY", False))),
+        tts_workers=int(_conf_value(opts, "tts_workers", getattr(cfg, "TTS_WORKERS", 0))),
+        batch_jobs=int(_conf_value(opts, "batch_jobs", getattr(cfg, "BATCH_JOBS", 1))),
+        ffmpeg_jobs=int(_conf_value(opts, "ffmpeg_jobs", getattr(cfg, "FFMPEG_JOBS", 2))),
+        tts_jobs=int(_conf_value(opts, "tts_jobs", getattr(cfg, "TTS_JOBS", 1))),
+        tts_job_timeout_s=float(_conf_value(opts, "tts_job_timeout_s", getattr(cfg, "TTS_JOB_TIMEOUT_S", 60.0))),
+        tts_max_retries=int(_conf_value(opts, "tts_max_retries", getattr(cfg, "TTS_MAX_RETRIES", 2))),
+        redub_manifest=bool(_conf_value(opts, "redub_manifest", getattr(cfg, "REDUB_MANIFEST", True))),
+        translate_compute_type=_normalized_compute_type(_conf_value(opts, "translate_compute_type", getattr(cfg, "TRANSLATE_COMPUTE_TYPE", "default"))),
+        translate_merge_sentences=bool(_conf_value(opts, "translate_merge_sentences", getattr(cfg, "TRANSLATE_MERGE_SENTENCES", False))),
+        translate_stream=bool(_conf_value(opts, "translate_stream", getattr(cfg, "TRANSLATE_STREAM", True))),
+        translation_memory=bool(_conf_value(opts, "translation_memory", getattr(cfg, "TRANSLATION_MEMORY", True))),
+        translation_memory_max_mb=int(_conf_value(opts, "translation_memory_max_mb", getattr(cfg, "TRANSLATION_MEMORY_MAX_MB", 64))),
     )
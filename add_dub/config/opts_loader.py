@@ -66,6 +66,24 @@ KNOWN_KEYS = {
     "audio_codec", "audio_bitrate", "orig_audio_lang",
     "ask_test_before_cleanup",
     "translate", "translate_to", "translate_from", "reuse_translated_subs",
+    "tts_cache", "tts_cache_max_mb", "tts_handoff",
+    "edge_async", "edge_concurrency", "edge_timeout_s",
+    "stretch_backend",
+    "ducking_mode",
+    "orig_audio_passthrough",
+    "orig_audio_copy",
+    "tts_workers",
+    "batch_jobs",
+    "ffmpeg_jobs",
+    "tts_jobs",
+    "tts_job_timeout_s",
+    "tts_max_retries",
+    "redub_manifest",
+    "translate_compute_type",
+    "translate_merge_sentences",
+    "translate_stream",
+    "translation_memory",
+    "translation_memory_max_mb",
     "logging.console_enable", "logging.console_level",
     "logging.file_enable", "logging.file_level",
     "logging.file_name", "logging.dir",
@@ -0,0 +1,240 @@
+# add_dub/core/audio_utils.py
+"""
+Outils audio partagés par les moteurs TTS (tts_edge, tts_gtts).
+
+Changement de vitesse sans changement de hauteur :
+  - "wsola"  : WSOLA en NumPy, directement sur le PCM (aucun sous-processus) ;
+  - "ffmpeg" : chaîne de filtres atempo (fichier temporaire + sous-processus ffmpeg).
+speed_change() choisit le backend et retombe sur ffmpeg si WSOLA échoue.
+"""
+from __future__ import annotations
+
+import os
+import wave
+import shutil
+import tempfile
+import subprocess
+
+import numpy as np
+from pydub import AudioSegment
+
+import add_dub.io.fs as io_fs
+
+STRETCH_BACKENDS = ("wsola", "ffmpeg")
+
+# Paramètres WSOLA : trame d'analyse, recouvrement 50 %, tolérance de recherche
+WSOLA_FRAME_MS = 30
+WSOLA_TOLERANCE_MS = 8
+
+
+def atempo_chain_for_factor(factor: float) -> list[str]:
+    """
+    Construit une chaîne de filtres atempo pour couvrir un facteur arbitraire > 0
+    en respectant la plage acceptée par ffmpeg (0.5..2.0 par maillon).
+    """
+    if factor <= 0:
+        return []
+    filters: list[str] = []
+    remaining = factor
+    while remaining < 0.5:
+        filters.append("atempo=0.5")
+        remaining /= 0.5
+    while remaining > 2.0:
+        filters.append("atempo=2.0")
+        remaining /= 2.0
+    if abs(remaining - 1.0) > 1e-6:
+        filters.append(f"atempo={remaining:.6f}")
+    return filters
+
+
+def speed_change_with_ffmpeg(segment: AudioSegment, factor: float) -> AudioSegment:
+    """
+    Change la vitesse (ralentit/accélère) sans changer la hauteur via ffmpeg (filter atempo).
+    factor > 1.0 => plus rapide ; 0 < factor < 1.0 => plus lent.
+    Si factor ~ 1.0, renvoie segment tel quel.
+    """
+    if factor <= 0:
+        return segment
+    if abs(factor - 1.0) <= 1e-6:
+        return segment
+    if shutil.which("ffmpeg") is None:
+        raise RuntimeError("ffmpeg introuvable")
+
+    filters = atempo_chain_for_factor(factor)
+    if not filters:
+        return segment
+    filt = ",".join(filters)
+
+    with tempfile.TemporaryDirectory(dir=io_fs.TMP_DIR) as td:
+        inp = os.path.join(td, "in.wav")
+        out = os.path.join(td, "out.wav")
+        segment.export(inp, format="wav")
+        cmd = [
+            "ffmpeg", "-y", "-hide_banner", "-loglevel", "error",
+            "-i", inp,
+            "-filter:a", filt,
+            "-vn",
+            out
+        ]
+        subprocess.run(cmd, check=True)
+        return AudioSegment.from_file(out)
+
+
+def time_stretch_wsola(samples: np.ndarray, factor: float, sr: int) -> np.ndarray:
+    """
+    WSOLA (Waveform Similarity Overlap-Add) sur un tableau float (n, canaux).
+    factor > 1.0 => plus court (plus rapide). Renvoie round(n / factor) échantillons.
+
+    Chaque trame de sortie (fenêtre de Hann, saut = trame/2) est prise dans l'entrée
+    autour de la position nominale k * saut * factor, décalée de ±tolérance pour
+    maximiser la corrélation avec la continuation naturelle de la trame précédente.
+    """
+    n = samples.shape[0]
+    out_len = int(round(n / factor))
+    if n == 0 or out_len <= 0:
+        return np.zeros((max(0, out_len), samples.shape[1]), dtype=np.float32)
+
+    frame = max(32, int(sr * WSOLA_FRAME_MS / 1000) // 2 * 2)
+    hop_out = frame // 2
+    hop_in = hop_out * factor
+    tol = max(1, int(sr * WSOLA_TOLERANCE_MS / 1000))
+
+    if n < frame:
+        # Trop court pour une analyse par trames : rééchantillonnage temporel direct.
+        idx = np.minimum((np.arange(out_len) * factor).astype(np.int64), n - 1)
+        return samples[idx].astype(np.float32)
+
+    # Marges : recherche à gauche (tol) et lecture au-delà de la fin (trame + tol).
+    pad_tail = int(np.ceil(hop_in)) + 2 * frame + 2 * tol
+    xp = np.pad(samples.astype(np.float32), ((tol, pad_tail), (0, 0)))
+    mono = xp.mean(axis=1)
+    win = np.hanning(frame).astype(np.float32)
+
+    n_frames = out_len // hop_out + 1
+    y = np.zeros((n_frames * hop_out + frame, samples.shape[1]), dtype=np.float32)
+    wsum = np.zeros(y.shape[0], dtype=np.float32)
+    win2 = win[:, None]
+
+    delta = 0
+    for k in range(n_frames):
+        start = int(round(k * hop_in)) + tol + delta
+        o = k * hop_out
+        y[o:o + frame] += xp[start:start + frame] * win2
+        wsum[o:o + frame] += win
+
+        # Continuation naturelle de la trame retenue, comparée à la zone de recherche suivante.
+        nat = mono[start + hop_out:start + hop_out + frame]
+        nxt = int(round((k + 1) * hop_in)) + tol
+        if nxt + tol + frame > mono.shape[0] or nat.shape[0] < frame:
+            delta = 0
+            continue
+        region = mono[nxt - tol:nxt + tol + frame]
+        corr = np.correlate(region, nat, mode="valid")
+        delta = int(np.argmax(corr)) - tol
+
+    nz = wsum > 1e-3
+    y[nz] /= wsum[nz][:, None]
+    return y[:out_len]
+
+
+def _segment_to_float(segment: AudioSegment) -> np.ndarray:
+    if segment.sample_width != 2:
+        segment = segment.set_sample_width(2)
+    arr = np.frombuffer(segment.raw_data, dtype=np.int16)
+    return arr.reshape(-1, segment.channels).astype(np.float32)
+
+
+def speed_change_wsola(segment: AudioSegment, factor: float) -> AudioSegment:
+    """
+    Équivalent en mémoire de speed_change_with_ffmpeg (sortie 16 bits).
+    """
+    if factor <= 0 or abs(factor - 1.0) <= 1e-6:
+        return segment
+    x = _segment_to_float(segment)
+    y = time_stretch_wsola(x, factor, segment.frame_rate)
+    pcm = np.clip(np.rint(y), -32768, 32767).astype(np.int16)
+    return AudioSegment(
+        data=pcm.tobytes(),
+        sample_width=2,
+        frame_rate=segment.frame_rate,
+        channels=segment.channels,
+    )
+
+
+def speed_change(segment: AudioSegment, factor: float, backend: str = "wsola") -> AudioSegment:
+    """
+    Changement de vitesse avec le backend demandé ("wsola" par défaut, "ffmpeg").
+    En cas d'échec de WSOLA, on retombe sur ffmpeg.
+    """
+    if factor <= 0 or abs(factor - 1.0) <= 1e-6:
+        return segment
+    if str(backend or "wsola").lower() == "ffmpeg":
+        return speed_change_with_ffmpeg(segment, factor)
+    try:
+        return speed_change_wsola(segment, factor)
+    except Exception:
+        return speed_change_with_ffmpeg(segment, factor)
+
+
+def combined_rate(raw_ms: int, target_ms: int, min_rate: float, max_rate: float) -> float:
+    """
+    Facteur de vitesse unique appliqué à la synthèse brute :
+    max(min_rate, durée brute / durée cible), plafonné à max_rate
+    (le plafond ne descend jamais sous min_rate).
+    """
+    try:
+        min_rate = float(min_rate or 1.0)
+    except Exception:
+        min_rate = 1.0
+    if min_rate <= 0:
+        min_rate = 1.0
+    try:
+        max_rate = float(max_rate or 1.8)
+    except Exception:
+        max_rate = 1.8
+    cap = max(max_rate, min_rate, 1.0)
+
+    factor = min_rate
+    if target_ms > 0 and raw_ms > 0:
+        factor = max(factor, raw_ms / float(target_ms))
+    return min(factor, cap)
+
+
+def fit_to_target(segment: AudioSegment, target_duration_ms: int, opts) -> AudioSegment:
+    """
+    Ajuste une synthèse brute à la durée cible en un seul changement de vitesse
+    (facteur = combined_rate), puis trim ou padding silence à la durée exacte.
+    """
+    tgt = max(0, int(target_duration_ms))
+    factor = combined_rate(
+        len(segment), tgt,
+        getattr(opts, "min_rate_tts", 1.0),
+        getattr(opts, "max_rate_tts", 1.8),
+    )
+
+    try:
+        segment = speed_change(segment, factor, getattr(opts, "stretch_backend", "wsola"))
+    except Exception:
+        # Échec du changement de vitesse → on garde la synthèse brute (trim ci-dessous)
+        pass
+
+    if tgt <= 0:
+        return segment
+    cur = len(segment)
+    if cur > tgt:
+        return segment[:tgt]
+    if cur < tgt:
+        return segment + AudioSegment.silent(duration=(tgt - cur), frame_rate=segment.frame_rate)
+    return segment
+
+
+def wav_duration_ms(path: str) -> int:
+    """
+    Durée d'un WAV lue dans l'en-tête (sans charger les échantillons) ;
+    retombe sur pydub si le module wave ne sait pas lire le fichier.
+    """
+    try:
+        with wave.open(path, "rb") as w:
+            return int(w.getnframes() * 1000 / max(1, w.getframerate()))
+    except (wave.Error, EOFError):
+        return len(AudioSegment.from_file(path))
@@ -0,0 +1,126 @@
+# add_dub/core/checkpoint.py
+"""
+Points de reprise par vidéo (tmp/<base>.<hash>.state.json, cf. tmp_stem).
+
+Chaque étape coûteuse du pipeline (SRT résolu/nettoyé, traduction, extraction audio,
+TTS, ducking) enregistre, une fois terminée, l'empreinte de ses entrées et ses fichiers
+de sortie. En reprise (opts.resume), une étape dont l'empreinte est identique et dont
+les sorties existent encore est sautée.
+
+Empreintes :
+  - vidéos / WAV : chemin absolu + taille + date de modification ;
+  - SRT : contenu (un nettoyage en place qui ne change rien ne casse pas la reprise).
+Le fichier d'état est supprimé par le nettoyage final (vidéo terminée).
+"""
+from __future__ import annotations
+
+import os
+import json
+import uuid
+import hashlib
+from typing import Any, Dict, Iterable, Optional
+
+
+def file_sig(path: Optional[str]) -> str:
+    """
+    Signature rapide d'un fichier (taille + mtime), sans le lire.
+    """
+    if not path:
+        return "-"
+    try:
+        st = os.stat(path)
+    except OSError:
+        return f"{path}|missing"
+    return f"{os.path.abspath(path)}|{st.st_size}|{st.st_mtime_ns}"
+
+
+def content_sig(path: Optional[str]) -> str:
+    """
+    Signature d'un petit fichier texte par son contenu.
+    """
+    if not path:
+        return "-"
+    try:
+        with open(path, "rb") as f:
+            return hashlib.sha1(f.read()).hexdigest()
+    except OSError:
+        return f"{path}|missing"
+
+
+def tmp_stem(video_path: str) -> str:
+    """
+    Radical des fichiers temporaires d'une vidéo : <base>.<hash court du chemin absolu>.
+    Deux vidéos homonymes (S01/E01.mkv, S02/E01.mkv) traitées en parallèle ne partagent
+    ainsi ni WAV ni fichier d'état.
+    """
+    base = os.path.splitext(os.path.basename(video_path))[0]
+    key = os.path.normcase(os.path.abspath(video_path))
+    return f"{base}.{hashlib.sha1(key.encode('utf-8')).hexdigest()[:8]}"
+
+
+def fingerprint(*parts: Any) -> str:
+    raw = "\x1f".join(repr(p) for p in parts)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+class Checkpoints:
+    """
+    État de reprise d'une vidéo. resume=False : on enregistre sans jamais sauter d'étape.
+    """
+
+    def __init__(self, path: str, resume: bool = False):
+        self.path = path
+        self.resume = resume
+        self.stages: Dict[str, dict] = {}
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                self.stages = dict(json.load(f).get("stages") or {})
+        except Exception:
+            self.stages = {}
+
+    def lookup(self, stage: str, fp: str) -> Optional[dict]:
+        """
+        Données de l'étape si elle peut être sautée (reprise active, mêmes entrées,
+        sorties présentes), sinon None.
+        """
+        if not self.resume:
+            return None
+        entry = self.stages.get(stage)
+        if not entry or entry.get("fp") != fp:
+            return None
+        for out in entry.get("outputs") or []:
+            if not os.path.exists(out) or os.path.getsize(out) == 0:
+                return None
+        return dict(entry.get("data") or {})
+
+    def record(self, stage: str, fp: str, outputs: Iterable[str] = (), data: Optional[dict] = None) -> None:
+        """
+        Enregistre durablement la fin d'une étape (écriture atomique, jamais bloquante).
+        """
+        self.stages[stage] = {
+            "fp": fp,
+            "outputs": [o for o in outputs if o],
+            "data": data or {},
+        }
+        tmp = f"{self.path}.{uuid.uuid4().hex}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"version": 1, "stages": self.stages}, f, ensure_ascii=False, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.path)
+        except Exception:
+            try:
+                if os.path.exists(tmp):
+                    os.remove(tmp)
+            except Exception:
+                pass
+
+    def clear(self) -> None:
+        self.stages = {}
+        try:
+            if os.path.exists(self.path):
+                os.remove(self.path)
+        except Exception:
+            pass
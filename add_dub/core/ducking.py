@@ -1,9 +1,13 @@
 # add_dub/core/ducking.py
 import os
+import wave
 from pydub import AudioSegment
 from concurrent.futures import ThreadPoolExecutor
 from add_dub.logger import (log_call, log_time)
 
+# Mode "stream" : nombre de frames lues/écrites par bloc (~5 s à 48 kHz)
+STREAM_BLOCK_FRAMES = 1 << 18
+
 try:
     import numpy as np  # optionnel : si indisponible, on bascule en mode pydub pur
 except Exception:
@@ -107,6 +111,131 @@ def _merge_close_intervals(subtitles, offset_ms, fade_ms, min_gap_ms=200):
     merged.append((cs, ce))
     return merged
 
+def build_ffmpeg_volume_expr(subtitles, reduction_db=-5.0, fade_duration=100, offset_ms=0, total_ms=None):
+    """
+    Compile les intervalles fusionnés en expression ffmpeg pour volume=...:eval=frame
+    (même enveloppe que les modes "stream"/"memory" : rampes linéaires, plateau à 'gain').
+    Arbre binaire de if() sur t : O(log n) comparaisons par trame audio.
+    Retourne None s'il n'y a aucun intervalle à atténuer.
+    """
+    reduction_db = -abs(reduction_db)
+    gain = 10.0 ** (reduction_db / 20.0)
+    fused = _merge_close_intervals(sorted(subtitles, key=lambda x: x[0]), offset_ms, fade_duration)
+    if total_ms is not None:
+        fused = [(s, min(e, int(total_ms))) for s, e in fused if s < int(total_ms)]
+    if not fused:
+        return None
+
+    f = max(0, int(fade_duration)) / 1000.0
+    spans = [(s / 1000.0, e / 1000.0) for s, e in fused]
+
+    def _span(s, e):
+        if f > 0 and (e - s) > 2 * f:
+            return (
+                f"if(lt(t,{s + f:.3f}),1-{1.0 - gain:.6f}*(t-{s:.3f})/{f:.3f},"
+                f"if(lt(t,{e - f:.3f}),{gain:.6f},{gain:.6f}+{1.0 - gain:.6f}*(t-{e - f:.3f})/{f:.3f}))"
+            )
+        return f"{gain:.6f}"
+
+    def _node(lo, hi):
+        if lo >= hi:
+            return "1"
+        mid = (lo + hi) // 2
+        s, e = spans[mid]
+        return f"if(lt(t,{s:.3f}),{_node(lo, mid)},if(lt(t,{e:.3f}),{_span(s, e)},{_node(mid + 1, hi)}))"
+
+    return _node(0, len(spans))
+
+
+def _block_envelope(i0, i1, spans, k, gain, fade_frames):
+    """
+    Enveloppe de gain des frames [i0, i1) (même forme que le mode mémoire :
+    rampes linéaires aux bords des intervalles, minimum en cas de recouvrement).
+    spans : intervalles (s, e) en frames, triés ; k : premier intervalle pouvant toucher le bloc.
+    Retourne (enveloppe, nouvel indice k).
+    """
+    env = np.ones(i1 - i0, dtype=np.float32)
+    while k < len(spans) and spans[k][1] <= i0:
+        k += 1
+
+    denom = float(max(1, fade_frames - 1))
+    j = k
+    while j < len(spans) and spans[j][0] < i1:
+        s, e = spans[j]
+        j += 1
+        a, b = max(s, i0), min(e, i1)
+        if b <= a:
+            continue
+        if fade_frames > 0 and (e - s) > 2 * fade_frames:
+            idx = np.arange(a, b, dtype=np.int64)
+            part = np.full(b - a, gain, dtype=np.float32)
+            down = idx < s + fade_frames
+            part[down] = 1.0 + (gain - 1.0) * (idx[down] - s) / denom
+            up = idx >= e - fade_frames
+            part[up] = gain + (1.0 - gain) * (idx[up] - (e - fade_frames)) / denom
+        else:
+            part = gain
+        env[a - i0:b - i0] = np.minimum(env[a - i0:b - i0], part)
+    return env, k
+
+
+def _lower_audio_streaming(audio_file, fused, output_wav, gain, fade_duration):
+    """
+    Ducking par blocs : lecture WAV bloc par bloc, enveloppe calculée pour le bloc,
+    écriture incrémentale. Mémoire constante quelle que soit la durée du film.
+    Lève wave.Error / ValueError si le WAV n'est pas un PCM entier 8/16/32 bits.
+    """
+    with wave.open(audio_file, "rb") as src:
+        ch = src.getnchannels()
+        sw = src.getsampwidth()
+        fr = src.getframerate()
+        if sw == 1:
+            dtype, lo, hi, bias = np.uint8, 0, 255, 128.0
+        elif sw == 2:
+            dtype, lo, hi, bias = np.int16, -32768, 32767, 0.0
+        elif sw == 4:
+            dtype, lo, hi, bias = np.int32, -2147483648, 2147483647, 0.0
+        else:
+            raise ValueError("sample_width non géré")
+
+        fade_frames = max(0, int(round(fade_duration * fr / 1000.0)))
+        # Intervalles bornés à la piste (rampe de remontée avant la fin, comme en mode mémoire)
+        n_frames = src.getnframes()
+        spans = []
+        for s_ms, e_ms in fused:
+            s = max(0, min(n_frames, int(round(s_ms * fr / 1000.0))))
+            e = max(0, min(n_frames, int(round(e_ms * fr / 1000.0))))
+            if e > s:
+                spans.append((s, e))
+
+        with wave.open(output_wav, "wb") as dst:
+            dst.setnchannels(ch)
+            dst.setsampwidth(sw)
+            dst.setframerate(fr)
+
+            i0 = 0
+            k = 0
+            while True:
+                raw = src.readframes(STREAM_BLOCK_FRAMES)
+                if not raw:
+                    break
+                block = np.frombuffer(raw, dtype=dtype).reshape(-1, ch)
+                i1 = i0 + block.shape[0]
+                env, k = _block_envelope(i0, i1, spans, k, gain, fade_frames)
+                if np.all(env == 1.0):
+                    dst.writeframes(raw)
+                else:
+                    x = block.astype(np.float32)
+                    if bias:
+                        x -= bias
+                    x *= env[:, None]
+                    if bias:
+                        x += bias
+                    dst.writeframes(np.clip(np.rint(x), lo, hi).astype(dtype).tobytes())
+                i0 = i1
+    return output_wav
+
+
 @log_time
 @log_call(exclude="subtitles")
 def lower_audio_during_subtitles(
@@ -116,22 +245,38 @@ def lower_audio_during_subtitles(
     reduction_db=-5.0,
     fade_duration=100,
     offset_ms=0,
+    mode="stream",
 ):
     """
     Abaisse le niveau du BG pendant les sous-titres :
       - Hors dialogues : volume inchangé.
       - Pendant dialogues : réduction de 'reduction_db' (négatif) avec fondus d'entrée/sortie.
 
-    Deux chemins :
+    Trois chemins :
+      - mode "stream" (NumPy) : WAV traité par blocs, mémoire constante ;
+      - mode "memory" (NumPy) : enveloppe temporelle sur toute la piste chargée ;
       - Sans NumPy : montage segment-par-segment via pydub (plus lent).
-      - Avec NumPy : enveloppe temporelle (plus rapide, garde le niveau global inchangé).
+    Le mode "stream" retombe sur "memory" si le WAV n'est pas lisible par le module wave.
     """
-    audio = AudioSegment.from_file(audio_file)
     subtitles = sorted(list(subtitles), key=lambda x: x[0])
 
     # Toujours interpréter la réduction comme une atténuation (valeur négative)
     reduction_db = -abs(reduction_db)
 
+    if np is not None and str(mode or "stream").lower() == "stream":
+        try:
+            return _lower_audio_streaming(
+                audio_file,
+                _merge_close_intervals(subtitles, offset_ms, fade_duration),
+                output_wav,
+                10.0 ** (reduction_db / 20.0),
+                fade_duration,
+            )
+        except (wave.Error, ValueError, EOFError):
+            pass
+
+    audio = AudioSegment.from_file(audio_file)
+
     env = _pcm_to_numpy(audio)
     if env[0] is None:
         # Chemin SANS NumPy : on reconstruit audio en remplaçant uniquement les zones dialoguées
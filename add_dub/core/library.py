@@ -0,0 +1,184 @@
+# add_dub/core/library.py
+"""
+Scan concurrent de la bibliothèque d'entrée.
+
+Parcours des dossiers par os.scandir (un seul listing par dossier : les SRT sidecar
+et srt/<base>.srt sont trouvés par nom, sans os.path.exists par vidéo), puis sondes
+mkvmerge/ffprobe dans un pool de threads borné (cfg.SCAN_WORKERS). Les entrées sont
+produites au fil de l'eau (iter_scan) ; les sondes passent par le cache probe_cache,
+un rescan ne relance donc que les fichiers nouveaux ou modifiés.
+"""
+from __future__ import annotations
+
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+import add_dub.io.fs as io_fs
+from add_dub.adapters import probe_cache
+from add_dub.adapters.ffmpeg import get_track_info
+from add_dub.adapters.mkvtoolnix import mkv_has_subtitle_track
+from add_dub.config import cfg
+
+VIDEO_EXTS = (".mkv", ".mp4", ".avi", ".mov")
+# Formats proposés par list_input_videos (MKV : ST intégrés possibles)
+LISTED_EXTS = (".mkv", ".mp4", ".avi")
+
+
+@dataclass
+class VideoEntry:
+    path: str
+    rel_dir: str = ""
+    sidecar_srt: Optional[str] = None
+    srt_dir_srt: Optional[str] = None
+    has_mkv_subs: bool = False
+    audio_tracks: List[Dict] = field(default_factory=list)
+
+    @property
+    def name(self) -> str:
+        return os.path.basename(self.path)
+
+    @property
+    def eligible(self) -> bool:
+        """
+        Au moins une source de sous-titres : srt/<base>.srt, SRT sidecar ou piste MKV.
+        """
+        return bool(self.srt_dir_srt or self.sidecar_srt or self.has_mkv_subs)
+
+
+def scan_workers() -> int:
+    return max(1, int(getattr(cfg, "SCAN_WORKERS", 8) or 1))
+
+
+# Noms de fichiers comparés via os.path.normcase (insensible à la casse sous Windows,
+# comme l'était os.path.exists)
+def _list_names(dir_path: str) -> Set[str]:
+    try:
+        with os.scandir(dir_path) as it:
+            return {os.path.normcase(e.name) for e in it}
+    except OSError:
+        return set()
+
+
+def _has_name(names: Set[str], name: str) -> bool:
+    return os.path.normcase(name) in names
+
+
+def walk_videos(
+    root: str,
+    recursive: bool = False,
+    exts: Tuple[str, ...] = VIDEO_EXTS,
+    rel_base: Optional[str] = None,
+) -> Iterator[Tuple[str, str, Set[str]]]:
+    """
+    Produit (chemin_video, sous_dossier_relatif, noms_du_dossier) pour chaque vidéo.
+    rel_base : si fourni, sous_dossier_relatif est calculé par rapport à lui.
+    """
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        names: Set[str] = set()
+        videos: List[str] = []
+        subdirs: List[str] = []
+        try:
+            with os.scandir(current) as it:
+                for e in it:
+                    names.add(os.path.normcase(e.name))
+                    try:
+                        if e.is_file():
+                            if e.name.lower().endswith(exts):
+                                videos.append(e.path)
+                        elif recursive and e.is_dir():
+                            subdirs.append(e.path)
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
+        rel_dir = ""
+        if rel_base is not None:
+            rel = os.path.relpath(current, rel_base)
+            rel_dir = "" if rel == "." else rel
+        for v in sorted(videos):
+            yield v, rel_dir, names
+        # Ordre de parcours stable (pile : sous-dossiers empilés à l'envers)
+        stack.extend(sorted(subdirs, reverse=True))
+
+
+def video_item(path: str, rel_dir: str = "") -> Tuple[str, str, Set[str]]:
+    """
+    Élément à scanner pour un fichier désigné directement (hors parcours de dossier).
+    """
+    return path, rel_dir, _list_names(os.path.dirname(path))
+
+
+def _probe(entry: VideoEntry, probe_mkv: bool, probe_audio: bool) -> VideoEntry:
+    if probe_mkv:
+        entry.has_mkv_subs = mkv_has_subtitle_track(entry.path)
+    if probe_audio:
+        entry.audio_tracks = get_track_info(entry.path) or []
+    return entry
+
+
+def iter_scan(
+    videos: Iterable[Tuple[str, str, Set[str]]],
+    *,
+    probe_audio: bool = False,
+    workers: Optional[int] = None,
+) -> Iterator[VideoEntry]:
+    """
+    Entrées au fil des sondes terminées (ordre d'achèvement, pas d'entrée).
+    Une MKV n'est sondée par mkvmerge que si aucun SRT n'a été trouvé par nom.
+    """
+    srt_names = _list_names(io_fs.SRT_DIR)
+    with ThreadPoolExecutor(max_workers=workers or scan_workers(), thread_name_prefix="scan") as ex:
+        futures = []
+        for path, rel_dir, names in videos:
+            base = os.path.splitext(os.path.basename(path))[0]
+            entry = VideoEntry(path=path, rel_dir=rel_dir)
+            for cand in (base + ".srt", base + ".SRT"):
+                if _has_name(names, cand):
+                    entry.sidecar_srt = os.path.join(os.path.dirname(path), cand)
+                    break
+            if _has_name(srt_names, base + ".srt"):
+                entry.srt_dir_srt = io_fs.join_srt(base + ".srt")
+
+            probe_mkv = path.lower().endswith(".mkv") and not entry.eligible
+            if probe_mkv or probe_audio:
+                futures.append(ex.submit(_probe, entry, probe_mkv, probe_audio))
+            else:
+                yield entry
+        try:
+            for fut in as_completed(futures):
+                yield fut.result()
+        finally:
+            for fut in futures:
+                fut.cancel()
+            probe_cache.flush()
+
+
+def scan_videos(
+    videos: Iterable[Tuple[str, str, Set[str]]],
+    *,
+    probe_audio: bool = False,
+    workers: Optional[int] = None,
+    on_entry: Optional[Callable[[VideoEntry], None]] = None,
+) -> List[VideoEntry]:
+    """
+    Scan complet ; résultats dans l'ordre des vidéos fournies.
+    """
+    order: Dict[str, int] = {}
+
+    def _numbered():
+        for item in videos:
+            order[item[0]] = len(order)
+            yield item
+
+    entries = []
+    for entry in iter_scan(_numbered(), probe_audio=probe_audio, workers=workers):
+        if on_entry:
+            on_entry(entry)
+        entries.append(entry)
+    entries.sort(key=lambda e: order.get(e.path, 0))
+    return entries
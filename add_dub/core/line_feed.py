@@ -0,0 +1,46 @@
+# add_dub/core/line_feed.py
+"""
+File de répliques publiées au fil de l'eau.
+
+Le producteur (traduction en continu) publie (indice, texte) dès qu'une ligne est
+définitive ; le consommateur (generate_dub_audio) soumet la synthèse correspondante
+sans attendre la fin de la traduction. close() signale que plus rien ne viendra.
+"""
+from __future__ import annotations
+
+import queue
+from typing import List, Optional, Tuple
+
+
+class LineFeed:
+    def __init__(self):
+        self._q: "queue.Queue[Optional[Tuple[int, str]]]" = queue.Queue()
+        self._closed = False
+
+    def put(self, idx: int, text: str) -> None:
+        self._q.put((int(idx), text))
+
+    def close(self) -> None:
+        self._q.put(None)
+
+    def take(self, timeout: float = 0.0) -> Optional[List[Tuple[int, str]]]:
+        """
+        Répliques disponibles (attend au plus timeout secondes s'il n'y en a aucune).
+        Liste vide : rien pour l'instant ; None : flux fermé et entièrement consommé.
+        """
+        if self._closed:
+            return None
+        items: List[Tuple[int, str]] = []
+        try:
+            item = self._q.get(timeout=timeout) if timeout > 0 else self._q.get_nowait()
+            while True:
+                if item is None:
+                    self._closed = True
+                    break
+                items.append(item)
+                item = self._q.get_nowait()
+        except queue.Empty:
+            pass
+        if self._closed and not items:
+            return None
+        return items
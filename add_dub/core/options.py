@@ -36,8 +36,33 @@ class DubOptions:
     batch_mode: bool = False                          # si True, pas d'interaction utilisateur (prompts)
     overwrite: bool = False                           # si True, écrase les fichiers existants (y compris traduction)
     skip_existing: bool = False                       # si True, saute les vidéos dont la sortie existe déjà (avant TTS)
+    resume: bool = False                              # si True, saute les étapes déjà faites (points de reprise tmp/)
     reuse_translated_subs: bool = True                # si True, réutilise le SRT traduit existant
     ask_reuse_subs: bool = True                       # si True, demande confirmation pour réutiliser
 
+    # --- Performance ---
+    tts_cache: bool = True                            # cache disque des segments TTS (partagé entre exécutions)
+    tts_cache_max_mb: int = 2048                      # taille max du cache (éviction LRU)
+    tts_handoff: str = "pcm"                          # "pcm" (mémoire) ou "wav" (fichier par segment dans tmp/)
+    edge_async: bool = True                           # Edge : planificateur asyncio mono-processus
+    edge_concurrency: int = 32                        # Edge : requêtes simultanées max
+    edge_timeout_s: float = 30.0                      # Edge : timeout par réplique (s)
+    stretch_backend: str = "wsola"                    # "wsola" (NumPy, en mémoire) ou "ffmpeg" (atempo)
+    ducking_mode: str = "stream"                      # "stream" (par blocs), "memory" (piste entière) ou "ffmpeg" (dans le mux)
+    orig_audio_passthrough: bool = True               # piste originale mappée depuis la source au mux
+    orig_audio_copy: bool = False                     # copie sans réencodage de la piste originale
+    tts_workers: int = 0                              # processus TTS (0 = auto)
+    batch_jobs: int = 1                               # vidéos en parallèle (batch)
+    ffmpeg_jobs: int = 2                              # plafond ffmpeg (batch)
+    tts_jobs: int = 1                                 # vidéos en TTS (batch)
+    tts_job_timeout_s: float = 60.0                   # délai max par réplique (s)
+    tts_max_retries: int = 2                          # relances par réplique
+    redub_manifest: bool = True                       # manifeste de segments par vidéo
+    translate_compute_type: str = "default"           # type de calcul CTranslate2 ("int8", "default", ...)
+    translate_merge_sentences: bool = False           # traduire par phrases (répliques regroupées)
+    translate_stream: bool = True                     # TTS au fil de la traduction
+    translation_memory: bool = True                   # mémoire de traduction persistante
+    translation_memory_max_mb: int = 64               # taille max de la mémoire (Mo, éviction LRU)
+
 
 __all__ = ["DubOptions"]
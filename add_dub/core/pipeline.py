@@ -1,18 +1,27 @@
 # add_dub/core/pipeline.py
 import os
 import subprocess
+import threading
 import time
+from concurrent.futures import Future
 from dataclasses import dataclass, replace
-from typing import Optional
-
-from pydub import AudioSegment
+from typing import Callable, Optional, Tuple
 
 from add_dub.io.fs import join_input, join_output, join_tmp
-from add_dub.core.subtitles import parse_srt_file, strip_subtitle_tags_inplace, shift_subtitle_timestamps
-from add_dub.core.ducking import lower_audio_during_subtitles
+from add_dub.core.subtitles import (
+    SubtitleTrack,
+    parse_srt_file,
+    strip_subtitle_tags_inplace,
+    shift_subtitle_timestamps,
+)
+from add_dub.core.ducking import lower_audio_during_subtitles, build_ffmpeg_volume_expr
+from add_dub.core.audio_utils import wav_duration_ms
+from add_dub.core.checkpoint import Checkpoints, fingerprint, file_sig, content_sig, tmp_stem
+from add_dub.core.line_feed import LineFeed
 from add_dub.adapters.ffmpeg import (
     extract_audio_track,
     dub_in_one_pass,
+    probe_duration_ms,
 )
 import re
 from add_dub.core.options import DubOptions
@@ -20,13 +29,14 @@ from add_dub.core.services import Services
 from add_dub.logger import (log_call, log_time)
 from add_dub.i18n import t
 
-from add_dub.core.tts import list_available_voices
+from add_dub.core.tts_registry import list_voices_for_engine
 
-def _dub_code_from_voice(voice_id: str | None) -> str:
+def _dub_code_from_voice(voice_id: str | None, engine: str | None = None) -> str:
     if not voice_id:
         return "fr"
     try:
-        voices = list_available_voices()
+        # Catalogue mis en cache (pas de ré-énumération par vidéo)
+        voices = list_voices_for_engine(engine or "onecore")
     except Exception:
         voices = []
     lang = ""
@@ -45,9 +55,212 @@ def _dub_code_from_voice(voice_id: str | None) -> str:
     return _re.sub(r"[^a-z]", "", base_lang) or "fr"
 
 
+@dataclass
+class VideoJob:
+    """
+    État d'une vidéo entre les étapes du pipeline (préparation → TTS → ducking → mux → nettoyage).
+    Permet d'exécuter chaque étape séparément (cf. core/scheduler.py en mode batch).
+    """
+    input_video_path: str
+    input_video_name: str
+    output_dir_path: Optional[str]
+    opts: DubOptions
+    svcs: Services
+    limit_duration_sec: Optional[int]
+    test_prefix: str
+    base: str
+    # Radical des fichiers de tmp/ (unique par vidéo, cf. checkpoint.tmp_stem)
+    stem: str = ""
+    audio_idx: Optional[int] = None
+    srt_path: Optional[str] = None
+    subtitles: Optional[SubtitleTrack] = None
+    orig_wav: Optional[str] = None
+    orig_len_ms: Optional[int] = None
+    passthrough: bool = False
+    tts_wav: Optional[str] = None
+    ducked_wav: Optional[str] = None
+    bg_volume_expr: Optional[str] = None
+    final_video: Optional[str] = None
+    skipped: bool = False
+    ckpt: Optional[Checkpoints] = None
+    # Traduction en cours (translate_stream) : textes publiés sur line_feed,
+    # translation renvoie le SRT final (srt_path n'est définitif qu'après)
+    line_feed: Optional[LineFeed] = None
+    translation: Optional[Future] = None
+    translate_fp: Optional[str] = None
+
+
+def _reusable_translation(srt_path: str, opts: DubOptions, svcs: Services) -> Tuple[str, bool]:
+    """
+    Chemin du SRT traduit et s'il faut réutiliser une traduction existante
+    (question posée ici, dans le thread appelant).
+    """
+    from add_dub.io.fs import join_srt
+
+    # Check for existing translated SRT
+    base_srt = os.path.basename(srt_path)
+    # Save in srt/ folder for persistence and easy access
+    new_srt_path = join_srt(f"{base_srt}.{opts.translate_to}.srt")
+    
+    reuse_existing = False
+    if os.path.exists(new_srt_path) and not getattr(opts, "overwrite", False):
+        # Ask user if they want to reuse it (unless batch mode)
+        svcs.ui.message(t("pipeline_trans_found", path=new_srt_path))
+        
+        should_reuse = False
+        if opts.batch_mode:
+            should_reuse = True
+        elif not opts.ask_reuse_subs:
+            # Si configuré pour ne pas demander, on utilise la valeur par défaut
+            should_reuse = opts.reuse_translated_subs
+        elif svcs.ui.ask_yes_no(t("pipeline_trans_reuse"), default=opts.reuse_translated_subs):
+            should_reuse = True
+            
+        if should_reuse:
+            reuse_existing = True
+            svcs.ui.message(t("pipeline_trans_reusing"))
+    return new_srt_path, reuse_existing
+
+
+def _run_translation(
+    srt_path: str,
+    new_srt_path: str,
+    input_video_name: str,
+    opts: DubOptions,
+    svcs: Services,
+    *,
+    subs_source=None,
+    on_translated: Optional[Callable[[int, str], None]] = None,
+) -> str:
+    """
+    Traduit srt_path vers new_srt_path ; retourne le SRT à utiliser pour la suite
+    (celui d'origine en cas d'échec). subs_source : piste source déjà parsée.
+    on_translated : cf. translate_subtitles.
+    """
+    from add_dub.core.translation import translate_subtitles, write_srt_file
+    from add_dub.core.subtitles import parse_srt_file as _parse_srt_simple
+
+    try:
+        # On lit le SRT source
+        if subs_source is None:
+            subs_source = _parse_srt_simple(srt_path)
+        if subs_source:
+            # Determine source language
+            # Priority: 1. User specified (opts.translate_from)
+            #           2. Filename guess (Sub(Fre))
+            #           3. None (Auto-detect)
+            
+            source_lang = opts.translate_from
+            if source_lang and source_lang.lower() == "auto":
+                source_lang = None
+            
+            if not source_lang:
+                # 1. Guess from filename
+                lower_name = input_video_name.lower()
+                if "sub(fre)" in lower_name or "sub(fr)" in lower_name:
+                    source_lang = "fr"
+                elif "sub(eng)" in lower_name or "sub(en)" in lower_name:
+                    source_lang = "en"
+                
+                # 2. Detect from content (langdetect)
+                if not source_lang:
+                    try:
+                        from langdetect import detect
+                        # Concatenate a sample of text for better detection
+                        sample_text = " ".join([s[2] for s in subs_source[:50]])
+                        detected = detect(sample_text)
+                        if detected:
+                            source_lang = detected
+                            svcs.ui.message(f" [Auto-Detect] Language detected: {source_lang}")
+                    except Exception as e:
+                        svcs.ui.error(f" [Auto-Detect] Failed: {e}")
+            
+            # On traduit
+            # En continu, la barre de progression est celle de la TTS
+            subs_translated = translate_subtitles(
+                subs_source, opts.translate_to, source_lang=source_lang,
+                ui=None if on_translated else svcs.ui,
+                compute_type=opts.translate_compute_type,
+                merge_sentences=opts.translate_merge_sentences,
+                on_translated=on_translated,
+                memory=opts.translation_memory,
+                memory_max_mb=opts.translation_memory_max_mb,
+            )
+            
+            write_srt_file(subs_translated, new_srt_path)
+            
+            # On met à jour srt_path pour que la suite du pipeline utilise le traduit
+            srt_path = new_srt_path
+            svcs.ui.message(t("pipeline_trans_done", path=srt_path))
+        else:
+            svcs.ui.error(t("pipeline_trans_err", err="Empty source SRT"))
+    except Exception as e:
+        svcs.ui.error(t("pipeline_trans_err", err=e))
+        # On continue avec le SRT d'origine en cas d'erreur
+        pass
+    return srt_path
+
+
+def _translate_srt(srt_path: str, input_video_name: str, opts: DubOptions, svcs: Services) -> str:
+    """
+    Traduction du SRT (si demandée) ; retourne le SRT à utiliser pour la suite.
+    """
+    svcs.ui.message(t("pipeline_translating", lang=opts.translate_to))
+    new_srt_path, reuse = _reusable_translation(srt_path, opts, svcs)
+    if reuse:
+        return new_srt_path
+    return _run_translation(srt_path, new_srt_path, input_video_name, opts, svcs)
+
+
+def _stream_translation(
+    srt_path: str,
+    new_srt_path: str,
+    input_video_name: str,
+    opts: DubOptions,
+    svcs: Services,
+    source: SubtitleTrack,
+    subtitles: SubtitleTrack,
+    keep,
+    feed: LineFeed,
+) -> Future:
+    """
+    Lance la traduction dans un thread : chaque réplique traduite de source est publiée
+    sur feed (indice dans subtitles, la piste limitée en durée, via keep) pour que la
+    synthèse démarre aussitôt ; le SRT traduit est écrit à la fin, puis feed est fermé.
+    Les répliques jamais publiées (échec) le sont avec leur texte d'origine.
+    Le futur renvoie le SRT à utiliser pour la suite (cf. _run_translation).
+    """
+    fut: Future = Future()
+    slot = {int(i): k for k, i in enumerate(keep)}
+    sent: set = set()
+
+    def _emit(i: int, text: str) -> None:
+        k = slot.get(i)
+        if k is not None and k not in sent:
+            sent.add(k)
+            feed.put(k, text)
+
+    def _run() -> None:
+        try:
+            fut.set_result(_run_translation(
+                srt_path, new_srt_path, input_video_name, opts, svcs,
+                subs_source=source, on_translated=_emit,
+            ))
+        except BaseException as e:
+            fut.set_exception(e)
+        finally:
+            for k, text in enumerate(subtitles.texts):
+                if k not in sent:
+                    feed.put(k, text)
+            feed.close()
+
+    threading.Thread(target=_run, name="translate-stream", daemon=True).start()
+    return fut
+
+
 @log_time
 @log_call
-def process_one_video(
+def prepare_video(
     *,
     input_video_path: str,
     input_video_name: str,
@@ -56,10 +269,11 @@ def process_one_video(
     svcs: Services,
     limit_duration_sec: Optional[int] = None,
     test_prefix: str = "",
-) -> Optional[str]:
+) -> Optional[VideoJob]:
     """
-    Traite UNE vidéo avec les options et services fournis.
-    Retourne le chemin de la vidéo finale, ou None si annulé.
+    Étapes 1 à 7 : piste audio, sous-titres (résolution, nettoyage, décalage, traduction),
+    extraction audio et parsing SRT.
+    Retourne l'état de la vidéo (skipped=True si la sortie existe déjà), ou None si annulé.
     """
     opts = replace(opts)
 
@@ -67,11 +281,22 @@ def process_one_video(
 
     # Verification skip_existing (AVANT toute operation ou generation TTS)
     if getattr(opts, "skip_existing", False):
-        dub_code = _dub_code_from_voice(getattr(opts, 'voice_id', None))
+        dub_code = _dub_code_from_voice(getattr(opts, 'voice_id', None), opts.tts_engine)
         final_video = join_output(f"{test_prefix}{base} [dub-{dub_code}].mkv", output_dir_path)
         if os.path.exists(final_video):
             svcs.ui.message(f"[SKIP] Fichier déjà existant : {os.path.basename(final_video)}")
-            return final_video
+            return VideoJob(
+                input_video_path=input_video_path,
+                input_video_name=input_video_name,
+                output_dir_path=output_dir_path,
+                opts=opts,
+                svcs=svcs,
+                limit_duration_sec=limit_duration_sec,
+                test_prefix=test_prefix,
+                base=base,
+                final_video=final_video,
+                skipped=True,
+            )
 
     svcs.ui.message(t("pipeline_process", name=input_video_name))
 
@@ -87,208 +312,356 @@ def process_one_video(
         if sub_choice is None:
             return None
 
-    # 3) Résolution vers un SRT exploitable
-    srt_path = svcs.resolve_srt_for_video(input_video_path, sub_choice, ui=svcs.ui)
-    if not srt_path:
-        svcs.ui.error(t("pipeline_no_srt", name=input_video_name))
-        return None
+    stem = tmp_stem(input_video_path)
+    ckpt = Checkpoints(join_tmp(f"{test_prefix}{stem}.state.json"), resume=bool(opts.resume))
+
+    # Audio d'origine → **tmp/**
+    # La piste originale du MKV final peut être lue directement dans la source
+    # (hors mode test, qui limite la durée) ; le WAV ne sert alors plus qu'au ducking,
+    # et n'est pas extrait du tout si le ducking est fait par ffmpeg au mux.
+    passthrough = bool(opts.orig_audio_passthrough) and limit_duration_sec is None
+    orig_wav = None
+    if not (passthrough and opts.ducking_mode == "ffmpeg"):
+        orig_wav = join_tmp(f"{stem}_orig.wav")
+    extract_fp = fingerprint(file_sig(input_video_path), audio_idx, limit_duration_sec)
+    extract_done = False
+
+    # 3) → 4b) SRT résolu, nettoyé et décalé (étape reprenable : OCR / extraction MKV)
+    sub_src = sub_choice[1] if isinstance(sub_choice, (tuple, list)) and len(sub_choice) > 1 else None
+
+    def _srt_fp(offset_ms: int) -> str:
+        return fingerprint(
+            file_sig(input_video_path),
+            list(sub_choice) if isinstance(sub_choice, (tuple, list)) else sub_choice,
+            content_sig(sub_src) if isinstance(sub_src, str) else None,
+            offset_ms,
+        )
+
+    done = ckpt.lookup("srt", _srt_fp(opts.offset_ms))
+    if done is not None:
+        svcs.ui.message(t("pipeline_resume_skip", stage="srt"))
+        srt_path = done["srt_path"]
+        if opts.offset_ms != 0:
+            opts = replace(opts, offset_ms=0)
+    else:
+        offset_ms = opts.offset_ms
+        # 3) Résolution vers un SRT exploitable
+        # Extraction d'une piste MKV texte : le WAV d'origine sort de la même lecture
+        pending_wav = None
+        if orig_wav and ckpt.lookup("extract", extract_fp) is None:
+            pending_wav = orig_wav
+            try:
+                os.remove(pending_wav)
+            except OSError:
+                pass
+        srt_path = svcs.resolve_srt_for_video(
+            input_video_path, sub_choice, ui=svcs.ui,
+            audio_index=audio_idx, audio_wav=pending_wav, duration_sec=limit_duration_sec,
+        )
+        if pending_wav and os.path.exists(pending_wav) and os.path.getsize(pending_wav) > 0:
+            ckpt.record("extract", extract_fp, [pending_wav])
+            extract_done = True
+        if not srt_path:
+            svcs.ui.error(t("pipeline_no_srt", name=input_video_name))
+            return None
 
-    # 4) Nettoyage SRT
-    strip_subtitle_tags_inplace(srt_path)
+        # 4) Nettoyage SRT (sans effet si resolve_srt_for_video l'a déjà fait)
+        strip_subtitle_tags_inplace(srt_path)
 
-    # 4b) Décalage physique des sous-titres (si demandé)
-    if opts.offset_ms != 0:
-        svcs.ui.message(t("pipeline_offset_shift", ms=opts.offset_ms))
-        srt_path = shift_subtitle_timestamps(srt_path, opts.offset_ms)
-        # On remet l'offset à 0 pour la suite du pipeline (TTS, ducking, mux)
-        # car le fichier SRT est maintenant "physiquement" calé.
-        opts = replace(opts, offset_ms=0)
+        # 4b) Décalage physique des sous-titres (si demandé)
+        if opts.offset_ms != 0:
+            svcs.ui.message(t("pipeline_offset_shift", ms=opts.offset_ms))
+            srt_path = shift_subtitle_timestamps(srt_path, opts.offset_ms)
+            # On remet l'offset à 0 pour la suite du pipeline (TTS, ducking, mux)
+            # car le fichier SRT est maintenant "physiquement" calé.
+            opts = replace(opts, offset_ms=0)
+        # Empreinte prise après coup : un SRT sidecar est nettoyé en place
+        ckpt.record("srt", _srt_fp(offset_ms), [srt_path], {"srt_path": srt_path})
 
     # --- TRADUCTION (si demandée) ---
+    # translate_stream : la traduction tourne en arrière-plan et alimente la TTS
+    # réplique par réplique (cf. _stream_translation, tts_stage)
+    stream_from: Optional[Tuple[str, str]] = None
+    translate_fp = None
     if opts.translate and opts.translate_to:
-        from add_dub.core.translation import translate_subtitles, write_srt_file
-        from add_dub.core.subtitles import parse_srt_file as _parse_srt_simple
-        from add_dub.io.fs import join_srt
-        
-        svcs.ui.message(t("pipeline_translating", lang=opts.translate_to))
-        
-        # Check for existing translated SRT
-        base_srt = os.path.basename(srt_path)
-        # Save in srt/ folder for persistence and easy access
-        new_srt_path = join_srt(f"{base_srt}.{opts.translate_to}.srt")
-        
-        reuse_existing = False
-        if os.path.exists(new_srt_path) and not getattr(opts, "overwrite", False):
-            # Ask user if they want to reuse it (unless batch mode)
-            svcs.ui.message(t("pipeline_trans_found", path=new_srt_path))
-            
-            should_reuse = False
-            if opts.batch_mode:
-                should_reuse = True
-            elif not opts.ask_reuse_subs:
-                # Si configuré pour ne pas demander, on utilise la valeur par défaut
-                should_reuse = opts.reuse_translated_subs
-            elif svcs.ui.ask_yes_no(t("pipeline_trans_reuse"), default=opts.reuse_translated_subs):
-                should_reuse = True
-                
-            if should_reuse:
-                reuse_existing = True
-                svcs.ui.message(t("pipeline_trans_reusing"))
+        translate_fp = fingerprint(content_sig(srt_path), opts.translate_to, opts.translate_from, input_video_name)
+        done = ckpt.lookup("translate", translate_fp)
+        if done is not None:
+            svcs.ui.message(t("pipeline_resume_skip", stage="translate"))
+            srt_path = done["srt_path"]
+        elif opts.translate_stream:
+            svcs.ui.message(t("pipeline_translating", lang=opts.translate_to))
+            new_srt_path, reuse = _reusable_translation(srt_path, opts, svcs)
+            if reuse:
                 srt_path = new_srt_path
-        
-        if not reuse_existing:
-            try:
-                # On lit le SRT source
-                subs_source = _parse_srt_simple(srt_path)
-                if subs_source:
-                    # Determine source language
-                    # Priority: 1. User specified (opts.translate_from)
-                    #           2. Filename guess (Sub(Fre))
-                    #           3. None (Auto-detect)
-                    
-                    source_lang = opts.translate_from
-                    if source_lang and source_lang.lower() == "auto":
-                        source_lang = None
-                    
-                    if not source_lang:
-                        # 1. Guess from filename
-                        lower_name = input_video_name.lower()
-                        if "sub(fre)" in lower_name or "sub(fr)" in lower_name:
-                            source_lang = "fr"
-                        elif "sub(eng)" in lower_name or "sub(en)" in lower_name:
-                            source_lang = "en"
-                        
-                        # 2. Detect from content (langdetect)
-                        if not source_lang:
-                            try:
-                                from langdetect import detect
-                                # Concatenate a sample of text for better detection
-                                sample_text = " ".join([s[2] for s in subs_source[:50]])
-                                detected = detect(sample_text)
-                                if detected:
-                                    source_lang = detected
-                                    svcs.ui.message(f" [Auto-Detect] Language detected: {source_lang}")
-                            except Exception as e:
-                                svcs.ui.error(f" [Auto-Detect] Failed: {e}")
-                    
-                    # On traduit
-                    subs_translated = translate_subtitles(subs_source, opts.translate_to, source_lang=source_lang, ui=svcs.ui)
-                    
-                    write_srt_file(subs_translated, new_srt_path)
-                    
-                    # On met à jour srt_path pour que la suite du pipeline utilise le traduit
-                    srt_path = new_srt_path
-                    svcs.ui.message(t("pipeline_trans_done", path=srt_path))
-                else:
-                    svcs.ui.error(t("pipeline_trans_err", err="Empty source SRT"))
-            except Exception as e:
-                svcs.ui.error(t("pipeline_trans_err", err=e))
-                # On continue avec le SRT d'origine en cas d'erreur
-                pass
+            else:
+                stream_from = (srt_path, new_srt_path)
+        else:
+            translated = _translate_srt(srt_path, input_video_name, opts, svcs)
+            # Échec de traduction (SRT d'origine conservé) : rien à reprendre
+            if translated != srt_path:
+                ckpt.record("translate", translate_fp, [translated], {"srt_path": translated})
+            srt_path = translated
     # --------------------------------
     # --------------------------------
 
     # 5) Libellé langue d'origine
     orig_audio_lang = opts.orig_audio_lang or "Original"
 
-    # 6) Extraction audio d'origine → **tmp/**
-    orig_wav = join_tmp(f"{base}_orig.wav")
-    svcs.ui.message(t("pipeline_extract_audio"))
-    extract_audio_track(
-        input_video_path,
-        audio_idx,
-        orig_wav,
-        duration_sec=limit_duration_sec
-    )
+    # 6) Extraction audio d'origine → **tmp/** (déjà faite si l'extraction MKV l'a produite)
+    if orig_wav and not extract_done:
+        if ckpt.lookup("extract", extract_fp) is not None:
+            svcs.ui.message(t("pipeline_resume_skip", stage="extract"))
+        else:
+            svcs.ui.message(t("pipeline_extract_audio"))
+            extract_audio_track(
+                input_video_path,
+                audio_idx,
+                orig_wav,
+                duration_sec=limit_duration_sec
+            )
+            ckpt.record("extract", extract_fp, [orig_wav])
 
     # Durée cible (utile pour calages éventuels)
     try:
-        orig_len_ms = len(AudioSegment.from_file(orig_wav))
+        if orig_wav:
+            orig_len_ms = wav_duration_ms(orig_wav)
+        else:
+            orig_len_ms = probe_duration_ms(input_video_path, audio_idx)
     except Exception:
         orig_len_ms = None
 
     # 7) Parsing SRT (sert aussi au ducking)
-    subtitles = parse_srt_file(srt_path, duration_limit_sec=limit_duration_sec)
+    line_feed = translation = None
+    if stream_from is None:
+        subtitles = parse_srt_file(srt_path, duration_limit_sec=limit_duration_sec)
+    else:
+        # Minutages du SRT source (la traduction les conserve), textes à venir
+        source = parse_srt_file(srt_path)
+        subtitles = source.limited(limit_duration_sec)
+        if subtitles:
+            # Mêmes répliques que SubtitleTrack.limited
+            limit_ms = None if limit_duration_sec is None else int(limit_duration_sec) * 1000
+            keep = [i for i, st in enumerate(source.start_ms.tolist()) if limit_ms is None or st < limit_ms]
+            line_feed = LineFeed()
+            translation = _stream_translation(
+                srt_path, stream_from[1], input_video_name, opts, svcs,
+                source, subtitles, keep, line_feed,
+            )
     if not subtitles:
         svcs.ui.error(t("pipeline_no_subs_usable"))
         return None
 
-    # 8) Génération TTS alignée → **tmp/**
-    tts_wav = join_tmp(f"{test_prefix}{base}_tts.wav")
-    svcs.ui.message(t("pipeline_gen_tts"))
-    svcs.generate_dub_audio(
-        srt_file=srt_path,
-        output_wav=tts_wav,
+    return VideoJob(
+        input_video_path=input_video_path,
+        input_video_name=input_video_name,
+        output_dir_path=output_dir_path,
         opts=opts,
-        duration_limit_sec=limit_duration_sec,
-        target_total_duration_ms=orig_len_ms,
-        ui=svcs.ui,
+        svcs=svcs,
+        limit_duration_sec=limit_duration_sec,
+        test_prefix=test_prefix,
+        base=base,
+        stem=stem,
+        audio_idx=audio_idx,
+        srt_path=srt_path,
+        subtitles=subtitles,
+        orig_wav=orig_wav,
+        orig_len_ms=orig_len_ms,
+        passthrough=passthrough,
+        ckpt=ckpt,
+        line_feed=line_feed,
+        translation=translation,
+        translate_fp=translate_fp,
     )
 
-    # 9) Ducking → **tmp/**
-    ducked_wav = join_tmp(f"{test_prefix}{base}_ducked.wav")
+
+def _await_translation(job: VideoJob) -> None:
+    """
+    Attend la fin d'une traduction en continu : srt_path devient le SRT final et le
+    point de reprise « translate » est enregistré.
+    """
+    if job.translation is None:
+        return
+    fut, job.translation = job.translation, None
+    translated = fut.result()
+    # Échec de traduction (SRT d'origine conservé) : rien à reprendre
+    if translated != job.srt_path and job.ckpt:
+        job.ckpt.record("translate", job.translate_fp, [translated], {"srt_path": translated})
+    job.srt_path = translated
+
+
+def tts_stage(job: VideoJob) -> None:
+    """
+    Étape 8 : génération TTS alignée → **tmp/**
+    """
+    svcs, opts = job.svcs, job.opts
+    job.tts_wav = join_tmp(f"{job.test_prefix}{job.stem}_tts.wav")
+
+    def _fp():
+        return fingerprint(
+            content_sig(job.srt_path),
+            opts.tts_engine, opts.voice_id, opts.min_rate_tts, opts.max_rate_tts,
+            opts.offset_ms, opts.stretch_backend, job.orig_len_ms, job.limit_duration_sec,
+        )
+
+    # Traduction en continu : rien à reprendre, le SRT traduit n'existe pas encore
+    if job.translation is None and job.ckpt and job.ckpt.lookup("tts", _fp()) is not None:
+        svcs.ui.message(t("pipeline_resume_skip", stage="tts"))
+        return
+    svcs.ui.message(t("pipeline_gen_tts"))
+    try:
+        svcs.generate_dub_audio(
+            srt_file=job.srt_path,
+            output_wav=job.tts_wav,
+            opts=opts,
+            duration_limit_sec=job.limit_duration_sec,
+            target_total_duration_ms=job.orig_len_ms,
+            ui=svcs.ui,
+            executor=svcs.tts_executor,
+            manifest_key=job.input_video_path,
+            subtitles=job.subtitles,
+            line_feed=job.line_feed,
+        )
+    finally:
+        _await_translation(job)
+        job.line_feed = None
+    if job.ckpt:
+        job.ckpt.record("tts", _fp(), [job.tts_wav])
+
+
+def ducking_stage(job: VideoJob) -> None:
+    """
+    Étape 9 : ducking → **tmp/** (ou enveloppe de volume appliquée directement par ffmpeg au mux)
+    """
+    svcs, opts = job.svcs, job.opts
     svcs.ui.message(t("pipeline_ducking"))
-    lower_audio_during_subtitles(
-        audio_file=orig_wav,
-        subtitles=subtitles,
-        output_wav=ducked_wav,
-        reduction_db=opts.db_reduct,
-        offset_ms=opts.offset_ms,
+    if opts.ducking_mode == "ffmpeg":
+        job.bg_volume_expr = build_ffmpeg_volume_expr(
+            job.subtitles,
+            reduction_db=opts.db_reduct,
+            offset_ms=opts.offset_ms,
+            total_ms=job.orig_len_ms,
+        )
+    else:
+        job.ducked_wav = join_tmp(f"{job.test_prefix}{job.stem}_ducked.wav")
+        fp = fingerprint(
+            file_sig(job.orig_wav), content_sig(job.srt_path),
+            opts.db_reduct, opts.offset_ms, job.limit_duration_sec,
+        )
+        if job.ckpt and job.ckpt.lookup("ducking", fp) is not None:
+            svcs.ui.message(t("pipeline_resume_skip", stage="ducking"))
+            return
+        lower_audio_during_subtitles(
+            audio_file=job.orig_wav,
+            subtitles=job.subtitles,
+            output_wav=job.ducked_wav,
+            reduction_db=opts.db_reduct,
+            offset_ms=opts.offset_ms,
+            mode=opts.ducking_mode,
+        )
+        if job.ckpt:
+            job.ckpt.record("ducking", fp, [job.ducked_wav])
+
+
+def _mux(job: VideoJob) -> None:
+    dub_in_one_pass(
+        video_fullpath=job.input_video_path,
+        bg_wav=job.ducked_wav or job.orig_wav,
+        tts_wav=job.tts_wav,
+        original_wav=None if job.passthrough else job.orig_wav,
+        subtitle_srt_path=job.srt_path,
+        output_video_path=job.final_video,  # on écrase, -y est passé dans la commande
+        opts=job.opts,
+        bg_volume_expr=job.bg_volume_expr,
+        audio_stream_index=job.audio_idx,
     )
 
-    # 10) Sortie finale
+
+def mux_stage(job: VideoJob) -> str:
+    """
+    Étape 10 : sortie finale (mux en une passe).
+    """
     final_ext = ".mkv"  # conteneur cible
 
-    dub_code = _dub_code_from_voice(getattr(opts, 'voice_id', None))
-    final_video = join_output(f"{test_prefix}{base} [dub-{dub_code}]{final_ext}", output_dir_path)
+    dub_code = _dub_code_from_voice(getattr(job.opts, 'voice_id', None), job.opts.tts_engine)
+    job.final_video = join_output(f"{job.test_prefix}{job.base} [dub-{dub_code}]{final_ext}", job.output_dir_path)
 
-    svcs.ui.message(t("pipeline_mux"))
-    dub_in_one_pass(
-        video_fullpath=input_video_path,
-        bg_wav=ducked_wav,
-        tts_wav=tts_wav,
-        original_wav=orig_wav,
-        subtitle_srt_path=srt_path,
-        output_video_path=final_video,
+    job.svcs.ui.message(t("pipeline_mux"))
+    _mux(job)
+    return job.final_video
+
+
+def cleanup_stage(job: VideoJob) -> None:
+    """
+    Étape 12 : nettoyage des **tmp/** (et du point de reprise : la vidéo est terminée)
+    """
+    if job.ckpt:
+        job.ckpt.clear()
+    for f in (job.orig_wav, job.tts_wav, job.ducked_wav):
+        try:
+            if f and os.path.exists(f):
+                os.remove(f)
+        except Exception:
+            pass
+
+
+@log_time
+@log_call
+def process_one_video(
+    *,
+    input_video_path: str,
+    input_video_name: str,
+    output_dir_path: Optional[str] = None,
+    opts: DubOptions,
+    svcs: Services,
+    limit_duration_sec: Optional[int] = None,
+    test_prefix: str = "",
+) -> Optional[str]:
+    """
+    Traite UNE vidéo avec les options et services fournis.
+    Retourne le chemin de la vidéo finale, ou None si annulé.
+    """
+    job = prepare_video(
+        input_video_path=input_video_path,
+        input_video_name=input_video_name,
+        output_dir_path=output_dir_path,
         opts=opts,
+        svcs=svcs,
+        limit_duration_sec=limit_duration_sec,
+        test_prefix=test_prefix,
     )
+    if job is None:
+        return None
+    if job.skipped:
+        return job.final_video
+
+    tts_stage(job)
+    ducking_stage(job)
+    mux_stage(job)
 
     # 11) (NOUVEAU) Option de test AVANT nettoyage + re-mux rapide si besoin
-    if getattr(opts, "ask_test_before_cleanup", False):
+    if getattr(job.opts, "ask_test_before_cleanup", False):
         svcs.ui.message(t("pipeline_test_header"))
-        svcs.ui.message(t("pipeline_test_file", path=final_video))
+        svcs.ui.message(t("pipeline_test_file", path=job.final_video))
         svcs.ui.message(t("pipeline_test_check"))
         while True:
             if not svcs.ui.ask_yes_no(t("pipeline_test_ask"), default=False):
                 break
 
             # Saisie des nouveaux niveaux
-            new_bg = svcs.ui.ask_float(t("pipeline_test_ask_bg"), opts.bg_mix)
-            new_tts = svcs.ui.ask_float(t("pipeline_test_ask_tts"), opts.tts_mix)
+            new_bg = svcs.ui.ask_float(t("pipeline_test_ask_bg"), job.opts.bg_mix)
+            new_tts = svcs.ui.ask_float(t("pipeline_test_ask_tts"), job.opts.tts_mix)
 
             # Mise à jour en mémoire
-            opts = replace(opts, bg_mix=new_bg, tts_mix=new_tts)
+            job.opts = replace(job.opts, bg_mix=new_bg, tts_mix=new_tts)
 
             # Re-mux **sans** régénérer TTS/ducking (on réutilise les WAV temporaires)
             svcs.ui.message(t("pipeline_test_remux"))
-            dub_in_one_pass(
-                video_fullpath=input_video_path,
-                bg_wav=ducked_wav,
-                tts_wav=tts_wav,
-                original_wav=orig_wav,
-                subtitle_srt_path=srt_path,
-                output_video_path=final_video,  # on écrase, -y est passé dans la commande
-                opts=opts,
-            )
-            svcs.ui.message(t("pipeline_test_done", path=final_video))
+            _mux(job)
+            svcs.ui.message(t("pipeline_test_done", path=job.final_video))
             svcs.ui.message(t("pipeline_test_continue"))
 
     # 12) Nettoyage des **tmp/**
-    for f in (orig_wav, tts_wav, ducked_wav):
-        try:
-            if f and os.path.exists(f):
-                os.remove(f)
-        except Exception:
-            pass
+    cleanup_stage(job)
 
-    return final_video
+    return job.final_video
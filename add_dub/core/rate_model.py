@@ -0,0 +1,151 @@
+# add_dub/core/rate_model.py
+"""
+Modèle de débit par voix (OneCore) : caractères prononcés par seconde à vitesse 1.0.
+
+Hypothèse : durée ≈ unités / (cps * vitesse). Chaque synthèse fournit une observation
+(texte, vitesse, durée obtenue) qui affine cps par moyenne mobile exponentielle.
+Le modèle prédit la vitesse nécessaire pour tenir dans la durée cible dès la 1re tentative.
+
+Les workers (processus séparés) observent localement puis renvoient leurs observations
+(drain()) ; le parent les fusionne (merge()) et persiste le modèle (save()) dans
+~/.cache/add_dub/rate_model.json.
+"""
+from __future__ import annotations
+
+import os
+import json
+import uuid
+from typing import Dict, List, Optional, Tuple
+
+from add_dub.io.fs import join_cache
+
+MODEL_FILE = "rate_model.json"
+# Marge de sécurité sur la vitesse prédite (mieux vaut un peu court que tronqué)
+SAFETY = 1.03
+# Poids d'une nouvelle observation (moyenne mobile exponentielle)
+ALPHA = 0.2
+# Observations trop courtes : silences de début/fin dominants, non représentatives
+MIN_OBS_MS = 300
+
+Observation = Tuple[str, int, float, int, int]   # (voix, unités, vitesse, durée_ms, pid)
+
+_MODEL: Optional[Dict[str, Dict[str, float]]] = None
+_PENDING: List[Observation] = []
+
+
+def _path() -> str:
+    return join_cache(MODEL_FILE)
+
+
+def _voice_key(voice_id: Optional[str]) -> str:
+    return str(voice_id or "default").strip() or "default"
+
+
+def text_units(text: str) -> int:
+    """
+    Nombre d'unités prononcées : lettres et chiffres (la ponctuation ne « parle » pas).
+    """
+    return max(1, sum(1 for ch in str(text or "") if ch.isalnum()))
+
+
+def _load() -> Dict[str, Dict[str, float]]:
+    global _MODEL
+    if _MODEL is None:
+        try:
+            with open(_path(), "r", encoding="utf-8") as f:
+                data = json.load(f)
+            _MODEL = {str(k): dict(v) for k, v in (data.get("voices") or {}).items()}
+        except Exception:
+            _MODEL = {}
+    return _MODEL
+
+
+def _update(voice: str, units: int, rate: float, duration_ms: int, _pid: int = 0) -> None:
+    if duration_ms < MIN_OBS_MS or rate <= 0 or units <= 0:
+        return
+    cps = units * 1000.0 / (duration_ms * rate)
+    model = _load()
+    entry = model.get(voice)
+    if entry is None:
+        model[voice] = {"cps": cps, "n": 1}
+        return
+    n = int(entry.get("n", 0)) + 1
+    # Moyenne simple pour les premières observations, puis EMA
+    alpha = max(ALPHA, 1.0 / n)
+    entry["cps"] = (1.0 - alpha) * float(entry["cps"]) + alpha * cps
+    entry["n"] = n
+
+
+def predict_rate(
+    voice_id: Optional[str],
+    text: str,
+    target_ms: int,
+    min_rate: float,
+    max_rate: float,
+) -> Optional[float]:
+    """
+    Vitesse prédite (bornée à [min_rate, max_rate]) pour que la synthèse tienne
+    dans target_ms. None si la voix n'a encore jamais été observée.
+    """
+    entry = _load().get(_voice_key(voice_id))
+    if not entry or target_ms <= 0:
+        return None
+    cps = float(entry.get("cps", 0) or 0)
+    if cps <= 0:
+        return None
+    needed = text_units(text) * 1000.0 / (cps * target_ms) * SAFETY
+    return round(min(max(needed, min_rate), max_rate), 2)
+
+
+def observe(voice_id: Optional[str], text: str, rate: float, duration_ms: int) -> None:
+    """
+    Enregistre une synthèse réelle (mise à jour locale + file à renvoyer au parent).
+    """
+    obs = (_voice_key(voice_id), text_units(text), float(rate), int(duration_ms), os.getpid())
+    _update(*obs)
+    _PENDING.append(obs)
+
+
+def drain() -> List[Observation]:
+    """
+    Observations accumulées depuis le dernier appel (côté worker).
+    """
+    out = list(_PENDING)
+    _PENDING.clear()
+    return out
+
+
+def merge(observations: Optional[List[Observation]]) -> None:
+    """
+    Intègre des observations renvoyées par un worker (côté parent).
+    Les observations faites dans ce processus (fallback synchrone) y sont déjà.
+    """
+    me = os.getpid()
+    for obs in observations or []:
+        try:
+            if obs[4] == me:
+                continue
+            _update(*obs)
+        except Exception:
+            pass
+
+
+def save() -> None:
+    """
+    Persistance atomique du modèle (jamais bloquante).
+    """
+    if not _MODEL:
+        return
+    path = _path()
+    tmp = f"{path}.{uuid.uuid4().hex}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"voices": _MODEL}, f, ensure_ascii=False, indent=2)
+        os.replace(tmp, path)
+    except Exception:
+        try:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+        except Exception:
+            pass
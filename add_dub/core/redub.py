@@ -0,0 +1,174 @@
+# add_dub/core/redub.py
+"""
+Re-doublage incrémental : manifeste par vidéo des segments TTS déjà synthétisés.
+
+~/.cache/add_dub/redub/<id vidéo>/manifest.json :
+  [{"idx", "text", "start_ms", "end_ms", "key", "seg"}, ...]
+  (text = empreinte du texte, key = clé de ligne, seg = clé du segment dans tts_cache)
+
+Les segments eux-mêmes (bruts, avant placement) sont stockés dans le cache TTS
+partagé (tts_cache) : une seule copie sur disque, soumise à la même limite de taille
+(TTS_CACHE_MAX_MB, éviction LRU). Un segment évincé est simplement re-synthétisé.
+Un segment silencieux (échec réseau Edge/gTTS) n'est jamais conservé.
+
+Clé d'une ligne = empreinte (moteur, voix, texte, vitesses, backend, durée exacte) :
+une réplique corrigée ou re-minutée (durée modifiée) est re-synthétisée ; une réplique
+seulement décalée dans le temps est réutilisée telle quelle (le placement suit le nouveau SRT).
+"""
+from __future__ import annotations
+
+import os
+import json
+import uuid
+import hashlib
+from typing import Dict, Iterable, List, Optional
+
+from pydub import AudioSegment
+
+from add_dub.core import tts_cache
+from add_dub.io.fs import join_cache
+from add_dub.workers import PcmSegment
+
+MANIFEST_SUBDIR = "redub"
+MANIFEST_FILE = "manifest.json"
+MANIFEST_VERSION = 2
+
+
+def _hash(text: str) -> str:
+    return hashlib.sha1(str(text or "").encode("utf-8")).hexdigest()
+
+
+def video_id(source: str) -> str:
+    """
+    Identifiant stable d'une vidéo (chemin absolu normalisé).
+    """
+    return _hash(os.path.normcase(os.path.abspath(source)))[:20]
+
+
+def line_key(opts, text: str, duration_ms: int) -> str:
+    raw = "\x1f".join([
+        str(getattr(opts, "tts_engine", "") or ""),
+        str(getattr(opts, "voice_id", "") or ""),
+        str(text or ""),
+        f"{float(getattr(opts, 'min_rate_tts', 1.0) or 1.0):.3f}",
+        f"{float(getattr(opts, 'max_rate_tts', 1.8) or 1.8):.3f}",
+        str(getattr(opts, "stretch_backend", "") or ""),
+        str(max(0, int(duration_ms))),
+    ])
+    return _hash(raw)
+
+
+def _audio(payload) -> Optional[AudioSegment]:
+    try:
+        if isinstance(payload, PcmSegment):
+            return payload.to_audio()
+        return AudioSegment.from_file(payload, format="wav")
+    except Exception:
+        return None
+
+
+class RedubManifest:
+    """
+    Manifeste d'une vidéo : clé de ligne -> segment réutilisable dans tts_cache.
+    """
+
+    def __init__(self, source: str):
+        self.root = join_cache(MANIFEST_SUBDIR, video_id(source))
+        self.lines: List[dict] = []
+        try:
+            with open(os.path.join(self.root, MANIFEST_FILE), "r", encoding="utf-8") as f:
+                data = json.load(f)
+            # Ancien format (segments WAV dans le dossier de la vidéo) : ignoré
+            if data.get("version") == MANIFEST_VERSION:
+                self.lines = list(data.get("lines") or [])
+        except Exception:
+            self.lines = []
+        self._refs: Dict[str, str] = {e["key"]: e["seg"] for e in self.lines if e.get("key") and e.get("seg")}
+
+    def segment_for(self, key: str) -> Optional[str]:
+        """
+        Chemin du segment de cette clé de ligne s'il est encore dans tts_cache
+        (marqué comme récemment utilisé).
+        """
+        seg = self._refs.get(key)
+        if not seg:
+            return None
+        path = tts_cache.segment_path(seg)
+        if not os.path.exists(path):
+            return None
+        try:
+            os.utime(path, None)
+        except Exception:
+            pass
+        return path
+
+    def store(self, key: str, payload, cache_key: Optional[str] = None) -> None:
+        """
+        Référence le segment d'une ligne fraîchement synthétisée.
+        cache_key : clé tts_cache du worker ; si le worker y a déjà mis le segment
+        (opts.tts_cache), il est seulement référencé. Sinon payload (PcmSegment ou
+        chemin d'un WAV temporaire) est ajouté à tts_cache sous la clé de ligne, s'il
+        est audible. Jamais bloquant.
+        """
+        if self.segment_for(key):
+            return
+        if cache_key and os.path.exists(tts_cache.segment_path(cache_key)):
+            self._refs[key] = cache_key
+            return
+        if not os.path.exists(tts_cache.segment_path(key)):
+            seg = _audio(payload)
+            if seg is None or seg.rms <= 0 or tts_cache.put(key, seg) is None:
+                return
+        self._refs[key] = key
+
+    def entry(self, idx: int, text: str, start_ms: int, end_ms: int, key: str) -> Optional[Dict]:
+        """
+        Entrée du manifeste pour une ligne dont le segment est disponible, sinon None.
+        """
+        seg = self._refs.get(key)
+        if not seg or not os.path.exists(tts_cache.segment_path(seg)):
+            return None
+        return {
+            "idx": int(idx),
+            "text": _hash(text)[:16],
+            "start_ms": int(start_ms),
+            "end_ms": int(end_ms),
+            "key": key,
+            "seg": seg,
+        }
+
+    def save(self, entries: Iterable[dict], prune: bool = True) -> None:
+        """
+        Écrit le nouveau manifeste.
+        prune=True : les lignes disparues sont oubliées ;
+        prune=False (extrait limité en durée) : les anciennes entrées sont conservées.
+        Les segments ne sont pas supprimés ici (éviction : tts_cache.prune).
+        """
+        entries = list(entries)
+        if not prune:
+            keep = {e["key"] for e in entries}
+            entries += [e for e in self.lines if e.get("key") not in keep]
+
+        path = os.path.join(self.root, MANIFEST_FILE)
+        tmp = f"{path}.{uuid.uuid4().hex}.tmp"
+        try:
+            os.makedirs(self.root, exist_ok=True)
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"version": MANIFEST_VERSION, "lines": entries}, f, ensure_ascii=False)
+            os.replace(tmp, path)
+        except Exception:
+            try:
+                if os.path.exists(tmp):
+                    os.remove(tmp)
+            except Exception:
+                pass
+            return
+
+        # Segments de l'ancien format, stockés à côté du manifeste
+        for name in os.listdir(self.root):
+            if name.endswith(".wav"):
+                try:
+                    os.remove(os.path.join(self.root, name))
+                except Exception:
+                    pass
+        self.lines = entries
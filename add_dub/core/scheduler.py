@@ -0,0 +1,194 @@
+# add_dub/core/scheduler.py
+"""
+Ordonnanceur batch multi-vidéos.
+
+Chaque vidéo traverse les étapes du pipeline (cf. pipeline.VideoJob) :
+  prepare (extraction ST/audio, traduction) → tts → ducking → mux (+ nettoyage)
+Chaque classe d'étape a son propre pool borné : pendant que la vidéo N est en TTS
+(réseau / CPU des workers), la N+1 est extraite et la N-1 est muxée.
+
+Plafonds globaux :
+  - vidéos en cours simultanément (jobs) : borne l'espace tmp/ et la mémoire ;
+  - processus ffmpeg simultanés (ffmpeg_jobs), via adapters.ffmpeg.set_ffmpeg_limit ;
+  - TTS : tts_jobs vidéos synthétisées en même temps ; elles partagent le pool de
+    workers persistant (Services.tts_executor) et se répartissent les requêtes Edge.
+
+Mode non interactif : l'option ask_test_before_cleanup est ignorée ici.
+"""
+from __future__ import annotations
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from typing import Callable, Dict, List, Optional, Tuple
+
+from add_dub.adapters.ffmpeg import set_ffmpeg_limit
+from add_dub.core.options import DubOptions
+from add_dub.core.pipeline import (
+    VideoJob,
+    prepare_video,
+    tts_stage,
+    ducking_stage,
+    mux_stage,
+    cleanup_stage,
+)
+from add_dub.core.services import Services
+from add_dub.core.tts_pool import default_tts_workers
+from add_dub.logger import logger as log
+from add_dub.i18n import t
+
+
+class PrefixedUI:
+    """
+    UI partagée par plusieurs vidéos en parallèle : messages préfixés par le nom
+    de la vidéo, pas de barre de progression, réponses par défaut aux questions.
+    """
+
+    def __init__(self, ui, prefix: str):
+        self._ui = ui
+        self._prefix = prefix
+
+    def message(self, text: str) -> None:
+        self._ui.message(f"[{self._prefix}] {text}")
+
+    def error(self, text: str) -> None:
+        self._ui.error(f"[{self._prefix}] {text}")
+
+    def ask_yes_no(self, question: str, default: bool = False) -> bool:
+        return default
+
+    def ask_float(self, prompt: str, default: float) -> float:
+        return default
+
+    def progress(self, percent: float) -> None:
+        pass
+
+
+class BatchScheduler:
+    """
+    run(items) traite une liste de (chemin_vidéo, dossier_sortie) et renvoie,
+    dans le même ordre, le chemin de la vidéo finale ou None en cas d'échec.
+    """
+
+    def __init__(
+        self,
+        svcs: Services,
+        opts: DubOptions,
+        *,
+        jobs: int,
+        tts_jobs: int,
+        ffmpeg_jobs: int,
+        limit_duration_sec: Optional[int] = None,
+    ):
+        self.svcs = svcs
+        self.jobs = max(1, int(jobs))
+        self.tts_jobs = max(1, min(int(tts_jobs), self.jobs))
+        self.ffmpeg_jobs = max(1, int(ffmpeg_jobs))
+        self.limit_duration_sec = limit_duration_sec
+        self.opts = self._split_tts_budget(opts)
+
+        self._inflight = threading.BoundedSemaphore(self.jobs)
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._all_done = threading.Event()
+        self._results: Dict[int, Optional[str]] = {}
+        self._pools: Dict[str, ThreadPoolExecutor] = {}
+
+    def _split_tts_budget(self, opts: DubOptions) -> DubOptions:
+        """
+        Répartit processus TTS et requêtes Edge entre les vidéos synthétisées en même temps.
+        Avec un pool persistant (Services.tts_executor), c'est lui qui plafonne les processus.
+        """
+        opts = replace(opts, edge_concurrency=max(1, int(opts.edge_concurrency or 1) // self.tts_jobs))
+        if self.svcs.tts_executor is None:
+            workers = default_tts_workers(opts.tts_workers)
+            opts = replace(opts, tts_workers=max(1, workers // self.tts_jobs))
+        return opts
+
+    # --------------------------
+    # Enchaînement des étapes
+    # --------------------------
+    def _finish(self, key: int, result: Optional[str]) -> None:
+        self._inflight.release()
+        with self._lock:
+            self._results[key] = result
+            self._pending -= 1
+            if self._pending == 0:
+                self._all_done.set()
+
+    def _submit(self, stage: str, key: int, fn: Callable[[], None]) -> None:
+        def _run():
+            try:
+                fn()
+            except Exception as e:
+                log.error(t("sched_stage_failed", stage=stage, err=e))
+                self._finish(key, None)
+        self._pools[stage].submit(_run)
+
+    def _prepare(self, key: int, path: str, out_dir: Optional[str]) -> None:
+        name = os.path.basename(path)
+        svcs = replace(self.svcs, ui=PrefixedUI(self.svcs.ui, name))
+        opts = self.opts
+        if opts.audio_ffmpeg_index is None:
+            opts = replace(opts, audio_ffmpeg_index=svcs.choose_audio_track(path))
+        opts = replace(opts, sub_choice=svcs.choose_subtitle_source(path))
+
+        job = prepare_video(
+            input_video_path=path,
+            input_video_name=name,
+            output_dir_path=out_dir,
+            opts=opts,
+            svcs=svcs,
+            limit_duration_sec=self.limit_duration_sec,
+        )
+        if job is None or job.skipped:
+            self._finish(key, job.final_video if job else None)
+            return
+        self._submit("tts", key, lambda: self._tts(key, job))
+
+    def _tts(self, key: int, job: VideoJob) -> None:
+        tts_stage(job)
+        self._submit("ducking", key, lambda: self._ducking(key, job))
+
+    def _ducking(self, key: int, job: VideoJob) -> None:
+        ducking_stage(job)
+        self._submit("mux", key, lambda: self._mux(key, job))
+
+    def _mux(self, key: int, job: VideoJob) -> None:
+        final_video = mux_stage(job)
+        try:
+            cleanup_stage(job)
+        except Exception as e:
+            log.warning(t("sched_stage_failed", stage="cleanup", err=e))
+        self._finish(key, final_video)
+
+    # --------------------------
+    # Point d'entrée
+    # --------------------------
+    def run(self, items: List[Tuple[str, Optional[str]]]) -> List[Optional[str]]:
+        if not items:
+            return []
+
+        self._pending = len(items)
+        self._all_done.clear()
+        self._pools = {
+            "prepare": ThreadPoolExecutor(self.jobs, thread_name_prefix="prepare"),
+            "tts": ThreadPoolExecutor(self.tts_jobs, thread_name_prefix="tts"),
+            "ducking": ThreadPoolExecutor(self.jobs, thread_name_prefix="ducking"),
+            "mux": ThreadPoolExecutor(self.jobs, thread_name_prefix="mux"),
+        }
+        set_ffmpeg_limit(self.ffmpeg_jobs, show_progress=False)
+        try:
+            for key, (path, out_dir) in enumerate(items):
+                # Au plus 'jobs' vidéos entre l'extraction et le nettoyage
+                self._inflight.acquire()
+                self.svcs.ui.message(t("cli_batch_start", path=path))
+                self._submit("prepare", key, lambda k=key, p=path, o=out_dir: self._prepare(k, p, o))
+            self._all_done.wait()
+        finally:
+            for pool in self._pools.values():
+                pool.shutdown(wait=True)
+            set_ffmpeg_limit(None)
+
+        return [self._results.get(i) for i in range(len(items))]
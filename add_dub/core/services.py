@@ -1,6 +1,7 @@
 # add_dub/core/services.py
 
 from dataclasses import dataclass
+from concurrent.futures import Executor
 from typing import Callable, Any, Optional
 
 
@@ -14,3 +15,4 @@ class Services:
     choose_audio_track: Callable[[str], int]
     choose_subtitle_source: Callable[[str], Optional[str]]
     ui: UIInterface
+    tts_executor: Optional[Executor] = None   # pool TTS persistant (batch), sinon un pool par vidéo
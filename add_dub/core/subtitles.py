@@ -3,18 +3,22 @@
 import os
 import re
 import html
-import time
 import shutil
 import subprocess
 import tempfile
+import threading
+
+import numpy as np
 
 import add_dub.io.fs as io_fs  # ← module, pas des valeurs copiées
-from add_dub.adapters.mkvtoolnix import mkv_has_subtitle_track, mkvmerge_identify_json
+from add_dub.adapters.ffmpeg import ffmpeg_slot, run_ffmpeg_with_percentage
+from add_dub.adapters.mkvtoolnix import mkvmerge_identify_json
 from add_dub.adapters.subtitle_edit import subtitle_edit_ocr, vobsub2srt_ocr
 from add_dub.i18n import t
 from add_dub.logger import logger as log
-from typing import Optional
+from typing import List, Optional
 from add_dub.core.ui import UIInterface
+from add_dub.core.library import LISTED_EXTS, scan_videos, walk_videos
 
 
 def _find_exe(candidates):
@@ -60,32 +64,77 @@ def _copy_into_srt_dir(src_srt_path: str, video_fullpath: str) -> str:
     return dst
 
 
-def strip_subtitle_tags_inplace(path: str) -> None:
-    with open(path, "r", encoding="utf-8", errors="replace") as f:
-        content = f.read()
+# Nettoyage des balises : <i>, <font ...>, {\\an8}, entités HTML, espaces multiples
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+_ASS_TAG_RE = re.compile(r"\{\\[^}]*\}")
+_SPACES_RE = re.compile(r"\s{2,}")
+_CLEAN_TIMING_RE = re.compile(r"\d{2}:\d{2}:\d{2},\d{3}\s*-->\s*\d{2}:\d{2}:\d{2},\d{3}")
+
+# Fichiers déjà nettoyés : chemin absolu → (taille, mtime_ns) après nettoyage
+_CLEAN_MEMO: dict = {}
+_CLEAN_LOCK = threading.Lock()
+
+
+def clean_subtitle_text(text: str) -> str:
+    """
+    Normalisation d'une ligne de texte (balises, entités, espaces).
+    """
+    if "<" in text or "{" in text or "&" in text:
+        text = html.unescape(text)
+        text = _HTML_TAG_RE.sub("", text)
+        text = _ASS_TAG_RE.sub("", text)
+    return _SPACES_RE.sub(" ", text).strip()
+
+
+def _clean_srt_content(content: str) -> str:
     blocks = re.split(r"\n\s*\n", content.strip())
     cleaned_blocks = []
     for b in blocks:
         lines = b.splitlines()
-        if len(lines) >= 3 and re.match(
-            r"\d{2}:\d{2}:\d{2},\d{3}\s*-->\s*\d{2}:\d{2}:\d{2},\d{3}", lines[1]
-        ):
-            header = lines[:2]
-            text_lines = lines[2:]
-            new_text = []
-            for t in text_lines:
-                t = html.unescape(t)
-                t = re.sub(r"<[^>]+>", "", t)
-                t = re.sub(r"\{\\[^}]*\}", "", t)
-                t = re.sub(r"\s{2,}", " ", t).strip()
-                new_text.append(t)
-            new_text = [x for x in new_text if x]
-            cleaned_blocks.append("\n".join(header + (new_text or [""])))
+        if len(lines) >= 3 and _CLEAN_TIMING_RE.match(lines[1]):
+            new_text = [x for x in (clean_subtitle_text(t) for t in lines[2:]) if x]
+            # Réplique vide : en-tête seul (forme stable, un second passage ne la change plus)
+            cleaned_blocks.append("\n".join(lines[:2] + new_text))
         else:
             cleaned_blocks.append(b)
-    cleaned = "\n\n".join(cleaned_blocks) + "\n"
-    with open(path, "w", encoding="utf-8") as f:
-        f.write(cleaned)
+    return "\n\n".join(cleaned_blocks) + "\n"
+
+
+def _stat_key(path: str):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+
+def is_subtitle_clean(path: str) -> bool:
+    """
+    Vrai si le fichier a déjà été nettoyé et n'a pas changé depuis (taille + mtime).
+    """
+    key = _stat_key(path)
+    with _CLEAN_LOCK:
+        return key is not None and _CLEAN_MEMO.get(os.path.abspath(path)) == key
+
+
+def strip_subtitle_tags_inplace(path: str) -> None:
+    """
+    Nettoie un SRT en place. Idempotent et mémorisé : un fichier déjà nettoyé
+    (même taille, même mtime) n'est pas relu, et il n'est réécrit que si le
+    nettoyage change réellement son contenu.
+    """
+    if is_subtitle_clean(path):
+        return
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        content = f.read()
+    cleaned = _clean_srt_content(content)
+    if cleaned != content:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(cleaned)
+    key = _stat_key(path)
+    if key is not None:
+        with _CLEAN_LOCK:
+            _CLEAN_MEMO[os.path.abspath(path)] = key
 
 
 def time_to_seconds(t_str: str) -> float:
@@ -94,29 +143,166 @@ def time_to_seconds(t_str: str) -> float:
     return int(h) * 3600 + int(m) * 60 + int(s) + int(ms) / 1000.0
 
 
-def parse_srt_file(srt_file: str, duration_limit_sec: int | None = None):
-    with open(srt_file, encoding="utf-8") as f:
-        content = f.read()
-    blocks = re.split(r"\n\s*\n", content.strip())
-    subtitles = []
-    for block in blocks:
-        lines = block.splitlines()
-        if len(lines) >= 3:
-            m = re.match(
-                r"(\d{2}:\d{2}:\d{2}[,\.]\d{3})\s*-->\s*(\d{2}:\d{2}:\d{2}[,\.]\d{3})",
-                lines[1],
-            )
-            if not m:
-                continue
-            start = time_to_seconds(m.group(1).replace(".", ","))
-            end = time_to_seconds(m.group(2).replace(".", ","))
-            if duration_limit_sec is not None and start >= duration_limit_sec:
-                continue
-            if duration_limit_sec is not None and end > duration_limit_sec:
-                end = float(duration_limit_sec)
-            text = " ".join(lines[2:]).strip()
-            subtitles.append((start, end, text))
-    return subtitles
+# Ligne de minutage SRT (précédée d'un saut de ligne : la recherche ne s'arrête qu'aux débuts
+# de ligne) : heures libres, "," ou "." avant les millisecondes (1 à 3 chiffres), suivie des
+# lignes de texte non vides du bloc.
+_SRT_CUE_RE = re.compile(
+    r"\n[ \t]*(\d+:\d\d:\d\d[,.]\d{1,3})[ \t]*-->[ \t]*(\d+:\d\d:\d\d[,.]\d{1,3})[^\n]*"
+    r"((?:\n[ \t]*\S[^\n]*)*)"
+)
+# Poids des caractères de "HH:MM:SS,mmm" (séparateurs à 0)
+_TS_WEIGHTS = np.array(
+    [36000000, 3600000, 0, 600000, 60000, 0, 10000, 1000, 0, 100, 10, 1], dtype=np.int64
+)
+
+
+def _ts_to_ms(ts: str) -> int:
+    h, m, rest = ts.split(":")
+    sec, frac = rest.replace(".", ",").split(",")
+    return ((int(h) * 60 + int(m)) * 60 + int(sec)) * 1000 + int(frac.ljust(3, "0"))
+
+
+def _timestamps_ms(stamps: List[str]) -> np.ndarray:
+    """
+    Horodatages → millisecondes. Cas courant (tous au format HH:MM:SS,mmm) vectorisé
+    sur les octets ; sinon conversion une à une.
+    """
+    n = len(stamps)
+    try:
+        raw = "".join(stamps).encode("ascii")
+    except UnicodeEncodeError:
+        raw = b""
+    if n and len(raw) == 12 * n:
+        a = np.frombuffer(raw, dtype=np.uint8).reshape(n, 12)
+        if (a[:, 2] == 58).all() and (a[:, 5] == 58).all():
+            return (a.astype(np.int64) - 48) @ _TS_WEIGHTS
+    return np.array([_ts_to_ms(x) for x in stamps], dtype=np.int64)
+
+
+def _cue_text(raw: str) -> str:
+    text = raw.strip()
+    if "\n" in text:
+        text = " ".join(part.strip() for part in text.split("\n"))
+    return text
+
+
+def _fmt_srt_ms(ms: int) -> str:
+    s, ms = divmod(int(ms), 1000)
+    m, s = divmod(s, 60)
+    h, m = divmod(m, 60)
+    return f"{h:02d}:{m:02d}:{s:02d},{ms:03d}"
+
+
+class SubtitleTrack:
+    """
+    Sous-titres en colonnes : début/fin en millisecondes (tableaux NumPy int64) + textes.
+
+    Se comporte comme l'ancienne liste de tuples (début_s, fin_s, texte) :
+    len(), itération, indexation, découpage et test de vérité fonctionnent à l'identique,
+    ce qui permet de parser une seule fois et de transmettre la piste aux étapes suivantes.
+    """
+
+    __slots__ = ("start_ms", "end_ms", "texts")
+
+    def __init__(self, start_ms, end_ms, texts):
+        self.start_ms = np.asarray(start_ms, dtype=np.int64).reshape(-1)
+        self.end_ms = np.asarray(end_ms, dtype=np.int64).reshape(-1)
+        self.texts = list(texts)
+
+    @classmethod
+    def from_tuples(cls, subtitles) -> "SubtitleTrack":
+        """
+        Construit une piste depuis une liste (début_s, fin_s, texte) ; renvoie telle quelle une piste existante.
+        """
+        if isinstance(subtitles, cls):
+            return subtitles
+        subtitles = list(subtitles or [])
+        return cls(
+            [int(round(st * 1000)) for st, _e, _t in subtitles],
+            [int(round(en * 1000)) for _s, en, _t in subtitles],
+            [tx for _s, _e, tx in subtitles],
+        )
+
+    @classmethod
+    def from_text(cls, content: str) -> "SubtitleTrack":
+        """
+        Parsing en une passe (BOM, CRLF, décimales "," ou "." tolérés).
+        """
+        content = content.lstrip("\ufeff").replace("\r\n", "\n").replace("\r", "\n")
+        rows = [r for r in _SRT_CUE_RE.findall("\n" + content) if r[2].strip()]
+        return cls(
+            _timestamps_ms([r[0] for r in rows]),
+            _timestamps_ms([r[1] for r in rows]),
+            [_cue_text(r[2]) for r in rows],
+        )
+
+    @classmethod
+    def from_file(cls, srt_file: str) -> "SubtitleTrack":
+        with open(srt_file, encoding="utf-8-sig", errors="replace") as f:
+            return cls.from_text(f.read())
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def __iter__(self):
+        for st, en, tx in zip(self.start_ms.tolist(), self.end_ms.tolist(), self.texts):
+            yield st / 1000.0, en / 1000.0, tx
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return SubtitleTrack(self.start_ms[key], self.end_ms[key], self.texts[key])
+        return int(self.start_ms[key]) / 1000.0, int(self.end_ms[key]) / 1000.0, self.texts[key]
+
+    def __repr__(self) -> str:
+        return f"SubtitleTrack({len(self)} cues)"
+
+    def _select(self, mask, start_ms=None, end_ms=None) -> "SubtitleTrack":
+        idx = np.flatnonzero(mask)
+        st = self.start_ms if start_ms is None else start_ms
+        en = self.end_ms if end_ms is None else end_ms
+        return SubtitleTrack(st[idx], en[idx], [self.texts[i] for i in idx.tolist()])
+
+    def limited(self, duration_limit_sec: Optional[int]) -> "SubtitleTrack":
+        """
+        Répliques commençant avant la limite, fins ramenées à la limite.
+        """
+        if duration_limit_sec is None:
+            return self
+        limit = int(duration_limit_sec) * 1000
+        return self._select(self.start_ms < limit, end_ms=np.minimum(self.end_ms, limit))
+
+    def cleaned(self) -> "SubtitleTrack":
+        """
+        Textes normalisés (balises, entités, espaces) ; répliques devenues vides supprimées.
+        """
+        texts = [clean_subtitle_text(tx) for tx in self.texts]
+        if texts == self.texts:
+            return self
+        track = SubtitleTrack(self.start_ms, self.end_ms, texts)
+        return track._select([bool(tx) for tx in texts])
+
+    def shifted(self, offset_ms: int) -> "SubtitleTrack":
+        """
+        Décale tous les minutages : début ramené à 0, répliques devenues vides supprimées.
+        """
+        st = np.maximum(self.start_ms + int(offset_ms), 0)
+        en = self.end_ms + int(offset_ms)
+        return self._select((en > 0) & (en > st), start_ms=st, end_ms=en)
+
+    def to_srt(self, path: str) -> None:
+        lines = []
+        for i, (st, en, tx) in enumerate(zip(self.start_ms.tolist(), self.end_ms.tolist(), self.texts), 1):
+            lines.append(f"{i}\n{_fmt_srt_ms(st)} --> {_fmt_srt_ms(en)}\n{tx}\n")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines))
+
+
+def parse_srt_file(srt_file: str, duration_limit_sec: int | None = None) -> SubtitleTrack:
+    track = SubtitleTrack.from_file(srt_file)
+    if not is_subtitle_clean(srt_file):
+        # Fichier jamais nettoyé (ou modifié depuis) : normalisation en mémoire
+        track = track.cleaned()
+    return track.limited(duration_limit_sec)
 
 
 def list_input_videos():
@@ -125,37 +311,106 @@ def list_input_videos():
     - MKV : affiché si au moins une piste ST intégrée OU SRT sidecar présent OU SRT homonyme dans srt/.
     - MP4/AVI : affiché si SRT sidecar présent OU SRT homonyme dans srt/.
     """
-    input_dir = io_fs.INPUT_DIR
-    try:
-        files = os.listdir(input_dir)
-    except FileNotFoundError:
-        files = []
-
-    candidates = []
-    for f in files:
-        full = io_fs.join_input(f)
-        if not os.path.isfile(full):
-            continue
-        fl = f.lower()
-        srt_in_srt = _srt_in_srt_dir_for_video(full) is not None
-
-        if fl.endswith(".mkv"):
-            sidecar = find_sidecar_srt(full)
-            if srt_in_srt or sidecar or mkv_has_subtitle_track(full):
-                candidates.append(f)
-        elif fl.endswith(".mp4") or fl.endswith(".avi"):
-            sidecar = find_sidecar_srt(full)
-            if srt_in_srt or sidecar:
-                candidates.append(f)
+    entries = scan_videos(walk_videos(io_fs.INPUT_DIR, exts=LISTED_EXTS))
+    candidates = [e.name for e in entries if e.eligible]
     return sorted(candidates, key=lambda x: x.lower())
 
 
+def _bitmap_ext(codec_id: str) -> str:
+    return ".sup" if "pgs" in codec_id else ".sub"
+
+
+def extract_subtitle_tracks(
+    video_fullpath: str,
+    local_indices,
+    out_dir: str,
+    *,
+    audio_index: Optional[int] = None,
+    audio_wav: Optional[str] = None,
+    duration_sec: Optional[int] = None,
+    info: Optional[dict] = None,
+):
+    """
+    Extrait toutes les pistes de sous-titres demandées (indices locaux) en une lecture
+    du conteneur, dans out_dir/<base>.<indice>.<ext> :
+      - pistes texte → un seul ffmpeg à sorties multiples (SRT), qui produit aussi le
+        WAV d'origine (audio_index → audio_wav, PCM 16-bit stéréo) si demandé ;
+      - pistes bitmap (PGS/VobSub) → un seul mkvextract (.sup / .sub).
+    Retourne ({indice: fichier}, WAV produit ou None). Lève CalledProcessError /
+    FileNotFoundError si un outil échoue ou manque.
+    """
+    info = info or mkvmerge_identify_json(video_fullpath) or {}
+    sub_tracks = [tr for tr in info.get("tracks", []) if tr.get("type") == "subtitles"]
+    base = os.path.splitext(os.path.basename(video_fullpath))[0]
+    os.makedirs(out_dir, exist_ok=True)
+
+    outputs = {}
+    text_args: List[str] = []
+    bitmap_specs: List[str] = []
+    for idx in dict.fromkeys(int(i) for i in local_indices):
+        if idx < 0 or idx >= len(sub_tracks):
+            continue
+        codec_id = (sub_tracks[idx].get("properties", {}).get("codec_id") or "").lower()
+        if codec_id.startswith("s_text/"):
+            out = os.path.join(out_dir, f"{base}.{idx}.srt")
+            text_args += ["-map", f"0:s:{idx}", "-c:s", "subrip", out]
+        else:
+            out = os.path.join(out_dir, f"{base}.{idx}{_bitmap_ext(codec_id)}")
+            bitmap_specs.append(f"{sub_tracks[idx].get('id')}:{out}")
+        outputs[idx] = out
+
+    wav = None
+    if text_args:
+        cmd = ["ffmpeg", "-y", "-hide_banner", "-loglevel", "error"]
+        if audio_wav and audio_index is not None:
+            # Même lecture : sous-titres texte + WAV d'origine (avec progression)
+            cmd += ["-nostats", "-progress", "pipe:1", "-i", video_fullpath, *text_args]
+            cmd += ["-map", f"0:{audio_index}", "-vn", "-ac", "2", "-c:a", "pcm_s16le"]
+            if duration_sec is not None:
+                cmd += ["-t", str(int(duration_sec))]
+            cmd.append(audio_wav)
+            run_ffmpeg_with_percentage(cmd, duration_source=video_fullpath)
+            wav = audio_wav
+        else:
+            cmd += ["-stats", "-i", video_fullpath, *text_args]
+            with ffmpeg_slot():
+                subprocess.run(
+                    cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                    text=True, encoding="utf-8", errors="replace"
+                )
+
+    if bitmap_specs:
+        mkvextract = _find_exe(
+            [
+                "mkvextract",
+                r"C:\Program Files\MKVToolNix\mkvextract.exe",
+                r"C:\Program Files (x86)\MKVToolNix\mkvextract.exe",
+            ]
+        )
+        if not mkvextract:
+            raise FileNotFoundError("mkvextract")
+        subprocess.run(
+            [mkvextract, "tracks", video_fullpath, *bitmap_specs],
+            check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+            text=True, encoding="utf-8", errors="replace"
+        )
+    return outputs, wav
+
+
 def extract_first_subtitle_to_srt_into_input(
-    video_fullpath: str, local_sub_index: int = 0, ocr_lang: str = "fr", ui: Optional[UIInterface] = None
+    video_fullpath: str,
+    local_sub_index: int = 0,
+    ocr_lang: str = "fr",
+    ui: Optional[UIInterface] = None,
+    *,
+    audio_index: Optional[int] = None,
+    audio_wav: Optional[str] = None,
+    duration_sec: Optional[int] = None,
 ) -> str | None:
     """
     ⚠️ Comportement : extraction/convert texte/ocr → **toujours** dans srt/<video_base>.srt
     (jamais dans le dossier source). Utilise -y (overwrite) côté ffmpeg/moves.
+    Piste texte + audio_wav : le WAV d'origine est extrait dans la même passe ffmpeg.
     """
     info = mkvmerge_identify_json(video_fullpath)
     if not info:
@@ -172,7 +427,6 @@ def extract_first_subtitle_to_srt_into_input(
     if local_sub_index < 0 or local_sub_index >= len(sub_tracks):
         local_sub_index = 0
     t_sel = sub_tracks[local_sub_index]
-    track_id = t_sel.get("id")
     codec_id = (t_sel.get("properties", {}).get("codec_id") or "").lower()
 
     base = os.path.splitext(os.path.basename(video_fullpath))[0]
@@ -183,29 +437,13 @@ def extract_first_subtitle_to_srt_into_input(
     is_text = codec_id.startswith("s_text/")
     if is_text:
         try:
-            cmd = [
-                "ffmpeg",
-                "-y",
-                "-hide_banner",
-                "-loglevel",
-                "error",
-                "-stats",
-                "-i",
-                video_fullpath,
-                "-map",
-                f"0:s:{local_sub_index}",
-                "-c:s",
-                "subrip",
-                target_srt,
-            ]
-            start = time.perf_counter()
-            subprocess.run(
-                cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
-                text=True, encoding="utf-8", errors="replace"
+            outputs, _wav = extract_subtitle_tracks(
+                video_fullpath, [local_sub_index], os.path.dirname(target_srt),
+                audio_index=audio_index, audio_wav=audio_wav, duration_sec=duration_sec, info=info,
             )
-            end = time.perf_counter()
-            # print(end - start) # Debug timing removed or logged if needed
-            if os.path.exists(target_srt) and os.path.getsize(target_srt) > 0:
+            out = outputs.get(local_sub_index)
+            if out and os.path.exists(out) and os.path.getsize(out) > 0:
+                os.replace(out, target_srt)
                 strip_subtitle_tags_inplace(target_srt)
                 if ui: ui.message(t("sub_extract_text_success", path=target_srt))
                 else: log.info(t("sub_extract_text_success", path=target_srt))
@@ -219,31 +457,16 @@ def extract_first_subtitle_to_srt_into_input(
         return None
 
     # Bitmap (PGS/VobSub) -> mkvextract + OCR
-    mkvextract = _find_exe(
-        [
-            "mkvextract",
-            r"C:\Program Files\MKVToolNix\mkvextract.exe",
-            r"C:\Program Files (x86)\MKVToolNix\mkvextract.exe",
-        ]
-    )
-    if not mkvextract:
-        if ui: ui.error(t("sub_mkvextract_not_found"))
-        else: log.error(t("sub_mkvextract_not_found"))
-        return None
-
     tmp_dir = tempfile.mkdtemp(prefix="subs_")
     try:
-        ext = ".sup" if "pgs" in codec_id or "hdmv/pgs" in codec_id else ".sub"
-        base_noext = os.path.join(tmp_dir, base)
-        ocr_input = base_noext + ext
-
-        cmd = ["mkvextract", "tracks", video_fullpath, f"{track_id}:{ocr_input}"]
-        if os.path.basename(mkvextract).lower() != "mkvextract":
-            cmd[0] = mkvextract
-        subprocess.run(
-            cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
-            text=True, encoding="utf-8", errors="replace"
-        )
+        try:
+            outputs, _wav = extract_subtitle_tracks(video_fullpath, [local_sub_index], tmp_dir, info=info)
+        except FileNotFoundError:
+            if ui: ui.error(t("sub_mkvextract_not_found"))
+            else: log.error(t("sub_mkvextract_not_found"))
+            return None
+        ocr_input = outputs[local_sub_index]
+        base_noext, ext = os.path.splitext(ocr_input)
 
         tmp_out = os.path.join(tmp_dir, base + ".srt")
 
@@ -276,7 +499,15 @@ def extract_first_subtitle_to_srt_into_input(
             pass
 
 
-def resolve_srt_for_video(video_fullpath: str, sub_choice_global: tuple, ui: Optional[UIInterface] = None) -> str | None:
+def resolve_srt_for_video(
+    video_fullpath: str,
+    sub_choice_global: tuple,
+    ui: Optional[UIInterface] = None,
+    *,
+    audio_index: Optional[int] = None,
+    audio_wav: Optional[str] = None,
+    duration_sec: Optional[int] = None,
+) -> str | None:
     """
     Politique unifiée (jamais d'écriture dans le dossier source) :
 
@@ -286,8 +517,12 @@ def resolve_srt_for_video(video_fullpath: str, sub_choice_global: tuple, ui: Opt
         1) Si srt/<base>.srt existe déjà → on l'utilise.
         2) Sinon, si un sidecar .srt est à côté de la vidéo → on le COPIE dans srt/ et on utilise la copie.
         3) Sinon, si on a une piste intégrée (cas MKV) → extraction vers srt/ (piste 0 par défaut) et on l'utilise.
+
+    audio_index / audio_wav / duration_sec : transmis à l'extraction MKV, qui produit
+    alors aussi le WAV d'origine dans la même passe (piste texte uniquement).
     """
     kind, value = sub_choice_global
+    audio = dict(audio_index=audio_index, audio_wav=audio_wav, duration_sec=duration_sec)
 
     # CAS 1 — Choix explicite d'une piste MKV : extraction forcée (avec overwrite)
     if kind == "mkv":
@@ -296,7 +531,7 @@ def resolve_srt_for_video(video_fullpath: str, sub_choice_global: tuple, ui: Opt
         except Exception:
             local_idx = 0
         srt_path = extract_first_subtitle_to_srt_into_input(
-            video_fullpath, local_sub_index=local_idx, ui=ui
+            video_fullpath, local_sub_index=local_idx, ui=ui, **audio
         )
         if srt_path:
             strip_subtitle_tags_inplace(srt_path)
@@ -328,7 +563,7 @@ def resolve_srt_for_video(video_fullpath: str, sub_choice_global: tuple, ui: Opt
 
     # 2.3) En dernier recours : tenter d'extraire la première piste intégrée si disponible
     srt_path = extract_first_subtitle_to_srt_into_input(
-        video_fullpath, local_sub_index=0, ui=ui
+        video_fullpath, local_sub_index=0, ui=ui, **audio
     )
     if srt_path:
         strip_subtitle_tags_inplace(srt_path)
@@ -339,67 +574,22 @@ def resolve_srt_for_video(video_fullpath: str, sub_choice_global: tuple, ui: Opt
     return None
 
 
-def shift_subtitle_timestamps(srt_path: str, offset_ms: int) -> str:
+def shift_subtitle_timestamps(srt_path: str, offset_ms: int, track: Optional[SubtitleTrack] = None) -> str:
     """
-    Lit un fichier SRT, décale tous les timestamps de offset_ms,
-    et écrit le résultat dans un nouveau fichier temporaire (dans srt/).
+    Lit un fichier SRT (ou utilise la piste déjà parsée), décale tous les timestamps
+    de offset_ms, et écrit le résultat dans un nouveau fichier (<base>.shifted.srt).
     Retourne le chemin du nouveau fichier.
     """
     if offset_ms == 0:
         return srt_path
 
-    subs = parse_srt_file(srt_path)
+    subs = track if track is not None else parse_srt_file(srt_path)
     if not subs:
         return srt_path
 
-    new_subs = []
-    for start, end, text in subs:
-        s = start * 1000 + offset_ms
-        e = end * 1000 + offset_ms
-        
-        # Si la fin est avant 0, on jette le sous-titre
-        if e <= 0:
-            continue
-        
-        # Si le début est avant 0, on le ramène à 0
-        if s < 0:
-            s = 0
-            
-        # Si après correction, durée nulle ou négative, on jette
-        if e <= s:
-            continue
-            
-        new_subs.append((s / 1000.0, e / 1000.0, text))
-
-    if not new_subs:
-        # Si tout est coupé, on renvoie un SRT vide ou l'original (au choix)
-        # Mieux vaut un SRT vide valide
-        base, ext = os.path.splitext(srt_path)
-        new_path = f"{base}.shifted{ext}"
-        with open(new_path, "w", encoding="utf-8") as f:
-            f.write("")
-        return new_path
-
-    # Génération du nouveau contenu
-    lines = []
-    for idx, (start, end, text) in enumerate(new_subs, 1):
-        # Format: 00:00:00,000
-        def _fmt(sec):
-            ms = int(round((sec % 1) * 1000))
-            s = int(sec)
-            m, s = divmod(s, 60)
-            h, m = divmod(m, 60)
-            return f"{h:02d}:{m:02d}:{s:02d},{ms:03d}"
-
-        lines.append(str(idx))
-        lines.append(f"{_fmt(start)} --> {_fmt(end)}")
-        lines.append(text)
-        lines.append("")
-
+    # Si tout est coupé, on écrit un SRT vide (valide)
     base, ext = os.path.splitext(srt_path)
     new_path = f"{base}.shifted{ext}"
-    with open(new_path, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines))
-    
+    subs.shifted(offset_ms).to_srt(new_path)
     return new_path
 
@@ -1,7 +1,8 @@
 
 import os
 import sys
-from typing import List, Tuple, Optional
+import threading
+from typing import Callable, Dict, Iterable, List, Tuple, Optional
 from add_dub.logger import logger as log
 from add_dub.i18n import t
 from add_dub.core.ui import UIInterface
@@ -9,22 +10,65 @@ from add_dub.core.ui import UIInterface
 import ctranslate2
 import sentencepiece
 
+from add_dub.config import cfg
+from add_dub.core import translation_memory
+
+# Modèles chargés, résidents pour tout le processus (toutes les vidéos d'un batch)
 _TRANSLATOR_CACHE = {}
+_TRANSLATOR_LOCK = threading.Lock()
+_LOAD_LOCKS: Dict[str, threading.Lock] = {}
+
+# Codes ISO 639-2 des pistes MKV → codes des modèles opus-mt
+_ISO639_2 = {
+    "fre": "fr", "fra": "fr", "eng": "en", "spa": "es", "ger": "de", "deu": "de",
+    "ita": "it", "jpn": "ja", "por": "pt", "dut": "nl", "nld": "nl", "pol": "pl",
+    "rus": "ru", "ukr": "uk", "tur": "tr", "swe": "sv", "cze": "cs", "ces": "cs",
+    "gre": "el", "ell": "el", "chi": "zh", "zho": "zh", "ara": "ar", "kor": "ko",
+}
 
 
-def _get_translator_and_tokenizer(source_lang: str, target_lang: str):
+def _translator_threads() -> Tuple[int, int]:
     """
-    Retourne le traducteur CTranslate2 et les tokenizers SentencePiece pour la paire de langues.
-    Télécharge automatiquement le modèle CTranslate2 pré-converti si non présent dans le cache.
+    (inter_threads, intra_threads) : traductions en parallèle × threads par traduction.
+    0 dans defaults.py = dimensionné sur la machine (16 cœurs → 4 × 4).
     """
-    pair_name = f"{source_lang}-{target_lang}"
-    cache_dir = os.path.join(os.path.expanduser("~"), ".cache", "add_dub", "ct2_models")
-    model_dir = os.path.join(cache_dir, f"ct2fast-opus-mt-{pair_name}")
+    cores = os.cpu_count() or 1
+    inter = int(getattr(cfg, "TRANSLATE_INTER_THREADS", 0) or 0) or max(1, min(4, cores // 4))
+    intra = int(getattr(cfg, "TRANSLATE_INTRA_THREADS", 0) or 0) or max(1, cores // inter)
+    return inter, intra
+
+
+def _model_name(source_lang: str, target_lang: str) -> str:
+    return f"ct2fast-opus-mt-{source_lang}-{target_lang}"
+
 
-    key = f"{source_lang}_{target_lang}"
-    if key in _TRANSLATOR_CACHE:
+def _get_translator_and_tokenizer(source_lang: str, target_lang: str, compute_type: str = "default"):
+    """
+    Retourne le traducteur CTranslate2 et les tokenizers SentencePiece pour la paire de langues.
+    Un seul chargement par (paire, compute_type) et par processus, même si plusieurs vidéos
+    (ou le préchargement batch) le demandent en même temps : les autres attendent.
+    """
+    key = f"{source_lang}_{target_lang}_{compute_type}"
+    with _TRANSLATOR_LOCK:
+        if key in _TRANSLATOR_CACHE:
+            return _TRANSLATOR_CACHE[key]
+        lock = _LOAD_LOCKS.setdefault(key, threading.Lock())
+    with lock:
+        if key not in _TRANSLATOR_CACHE:
+            loaded = _load_translator(source_lang, target_lang, compute_type)
+            with _TRANSLATOR_LOCK:
+                _TRANSLATOR_CACHE[key] = loaded
         return _TRANSLATOR_CACHE[key]
 
+
+def _load_translator(source_lang: str, target_lang: str, compute_type: str):
+    """
+    Charge le modèle ; le télécharge automatiquement (modèle CTranslate2 pré-converti)
+    s'il n'est pas présent dans le cache.
+    """
+    cache_dir = os.path.join(os.path.expanduser("~"), ".cache", "add_dub", "ct2_models")
+    model_dir = os.path.join(cache_dir, _model_name(source_lang, target_lang))
+
     src_spm = os.path.join(model_dir, "source.spm")
     tgt_spm = os.path.join(model_dir, "target.spm")
     model_bin = os.path.join(model_dir, "model.bin")
@@ -42,23 +86,203 @@ def _get_translator_and_tokenizer(source_lang: str, target_lang: str):
             raise RuntimeError(f"Impossible de télécharger le modèle de traduction pour {source_lang}->{target_lang}: {e}")
 
     log.info(f"Chargement du moteur CTranslate2 ({source_lang} -> {target_lang})...")
-    translator = ctranslate2.Translator(model_dir, device="cpu", intra_threads=1)
+    inter, intra = _translator_threads()
+    translator = ctranslate2.Translator(
+        model_dir, device="cpu", compute_type=compute_type or "default",
+        inter_threads=inter, intra_threads=intra,
+    )
 
     sp_src = sentencepiece.SentencePieceProcessor(model_file=src_spm)
     sp_tgt = sentencepiece.SentencePieceProcessor(model_file=tgt_spm)
 
-    _TRANSLATOR_CACHE[key] = (translator, sp_src, sp_tgt)
     return translator, sp_src, sp_tgt
 
 
+def preload_translators(pairs: Iterable[Tuple[str, str]], compute_type: str = "default") -> threading.Thread:
+    """
+    Charge en tâche de fond les modèles des paires (source, cible) attendues, pendant
+    que le batch extrait sous-titres et audio. pairs peut être un générateur : il est
+    parcouru dans le thread de fond (détection des langues comprise). Un échec est seulement journalisé :
+    la vidéo concernée retentera (et signalera l'erreur) au moment de traduire.
+    """
+    def _run():
+        seen = set()
+        for pair in pairs:
+            if pair in seen:
+                continue
+            seen.add(pair)
+            src, tgt = pair
+            try:
+                _get_translator_and_tokenizer(src, tgt, compute_type)
+            except Exception as e:
+                log.warning(f"Préchargement du modèle {src}->{tgt} impossible : {e}")
+
+    th = threading.Thread(target=_run, name="translator-preload", daemon=True)
+    th.start()
+    return th
+
+
+def guess_source_lang(video_path: str, srt_path: Optional[str] = None, mkv_info: Optional[dict] = None,
+                      sub_index: int = 0) -> Optional[str]:
+    """
+    Langue probable des sous-titres d'une vidéo, sans rien extraire :
+    nom de fichier (Sub(Fre), Sub(Eng)), sinon SRT disponible (langdetect),
+    sinon langue déclarée de la piste MKV. None si inconnue.
+    """
+    lower_name = os.path.basename(video_path).lower()
+    if "sub(fre)" in lower_name or "sub(fr)" in lower_name:
+        return "fr"
+    if "sub(eng)" in lower_name or "sub(en)" in lower_name:
+        return "en"
+
+    if srt_path:
+        try:
+            from langdetect import detect
+            from add_dub.core.subtitles import parse_srt_file
+            sample = " ".join(tx for _s, _e, tx in parse_srt_file(srt_path)[:50])
+            return detect(sample) if sample.strip() else None
+        except Exception:
+            return None
+
+    subs = [tr for tr in (mkv_info or {}).get("tracks", []) if tr.get("type") == "subtitles"]
+    if subs:
+        prop = subs[sub_index if 0 <= sub_index < len(subs) else 0].get("properties", {}) or {}
+        ietf = str(prop.get("language_ietf") or "").split("-")[0].lower()
+        if ietf and ietf != "und":
+            return ietf
+        return _ISO639_2.get(str(prop.get("language") or "").lower())
+    return None
+
+
+def _translate_texts(
+    translator,
+    sp_src,
+    sp_tgt,
+    texts: List[str],
+    ui: Optional[UIInterface] = None,
+    on_text: Optional[Callable[[int, str], None]] = None,
+) -> List[Optional[str]]:
+    """
+    Traduit des lignes en conservant leur ordre.
+    Tokenisation SentencePiece en un appel, tri par longueur (lots de longueurs proches,
+    peu de padding), lots bornés en tokens (batch_type="tokens") et translate_iterable :
+    les lots suivants sont décodés pendant que les résultats précédents sont détokenisés.
+    None pour une ligne vide ou non traduite.
+    on_text(i, traduction) est appelé dès qu'une ligne est décodée (ordre d'achèvement).
+    """
+    out: List[Optional[str]] = [None] * len(texts)
+    idx = [i for i, x in enumerate(texts) if x.strip()]
+    if not idx:
+        return out
+
+    tokens = sp_src.encode([texts[i] for i in idx], out_type=str)
+    order = sorted(range(len(idx)), key=lambda k: len(tokens[k]))
+    max_tokens = int(getattr(cfg, "TRANSLATE_MAX_BATCH_TOKENS", 2048) or 2048)
+
+    total = len(order)
+    done = 0
+    last_pct = -1
+    try:
+        results = translator.translate_iterable(
+            (tokens[k] + ["</s>"] for k in order),
+            max_batch_size=max_tokens,
+            batch_type="tokens",
+        )
+        for k, r in zip(order, results):
+            if r.hypotheses:
+                out[idx[k]] = sp_tgt.decode(r.hypotheses[0])
+                if on_text:
+                    on_text(idx[k], out[idx[k]])
+            done += 1
+            pct = int(done / total * 100)
+            if ui and pct != last_pct:
+                last_pct = pct
+                ui.progress(pct)
+    except Exception as e:
+        # Les lignes restantes restent non traduites (texte d'origine chez l'appelant)
+        log.error(f"Erreur lors de la traduction d'un lot : {e}")
+    return out
+
+
+# Regroupement en phrases (translate_merge_sentences)
+_SENTENCE_END = (".", "!", "?", "…", "♪")
+MERGE_MAX_CUES = 4
+MERGE_MAX_GAP_S = 1.0
+MERGE_MAX_CHARS = 250
+
+
+def _sentence_units(subtitles) -> List[List[int]]:
+    """
+    Regroupe les répliques consécutives d'une même phrase (indices) : une unité se
+    termine sur une ponctuation finale, un tiret de dialogue, un silence de plus de
+    MERGE_MAX_GAP_S, ou quand elle atteint MERGE_MAX_CUES / MERGE_MAX_CHARS.
+    """
+    units: List[List[int]] = []
+    chars = 0
+    prev_end = None
+    prev_text = ""
+    for i, (start, end, text) in enumerate(subtitles):
+        text = str(text or "").strip()
+        cont = (
+            units and text and prev_text
+            and not prev_text.endswith(_SENTENCE_END)
+            and not text.startswith("-")
+            and prev_end is not None and start - prev_end <= MERGE_MAX_GAP_S
+            and len(units[-1]) < MERGE_MAX_CUES
+            and chars + len(text) <= MERGE_MAX_CHARS
+        )
+        if cont:
+            units[-1].append(i)
+            chars += len(text) + 1
+        else:
+            units.append([i])
+            chars = len(text)
+        prev_end, prev_text = end, text
+    return units
+
+
+def _redistribute(text: str, weights: List[float]) -> List[str]:
+    """
+    Redécoupe une traduction sur les répliques d'origine, aux frontières de mots,
+    proportionnellement aux poids (nombre de caractères source).
+    """
+    words = str(text or "").split()
+    m, n = len(weights), len(words)
+    total = float(sum(weights)) or 1.0
+    cuts = [0]
+    acc = 0.0
+    for k, w in enumerate(weights[:-1], 1):
+        acc += w
+        c = int(round(n * acc / total))
+        if n >= m:
+            # Au moins un mot par réplique
+            c = max(cuts[-1] + 1, min(c, n - (m - k)))
+        else:
+            c = max(cuts[-1], min(c, n))
+        cuts.append(c)
+    cuts.append(n)
+    return [" ".join(words[a:b]) for a, b in zip(cuts, cuts[1:])]
+
+
 def translate_subtitles(
     subtitles: List[Tuple[float, float, str]], 
     target_lang: str, 
     source_lang: Optional[str] = None,
-    ui: Optional[UIInterface] = None
+    ui: Optional[UIInterface] = None,
+    compute_type: str = "default",
+    merge_sentences: bool = False,
+    on_translated: Optional[Callable[[int, str], None]] = None,
+    memory: bool = True,
+    memory_max_mb: float = 64,
 ) -> List[Tuple[float, float, str]]:
     """
     Traduit une liste de sous-titres (start, end, text) vers la langue cible via CTranslate2 + SentencePiece.
+    merge_sentences : les répliques d'une même phrase sont traduites ensemble (moins de
+    fragments, lots mieux remplis) puis la traduction est redécoupée sur leurs minutages.
+    on_translated(i, texte) : appelé une fois par réplique dès que son texte est définitif
+    (mémoire, puis modèle au fil des lots ; texte d'origine si la traduction échoue),
+    pour enchaîner la synthèse sans attendre la fin du fichier.
+    memory / memory_max_mb : mémoire de traduction persistante et sa taille max (Mo).
     """
     texts = [s[2] for s in subtitles]
     if not texts:
@@ -78,38 +302,70 @@ def translate_subtitles(
 
     log.info(t("trans_log_start", count=len(texts), target=target_lang, source=source_lang))
 
-    try:
-        translator, sp_src, sp_tgt = _get_translator_and_tokenizer(source_lang, target_lang)
-    except Exception as e:
-        log.error(f"Erreur d'initialisation du traducteur pour {source_lang}->{target_lang}: {e}")
-        return subtitles
+    if merge_sentences:
+        units = _sentence_units(subtitles)
+        unit_texts = [" ".join(str(texts[i] or "").strip() for i in u) for u in units]
+    else:
+        units = [[i] for i in range(len(texts))]
+        unit_texts = texts
 
-    translated_texts = []
-    batch_size = 16
-    total = len(texts)
+    # Mémoire de traduction : seules les lignes inconnues (dédoublonnées) partent au modèle
+    pair = _model_name(source_lang, target_lang)
+    sources = [translation_memory.normalize(x) for x in unit_texts]
+    known = translation_memory.lookup(pair, sources, enabled=memory)
+    lines = sum(1 for x in sources if x)
+    hits = sum(1 for x in sources if x and x in known)
+    log.info(t("trans_log_memory", hits=hits, total=lines, pct=int(hits * 100 / lines) if lines else 0))
 
-    for i in range(0, total, batch_size):
-        batch = texts[i : i + batch_size]
-        tokens = [
-            sp_src.encode(str(t), out_type=str) + ["</s>"] if t and str(t).strip() else []
-            for t in batch
-        ]
+    translated_texts = list(texts)
+
+    def _apply(k: int, translation: Optional[str]) -> None:
+        # Texte définitif des répliques de l'unité k (None : texte d'origine conservé)
+        u = units[k]
+        if translation is None:
+            parts = [texts[i] for i in u]
+        elif len(u) == 1:
+            parts = [translation]
+        else:
+            parts = _redistribute(translation, [max(1, len(str(texts[i] or "").strip())) for i in u])
+        for i, part in zip(u, parts):
+            translated_texts[i] = part
+            if on_translated:
+                on_translated(i, part)
 
+    pending: Dict[str, List[int]] = {}
+    for k, src in enumerate(sources):
+        if src and src not in known:
+            pending.setdefault(src, []).append(k)
+        else:
+            _apply(k, known.get(src))
+
+    misses = list(pending)
+    if misses:
         try:
-            results = translator.translate_batch(tokens)
-            for j, r in enumerate(results):
-                if r.hypotheses:
-                    decoded = sp_tgt.decode(r.hypotheses[0])
-                    translated_texts.append(decoded)
-                else:
-                    translated_texts.append(batch[j])
+            translator, sp_src, sp_tgt = _get_translator_and_tokenizer(source_lang, target_lang, compute_type)
         except Exception as e:
-            log.error(f"Erreur lors de la traduction d'un lot : {e}")
-            translated_texts.extend(batch)
+            log.error(f"Erreur d'initialisation du traducteur pour {source_lang}->{target_lang}: {e}")
+            for ks in pending.values():
+                for k in ks:
+                    _apply(k, None)
+            return subtitles
+
+        def _on_text(j: int, tgt: str) -> None:
+            for k in pending[misses[j]]:
+                _apply(k, tgt)
 
-        pct = min(100.0, int((i + len(batch)) / total * 100))
-        if ui:
-            ui.progress(pct)
+        fresh = _translate_texts(translator, sp_src, sp_tgt, misses, ui=ui, on_text=_on_text)
+        for src, tgt in zip(misses, fresh):
+            if tgt is None:
+                for k in pending[src]:
+                    _apply(k, None)
+        translation_memory.store(
+            pair, {src: tgt for src, tgt in zip(misses, fresh) if tgt is not None},
+            enabled=memory, max_mb=memory_max_mb,
+        )
+    elif ui:
+        ui.progress(100)
 
     log.info(t("trans_log_completed"))
 
@@ -0,0 +1,123 @@
+# add_dub/core/translation_memory.py
+"""
+Mémoire de traduction persistante (~/.cache/add_dub/translation_memory.sqlite).
+
+Clé = (modèle / paire de langues, texte source normalisé). translate_subtitles la
+consulte avant de lancer CTranslate2 : seules les lignes absentes (nouvelles) partent
+au modèle. Couvre les re-traductions d'un même fichier, les doublons d'un épisode et
+les lignes communes d'une série (génériques, répliques récurrentes).
+
+- Taille bornée (translation_memory_max_mb) : éviction des entrées les moins
+  récemment utilisées.
+- Jamais bloquante : toute erreur SQLite revient à « pas de mémoire ».
+"""
+from __future__ import annotations
+
+import os
+import re
+import time
+import sqlite3
+from typing import Dict, Iterable, List
+
+from add_dub.io.fs import join_cache
+
+DB_FILE = "translation_memory.sqlite"
+# Nombre max de paramètres par requête IN (...)
+_CHUNK = 500
+_SPACES_RE = re.compile(r"\s+")
+
+
+def normalize(text: str) -> str:
+    return _SPACES_RE.sub(" ", str(text or "")).strip()
+
+
+def _connect() -> sqlite3.Connection:
+    path = join_cache(DB_FILE)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    conn = sqlite3.connect(path, timeout=10)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS tm ("
+        " pair TEXT NOT NULL, src TEXT NOT NULL, tgt TEXT NOT NULL, used REAL NOT NULL,"
+        " PRIMARY KEY (pair, src)) WITHOUT ROWID"
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS tm_used ON tm (used)")
+    return conn
+
+
+def lookup(pair: str, sources: Iterable[str], enabled: bool = True) -> Dict[str, str]:
+    """
+    Traductions connues {source normalisée: traduction} (et marquées comme utilisées).
+    """
+    keys = list(dict.fromkeys(normalize(s) for s in sources if normalize(s)))
+    found: Dict[str, str] = {}
+    if not keys or not enabled:
+        return found
+    try:
+        conn = _connect()
+        try:
+            for i in range(0, len(keys), _CHUNK):
+                chunk = keys[i:i + _CHUNK]
+                rows = conn.execute(
+                    f"SELECT src, tgt FROM tm WHERE pair = ? AND src IN ({','.join('?' * len(chunk))})",
+                    [pair, *chunk],
+                ).fetchall()
+                found.update(rows)
+            if found:
+                now = time.time()
+                conn.executemany(
+                    "UPDATE tm SET used = ? WHERE pair = ? AND src = ?",
+                    [(now, pair, k) for k in found],
+                )
+                conn.commit()
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        return {}
+    return found
+
+
+def store(pair: str, translations: Dict[str, str], enabled: bool = True, max_mb: float = 64) -> None:
+    """
+    Enregistre {source: traduction} puis applique la limite de taille.
+    """
+    rows = [(pair, normalize(s), tgt) for s, tgt in translations.items() if normalize(s) and tgt]
+    if not rows or not enabled:
+        return
+    try:
+        conn = _connect()
+        try:
+            now = time.time()
+            conn.executemany(
+                "INSERT OR REPLACE INTO tm (pair, src, tgt, used) VALUES (?, ?, ?, ?)",
+                [(p, s, tgt, now) for p, s, tgt in rows],
+            )
+            conn.commit()
+            _prune(conn, int(float(max_mb) * 1024 * 1024))
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        pass
+
+
+def _prune(conn: sqlite3.Connection, max_bytes: int) -> int:
+    """
+    Éviction LRU (taille estimée = textes stockés). Retourne le nombre d'entrées supprimées.
+    """
+    if max_bytes <= 0:
+        return 0
+    total = conn.execute("SELECT COALESCE(SUM(LENGTH(src) + LENGTH(tgt) + LENGTH(pair)), 0) FROM tm").fetchone()[0]
+    if total <= max_bytes:
+        return 0
+    # On redescend à 90 % de la limite pour ne pas élaguer à chaque ajout
+    excess = total - int(max_bytes * 0.9)
+    cur = conn.execute("SELECT pair, src, LENGTH(src) + LENGTH(tgt) + LENGTH(pair) FROM tm ORDER BY used")
+    victims: List[tuple] = []
+    for pair, src, size in cur:
+        if excess <= 0:
+            break
+        victims.append((pair, src))
+        excess -= size
+    cur.close()
+    conn.executemany("DELETE FROM tm WHERE pair = ? AND src = ?", victims)
+    conn.commit()
+    return len(victims)
@@ -7,6 +7,7 @@ from add_dub.config.defaults import get_system_default_voice_id  # re-export
 
 # Typage (et pour accéder aux bornes min/max depuis l'instance)
 from add_dub.core.options import DubOptions
+from add_dub.core import rate_model, voice_catalog
 from add_dub.logger import logger as log
 from add_dub.i18n import t
 
@@ -19,6 +20,13 @@ except Exception:
     DataReader = None
 
 
+# Recherche de la vitesse OneCore
+MAX_ATTEMPTS = 10       # synthèses max par réplique
+RATE_STEP = 0.05        # précision recherchée sur la vitesse
+FIT_TOLERANCE = 0.10    # une synthèse qui remplit >= 90 % de la cible est acceptée
+SAFETY_STEP = 1.02      # marge appliquée à la correction après mesure
+
+
 # --------------------------------
 # Caches par processus (memoization locale à chaque worker)
 # --------------------------------
@@ -85,6 +93,14 @@ def list_available_voices() -> list[dict]:
     - id : l'ID complet OneCore (copiable tel quel dans options.conf)
     - display_name : nom lisible (ex. 'Microsoft Julie')
     - lang : tag BCP-47 (ex. 'fr-FR', 'es-ES')
+    Catalogue mis en cache (mémoire + disque, cf. voice_catalog).
+    """
+    return voice_catalog.get_voices("onecore", _fetch_voices)
+
+
+def _fetch_voices() -> list[dict]:
+    """
+    Énumération WinRT brute (liste vide si indisponible).
     """
     out: list[dict] = []
     if SpeechSynthesizer is None:
@@ -162,6 +178,13 @@ async def _onecore_synthesize_bytes_async(text: str, voice_id: str | None, rate_
     return bytes(buf)
 
 
+def _onecore_synthesize_at(text: str, voice_id: str | None, rate: float) -> AudioSegment:
+    data = asyncio.run(_onecore_synthesize_bytes_async(text, voice_id, rate))
+    segment = AudioSegment.from_file(io.BytesIO(data), format="wav")
+    rate_model.observe(voice_id, text, rate, len(segment))
+    return segment
+
+
 def _onecore_synthesize_segment(
     text: str,
     target_duration_ms: int,
@@ -171,21 +194,48 @@ def _onecore_synthesize_segment(
     """
     Laisse remonter les erreurs (pas de segment silencieux masquant le problème).
     Retourne (AudioSegment, nombre_tentatives, vitesse_finale)
+
+    1re tentative à la vitesse prédite par rate_model (min_rate_tts si voix inconnue),
+    puis correction à partir de la durée mesurée (durée ∝ 1 / vitesse) tant qu'elle
+    reste dans l'intervalle encore possible, sinon bissection.
+    On garde la vitesse la plus lente qui tient dans la cible (à RATE_STEP près).
     """
-    r = opts.min_rate_tts
-    h = opts.max_rate_tts
+    lo = float(opts.min_rate_tts)
+    hi = max(float(opts.max_rate_tts), lo)
     t = target_duration_ms
     v = voice_id or opts.voice_id
+
+    r = rate_model.predict_rate(v, text, t, lo, hi) or lo
+    too_slow = lo - RATE_STEP       # plus grande vitesse connue trop longue
+    fits = None                     # (segment, vitesse) le plus lent qui tient
+    segment = None
     attempts = 0
-    for _ in range(10):
+    while attempts < MAX_ATTEMPTS:
         attempts += 1
-        data    = asyncio.run(_onecore_synthesize_bytes_async(text, v, r))
-        bio     = io.BytesIO(data)
-        segment = AudioSegment.from_file(bio, format="wav")
-        if len(segment) <= t or r >= h:
-            return segment, attempts, round(r, 2)
+        segment = _onecore_synthesize_at(text, v, r)
+        cur = len(segment)
+
+        if cur <= t:
+            fits = (segment, r)
+            # Assez proche de la cible, ou impossible d'aller plus lentement
+            if r <= lo or cur >= t * (1.0 - FIT_TOLERANCE):
+                break
         else:
-            r = round(((r * 10) + 1) / 10, 2)
+            if r >= hi:
+                break
+            too_slow = r
+
+        upper = fits[1] if fits else hi + RATE_STEP
+        if upper - too_slow <= RATE_STEP + 1e-9:
+            break
+
+        nxt = min(max(round(r * cur / max(1, t) * SAFETY_STEP, 2), lo), hi)
+        if not (too_slow < nxt < upper):
+            nxt = round((too_slow + upper) / 2.0, 2)
+        r = min(max(nxt, lo), hi)
+
+    if fits is not None:
+        return fits[0], attempts, round(fits[1], 2)
     return segment, attempts, round(r, 2)
 
 def synthesize_tts_for_subtitle(text: str, target_duration_ms: int, voice_id: str | None, opts: DubOptions) -> tuple[AudioSegment, int, float]:
@@ -220,7 +270,7 @@ def is_valid_voice_id(voice_id: str | None) -> bool:
         log.warning(t("tts_warn_winrt_unavailable"))
         return True
 
-    voices = _get_voice_list()
+    voices = list_available_voices()
     if not voices:
         log.warning(t("tts_warn_enum_fail"))
         return True
@@ -228,7 +278,7 @@ def is_valid_voice_id(voice_id: str | None) -> bool:
     vid = str(voice_id).strip()
     found = False
     for v in voices:
-        v_id = getattr(v, "id", "")
+        v_id = v.get("id", "")
         if vid == v_id:
             found = True
             break
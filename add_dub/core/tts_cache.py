@@ -0,0 +1,160 @@
+# add_dub/core/tts_cache.py
+"""
+Cache disque des segments TTS, partagé entre les exécutions (et entre processus).
+
+- Clé = empreinte de (moteur, voix, texte, min/max rate, backend d'étirement,
+  durée cible arrondie) ; KEY_VERSION change quand la composition de la clé change
+  (les anciennes entrées ne sont plus servies, puis sont évincées par prune()).
+- Un segment = un WAV dans ~/.cache/add_dub/tts_segments/<xx>/<clé>.wav
+- LRU : chaque lecture "touche" le fichier (mtime) ; prune() supprime les plus anciens
+  tant que la taille totale dépasse la limite.
+- Compteurs hits/misses locaux au processus (les workers renvoient aussi un flag).
+"""
+from __future__ import annotations
+
+import os
+import uuid
+import hashlib
+from typing import Optional, Tuple
+
+from pydub import AudioSegment
+
+from add_dub.io.fs import join_cache
+
+CACHE_SUBDIR = "tts_segments"
+# Granularité de la durée cible dans la clé (ms)
+DURATION_BUCKET_MS = 50
+# v2 : backend d'étirement (stretch_backend) inclus dans la clé
+KEY_VERSION = 2
+
+_HITS = 0
+_MISSES = 0
+
+
+def cache_dir() -> str:
+    return join_cache(CACHE_SUBDIR)
+
+
+def segment_key(
+    engine: str,
+    voice_id: Optional[str],
+    text: str,
+    min_rate: float,
+    max_rate: float,
+    target_duration_ms: int,
+    stretch_backend: Optional[str],
+) -> str:
+    """
+    Empreinte stable d'un segment synthétisé.
+    """
+    bucket = max(0, int(target_duration_ms)) // DURATION_BUCKET_MS
+    raw = "\x1f".join([
+        f"v{KEY_VERSION}",
+        str(engine or ""),
+        str(voice_id or ""),
+        str(text or ""),
+        f"{float(min_rate or 1.0):.3f}",
+        f"{float(max_rate or 1.0):.3f}",
+        str(bucket),
+        str(stretch_backend or ""),
+    ])
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def segment_path(key: str) -> str:
+    return os.path.join(cache_dir(), key[:2], f"{key}.wav")
+
+
+def get(key: str) -> Optional[AudioSegment]:
+    """
+    Retourne le segment mis en cache (et le marque comme récemment utilisé), sinon None.
+    """
+    global _HITS, _MISSES
+    path = segment_path(key)
+    if not os.path.exists(path):
+        _MISSES += 1
+        return None
+    try:
+        seg = AudioSegment.from_file(path, format="wav")
+    except Exception:
+        _MISSES += 1
+        try:
+            os.remove(path)
+        except Exception:
+            pass
+        return None
+    try:
+        os.utime(path, None)
+    except Exception:
+        pass
+    _HITS += 1
+    return seg
+
+
+def put(key: str, segment: AudioSegment) -> Optional[str]:
+    """
+    Enregistre un segment (écriture atomique : fichier temporaire puis os.replace).
+    Retourne le chemin final, ou None en cas d'échec (le cache n'est jamais bloquant).
+    """
+    path = segment_path(key)
+    tmp = f"{path}.{uuid.uuid4().hex}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        segment.export(tmp, format="wav")
+        os.replace(tmp, path)
+        return path
+    except Exception:
+        try:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+        except Exception:
+            pass
+        return None
+
+
+def stats() -> Tuple[int, int]:
+    """
+    (hits, misses) du processus courant.
+    """
+    return _HITS, _MISSES
+
+
+def prune(max_bytes: int) -> int:
+    """
+    Éviction LRU : supprime les segments les moins récemment utilisés
+    jusqu'à repasser sous max_bytes. Retourne le nombre de fichiers supprimés.
+    """
+    root = cache_dir()
+    if max_bytes <= 0 or not os.path.isdir(root):
+        return 0
+
+    entries = []
+    total = 0
+    for sub in os.scandir(root):
+        if not sub.is_dir():
+            continue
+        for e in os.scandir(sub.path):
+            if not e.name.endswith(".wav"):
+                continue
+            try:
+                st = e.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, e.path))
+            total += st.st_size
+
+    if total <= max_bytes:
+        return 0
+
+    removed = 0
+    entries.sort()
+    for _mtime, size, path in entries:
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+            total -= size
+            removed += 1
+        except Exception:
+            pass
+    return removed
@@ -1,9 +1,7 @@
 # add_dub/core/tts_edge.py
 import io
 import os
-import shutil
 import tempfile
-import subprocess
 import asyncio
 import string
 from typing import Optional, List, Dict
@@ -13,6 +11,7 @@ from pydub import AudioSegment
 
 # Même signature publique que tts.py pour rester plug-and-play
 from add_dub.core.options import DubOptions
+from add_dub.core import audio_utils, voice_catalog
 from add_dub.logger import (log_call, log_time)
 
 # Dépendances: edge-tts + ffmpeg dans le PATH
@@ -89,16 +88,23 @@ async def _edge_list_voices_async() -> List[Dict]:
     return _normalize_voice_records(voices)
 
 
-def list_available_voices() -> List[Dict]:
+def _fetch_voices() -> List[Dict]:
     """
-    Wrapper synchrone pour lister les voix Edge.
+    Listing réseau brut (liste vide en cas d'échec).
     """
     try:
-        lst = asyncio.run(_edge_list_voices_async())
-        if lst:
-            return lst
+        return asyncio.run(_edge_list_voices_async()) or []
     except Exception:
-        pass
+        return []
+
+
+def list_available_voices() -> List[Dict]:
+    """
+    Wrapper synchrone pour lister les voix Edge (catalogue mis en cache, cf. voice_catalog).
+    """
+    lst = voice_catalog.get_voices("edge", _fetch_voices)
+    if lst:
+        return lst
     # Fallback minimal si l’API a échoué
     return [{"id": DEFAULT_EDGE_VOICE, "display_name": DEFAULT_EDGE_VOICE, "lang": "fr-FR"}]
 
@@ -108,66 +114,17 @@ def is_valid_voice_id(voice_id: Optional[str]) -> bool:
         return False
     try:
         s = str(voice_id).strip()
-        voices = list_available_voices()
+        voices = voice_catalog.get_voices("edge", _fetch_voices)
+        if not voices:
+            # Catalogue indisponible (réseau) : la voix demandée est conservée plutôt que
+            # remplacée en silence par DEFAULT_EDGE_VOICE
+            return True
         return any(v["id"] == s for v in voices)
     except Exception:
         # En cas d'échec de listing, tolérer la voix par défaut
         return str(voice_id).strip().lower() == DEFAULT_EDGE_VOICE.lower()
 
 
-def _atempo_chain_for_factor(factor: float) -> list[str]:
-    """
-    Construit une chaîne de filtres atempo pour couvrir un facteur arbitraire > 0
-    en respectant la plage acceptée par ffmpeg (0.5..2.0 par maillon).
-    """
-    if factor <= 0:
-        return []
-    filters: list[str] = []
-    remaining = factor
-    while remaining < 0.5:
-        filters.append("atempo=0.5")
-        remaining /= 0.5
-    while remaining > 2.0:
-        filters.append("atempo=2.0")
-        remaining /= 2.0
-    if abs(remaining - 1.0) > 1e-6:
-        filters.append(f"atempo={remaining:.6f}")
-    return filters
-
-
-def _speed_change_with_ffmpeg(segment: AudioSegment, factor: float) -> AudioSegment:
-    """
-    Change la vitesse (ralentit/accélère) sans changer la hauteur via ffmpeg (filter atempo).
-    factor > 1.0 => plus rapide ; 0 < factor < 1.0 => plus lent.
-    Si factor ~ 1.0, renvoie segment tel quel.
-    """
-    if factor <= 0:
-        return segment
-    if abs(factor - 1.0) <= 1e-6:
-        return segment
-    if shutil.which("ffmpeg") is None:
-        raise RuntimeError("ffmpeg introuvable")
-
-    filters = _atempo_chain_for_factor(factor)
-    if not filters:
-        return segment
-    filt = ",".join(filters)
-
-    with tempfile.TemporaryDirectory(dir=io_fs.TMP_DIR) as td:
-        inp = os.path.join(td, "in.wav")
-        out = os.path.join(td, "out.wav")
-        segment.export(inp, format="wav")
-        cmd = [
-            "ffmpeg", "-y", "-hide_banner", "-loglevel", "error",
-            "-i", inp,
-            "-filter:a", filt,
-            "-vn",
-            out
-        ]
-        subprocess.run(cmd, check=True)
-        return AudioSegment.from_file(out)
-
-
 def _sniff_audio_format(b: bytes) -> str:
     """
     Devine 'wav' ou 'mp3' selon les premiers octets.
@@ -198,13 +155,11 @@ async def _edge_synthesize_bytes_async(text: str, voice_shortname: str) -> bytes
     return buf.getvalue()
 
 
-def _synthesize(text: str, voice_shortname: str) -> AudioSegment:
+def _decode_audio_bytes(data: bytes) -> AudioSegment:
     """
-    Enveloppe synchrone pratique (compatible multiprocessing).
     Détecte si MP3 ou WAV et charge avec le bon 'format'.
     Écrit d'abord en fichier dans TMP_DIR pour éviter cache:pipe:0 en CWD.
     """
-    data = asyncio.run(_edge_synthesize_bytes_async(text, voice_shortname))
     fmt = _sniff_audio_format(data)
 
     with tempfile.NamedTemporaryFile(delete=False, suffix=f".{fmt}", dir=io_fs.TMP_DIR) as f:
@@ -222,6 +177,14 @@ def _synthesize(text: str, voice_shortname: str) -> AudioSegment:
     return seg
 
 
+def _synthesize(text: str, voice_shortname: str) -> AudioSegment:
+    """
+    Enveloppe synchrone pratique (compatible multiprocessing).
+    """
+    data = asyncio.run(_edge_synthesize_bytes_async(text, voice_shortname))
+    return _decode_audio_bytes(data)
+
+
 def _looks_like_silence(text: str) -> bool:
     """
     True si 'text' ne contient que espaces/ellipses/ponctuation/symboles.
@@ -254,10 +217,9 @@ def synthesize_tts_for_subtitle(
     """
     Implémentation Edge TTS avec le même comportement que gTTS côté vitesse :
     1) Synthèse (vitesse "1.0" intrinsèque Edge)
-    2) Si opts.min_rate_tts != 1.0 → post-traitement atempo (vitesse minimale globale)
-    3) Ajustement à target_duration_ms :
-       - si trop long → accélération supplémentaire, bornée par opts.max_rate_tts
-       - si trop court → padding silence
+    2) Un seul changement de vitesse : max(opts.min_rate_tts, durée brute / cible),
+       plafonné par opts.max_rate_tts (cf. audio_utils.fit_to_target)
+    3) Trim ou padding silence à target_duration_ms
     """
     # Court-circuit SILENCE : texte vide/ellipses/ponctuation uniquement
     if _looks_like_silence(text):
@@ -272,49 +234,4 @@ def synthesize_tts_for_subtitle(
         # Sécurité : si Edge échoue (ex. NoAudioReceived), renvoyer du silence
         return AudioSegment.silent(duration=max(0, int(target_duration_ms)))
 
-    # Étape 2 — vitesse minimale pilotée (post-traitement)
-    try:
-        base_rate = float(getattr(opts, "min_rate_tts", 1.0) or 1.0)
-    except Exception:
-        base_rate = 1.0
-
-    if base_rate > 0 and abs(base_rate - 1.0) > 1e-6:
-        try:
-            seg = _speed_change_with_ffmpeg(seg, base_rate)
-        except Exception:
-            # Continuer avec la synthèse brute si atempo échoue
-            pass
-
-    # Étape 3 — ajustement à la durée cible
-    tgt = max(0, int(target_duration_ms))
-    cur = len(seg)
-
-    if tgt > 0 and cur > tgt:
-        # facteur d'accélération requis
-        needed_factor = cur / max(1, tgt)  # > 1.0
-        # plafond via max_rate_tts (par défaut 1.8 si non renseigné)
-        try:
-            max_rate = float(getattr(opts, "max_rate_tts", 1.8) or 1.8)
-        except Exception:
-            max_rate = 1.8
-        if max_rate < 1.0:
-            max_rate = 1.0  # sécurité: pas de plafond < 1 pour accélérer
-        
-        factor = min(needed_factor, max_rate)
-
-        try:
-            sped = _speed_change_with_ffmpeg(seg, factor)
-            # Ajustement final exact
-            if len(sped) > tgt:
-                seg = sped[:tgt]
-            else:
-                seg = sped + AudioSegment.silent(duration=(tgt - len(sped)))
-        except Exception:
-            # Pas d'ffmpeg ou échec → trim direct
-            seg = seg[:tgt]
-    else:
-        # Padding si trop court
-        if cur < tgt:
-            seg = seg + AudioSegment.silent(duration=(tgt - cur))
-
-    return seg
+    return audio_utils.fit_to_target(seg, target_duration_ms, opts)
@@ -0,0 +1,200 @@
+# add_dub/core/tts_edge_async.py
+"""
+Planificateur asynchrone Edge TTS (un seul processus).
+
+Edge est limité par le réseau : plutôt que d'éparpiller les répliques sur un
+ProcessPoolExecutor (un asyncio.run par ligne, imports répétés par processus),
+on lance N flux edge_tts.Communicate concurrents dans une seule boucle asyncio :
+  - sémaphore configurable (opts.edge_concurrency),
+  - timeout par ligne (opts.edge_timeout_s),
+  - retries avec backoff exponentiel ; un refus du service (HTTP 429) suspend
+    toutes les requêtes pendant le délai de backoff,
+  - décodage / ajustement de durée délégués à un pool de threads
+    (le décodage pydub passe par un sous-processus ffmpeg),
+  - répliques supplémentaires lues au fil de l'eau sur un flux (feed), dans la même
+    boucle : sémaphore et pause 429 restent communs à toute la vidéo.
+Le résultat de chaque ligne a la même forme que celui de tts_worker.
+"""
+from __future__ import annotations
+
+import time
+import random
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import cpu_count
+from typing import Callable, List, Optional, Tuple
+
+from pydub import AudioSegment
+
+from add_dub.core import audio_utils
+from add_dub.core import tts_cache
+from add_dub.core import tts_edge
+from add_dub.core.options import DubOptions
+from add_dub.logger import logger as log
+from add_dub.workers import _handoff
+from add_dub.i18n import t
+
+MAX_RETRIES = 3
+# Période de lecture du flux de répliques (feed) quand il est vide
+FEED_POLL_S = 0.05
+BACKOFF_BASE_S = 1.0
+BACKOFF_MAX_S = 30.0
+
+
+def _is_rate_limited(exc: BaseException) -> bool:
+    status = getattr(exc, "status", None) or getattr(exc, "code", None)
+    if status == 429:
+        return True
+    return "429" in str(exc)
+
+
+class _EdgeScheduler:
+    def __init__(self, opts: DubOptions, voice: str, concurrency: int, timeout_s: float):
+        self.opts = opts
+        self.voice = voice
+        self.timeout_s = timeout_s
+        self.sem = asyncio.Semaphore(max(1, concurrency))
+        self.cooldown_until = 0.0
+        self.stats = {"retries": 0, "timeouts": 0, "throttled": 0, "failed": 0}
+
+    async def _wait_cooldown(self) -> None:
+        delay = self.cooldown_until - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def fetch(self, text: str) -> Optional[bytes]:
+        """
+        Synthèse réseau d'une ligne avec timeout + retries. None si abandon.
+        """
+        for attempt in range(MAX_RETRIES + 1):
+            await self._wait_cooldown()
+            throttled = False
+            async with self.sem:
+                try:
+                    data = await asyncio.wait_for(
+                        tts_edge._edge_synthesize_bytes_async(text, self.voice),
+                        timeout=self.timeout_s,
+                    )
+                    if data:
+                        return data
+                except asyncio.TimeoutError:
+                    self.stats["timeouts"] += 1
+                except Exception as e:
+                    if _is_rate_limited(e):
+                        throttled = True
+                        self.stats["throttled"] += 1
+
+            if attempt >= MAX_RETRIES:
+                break
+            self.stats["retries"] += 1
+            delay = min(BACKOFF_MAX_S, BACKOFF_BASE_S * (2 ** attempt)) * (1.0 + random.random() * 0.25)
+            if throttled:
+                # Tout le monde attend : inutile de marteler un service qui refuse.
+                self.cooldown_until = max(self.cooldown_until, time.monotonic() + delay)
+            else:
+                await asyncio.sleep(delay)
+
+        self.stats["failed"] += 1
+        return None
+
+
+def _postprocess(data: bytes, target_ms: int, opts: DubOptions, cache_key: Optional[str]) -> AudioSegment:
+    """
+    Décodage + ajustement de durée (exécuté dans un thread). Lève si l'audio est illisible.
+    """
+    seg = audio_utils.fit_to_target(tts_edge._decode_audio_bytes(data), target_ms, opts)
+    if cache_key and seg.rms > 0:
+        tts_cache.put(cache_key, seg)
+    return seg
+
+
+async def _run(
+    jobs: List[Tuple[int, int, int, str, str, DubOptions]],
+    opts: DubOptions,
+    on_result: Callable[[tuple], None],
+    feed: Optional[Callable[[float], Optional[list]]] = None,
+) -> dict:
+    voice = opts.voice_id if tts_edge.is_valid_voice_id(opts.voice_id) else tts_edge.DEFAULT_EDGE_VOICE
+    sched = _EdgeScheduler(
+        opts,
+        voice,
+        concurrency=int(getattr(opts, "edge_concurrency", 32) or 32),
+        timeout_s=float(getattr(opts, "edge_timeout_s", 30.0) or 30.0),
+    )
+    loop = asyncio.get_running_loop()
+    use_cache = bool(getattr(opts, "tts_cache", False))
+    min_rate = getattr(opts, "min_rate_tts", 1.0)
+    max_rate = getattr(opts, "max_rate_tts", 1.8)
+
+    with ThreadPoolExecutor(max_workers=max(2, cpu_count())) as pool:
+
+        async def _one(job) -> None:
+            idx, start_ms, end_ms, text, voice_id, _opts = job
+            target_ms = end_ms - start_ms
+
+            if tts_edge._looks_like_silence(text):
+                seg = AudioSegment.silent(duration=max(0, int(target_ms)))
+                on_result((idx, _handoff(seg, opts), start_ms, end_ms, 0, min_rate, False))
+                return
+
+            cache_key = None
+            if use_cache:
+                cache_key = tts_cache.segment_key(
+                    "edge", voice_id, text, min_rate, max_rate, target_ms,
+                    getattr(opts, "stretch_backend", None),
+                )
+                seg = await loop.run_in_executor(pool, tts_cache.get, cache_key)
+                if seg is not None:
+                    on_result((idx, _handoff(seg, opts), start_ms, end_ms, 0, min_rate, True))
+                    return
+
+            data = await sched.fetch(text)
+            seg = None
+            if not data:
+                log.warning(t("tts_edge_fetch_failed", idx=idx))
+            else:
+                try:
+                    seg = await loop.run_in_executor(pool, _postprocess, data, target_ms, opts, cache_key)
+                except Exception as e:
+                    sched.stats["failed"] += 1
+                    log.warning(t("tts_edge_decode_failed", idx=idx, err=e))
+            if seg is None:
+                # Silence de remplacement : attempts=0, ce n'est pas une synthèse
+                seg = AudioSegment.silent(duration=max(0, int(target_ms)))
+                on_result((idx, _handoff(seg, opts), start_ms, end_ms, 0, min_rate, False))
+                return
+            on_result((idx, _handoff(seg, opts), start_ms, end_ms, 1, min_rate, False))
+
+        tasks = [asyncio.ensure_future(_one(j)) for j in jobs]
+        # Lu sans attente, dans le thread de la boucle (comme on_result) : les nouvelles
+        # répliques rejoignent les synthèses en cours au lieu d'attendre la fin d'un lot
+        while feed is not None:
+            more = feed(0.0)
+            if more is None:
+                break
+            tasks.extend(asyncio.ensure_future(_one(j)) for j in more)
+            if not more:
+                await asyncio.sleep(FEED_POLL_S)
+        await asyncio.gather(*tasks)
+
+    return sched.stats
+
+
+def run_edge_jobs(
+    jobs: List[Tuple[int, int, int, str, str, DubOptions]],
+    opts: DubOptions,
+    on_result: Callable[[tuple], None],
+    feed: Optional[Callable[[float], Optional[list]]] = None,
+) -> dict:
+    """
+    Synthétise toutes les répliques Edge dans une boucle asyncio unique.
+    on_result est appelé (dans le thread appelant) pour chaque ligne terminée.
+    feed : répliques supplémentaires, feed(attente_max) -> liste de jobs (éventuellement
+    vide), None quand plus rien ne viendra ; appelé dans le thread appelant.
+    Retourne les statistiques (retries, timeouts, throttled, failed).
+    """
+    tts_edge._require_edge_tts()
+    stats = asyncio.run(_run(jobs, opts, on_result, feed))
+    if any(stats.values()):
+        log.info(t("tts_edge_stats", **stats))
+    return stats
@@ -1,25 +1,36 @@
 # add_dub/core/tts_generate.py
 import os
 import math
+import time
 from multiprocessing import cpu_count
-from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait, FIRST_COMPLETED
-from typing import List, Tuple, Optional
+from concurrent.futures import Executor, ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Callable, Dict, List, Tuple, Optional
 from add_dub.core.ui import UIInterface
 import numpy as np
 from pydub import AudioSegment
 
 from dataclasses import replace
 from add_dub.core.options import DubOptions
-from add_dub.core.subtitles import parse_srt_file
-from add_dub.workers import tts_worker
+from add_dub.core.subtitles import SubtitleTrack, parse_srt_file
+from add_dub.workers import tts_worker, PcmSegment, _handoff
+from add_dub.core import rate_model, redub, tts_cache
+from add_dub.core.redub import RedubManifest
+from add_dub.core.line_feed import LineFeed
 from add_dub.logger import (log_call, log_time)
+from add_dub.logger import logger as log
 from add_dub.core.tts_registry import normalize_engine
+from add_dub.core.tts_pool import TTSWorkerPool, default_tts_workers
 
 from add_dub.i18n import t
 
 # Mode de débogage pour afficher le nombre de tentatives et la vitesse par sous-titre
 DEBUG_TTS_ATTEMPTS = False
 
+# Pool de processus : période de surveillance et backoff des relances
+POLL_S = 0.5
+RETRY_BACKOFF_S = 1.0
+RETRY_BACKOFF_MAX_S = 30.0
+
 def _coerce_gtts_lang(voice_id: str) -> str:
     """
     Nettoie l'ID de voix pour gTTS qui attend un code langue simple (fr, en, es...).
@@ -34,8 +45,8 @@ def _coerce_gtts_lang(voice_id: str) -> str:
     return voice_id
 
 
-def _load_segment_as_array(
-    path: str,
+def _segment_to_array(
+    seg: AudioSegment,
     target_sr: int,
     target_ch: int,
     target_sw: int,
@@ -43,15 +54,10 @@ def _load_segment_as_array(
     target_ms: int,
 ) -> np.ndarray:
     """
-    Charge un fichier audio (path), le convertit au format cible,
+    Convertit un AudioSegment au format cible,
     coupe le début (trim_lead_ms) et limite la durée (target_ms).
     Retourne un tableau numpy int16 (samples, channels).
     """
-    try:
-        seg = AudioSegment.from_file(path)
-    except Exception:
-        return np.zeros((0, target_ch), dtype=np.int16)
-
     # Conversion format
     if seg.frame_rate != target_sr:
         seg = seg.set_frame_rate(target_sr)
@@ -68,14 +74,10 @@ def _load_segment_as_array(
     if target_ms > 0:
         seg = seg[:target_ms]
 
-    # Conversion numpy
-    # AudioSegment.get_array_of_samples() retourne un array.array
-    samples = seg.get_array_of_samples()
-    arr = np.array(samples, dtype=np.int16)
+    # Conversion numpy (int16 entrelacé [L, R, L, R...] → (N, channels))
+    arr = np.frombuffer(seg.raw_data, dtype=np.int16)
 
-    # Reshape (N, channels)
     if target_ch > 1:
-        # Attention: pydub entrelace les canaux [L, R, L, R...]
         # Si la longueur n'est pas multiple de channels, on tronque
         rem = arr.size % target_ch
         if rem != 0:
@@ -87,6 +89,43 @@ def _load_segment_as_array(
     return arr
 
 
+def _load_segment_as_array(
+    path: str,
+    target_sr: int,
+    target_ch: int,
+    target_sw: int,
+    trim_lead_ms: int,
+    target_ms: int,
+) -> np.ndarray:
+    """
+    Charge un fichier audio (path) puis délègue à _segment_to_array.
+    """
+    try:
+        seg = AudioSegment.from_file(path)
+    except Exception:
+        return np.zeros((0, target_ch), dtype=np.int16)
+    return _segment_to_array(seg, target_sr, target_ch, target_sw, trim_lead_ms, target_ms)
+
+
+def _payload_format(payload) -> Tuple[int, int]:
+    """
+    (frame_rate, channels) d'un résultat worker (PcmSegment ou chemin WAV).
+    """
+    if isinstance(payload, PcmSegment):
+        return payload.frame_rate, payload.channels
+    seg = AudioSegment.from_file(payload)
+    return seg.frame_rate, seg.channels
+
+
+def _remove_payload(payload) -> None:
+    if isinstance(payload, str):
+        try:
+            if payload and os.path.exists(payload):
+                os.remove(payload)
+        except Exception:
+            pass
+
+
 def _export_int16_wav(arr: np.ndarray, sr: int, ch: int, out_path: str) -> None:
     """
     Exporte un tableau numpy int16 vers un fichier WAV via pydub.
@@ -106,6 +145,199 @@ def _export_int16_wav(arr: np.ndarray, sr: int, ch: int, out_path: str) -> None:
     seg.export(out_path, format="wav")
 
 
+def _edge_async_available() -> bool:
+    try:
+        from add_dub.core import tts_edge
+        return tts_edge.edge_tts is not None
+    except Exception:
+        return False
+
+
+def _silent_result(job, opts: DubOptions) -> tuple:
+    """
+    Résultat de remplacement (silence à la durée cible) pour une réplique abandonnée.
+    """
+    idx, start_ms, end_ms = job[0], job[1], job[2]
+    seg = AudioSegment.silent(duration=max(0, end_ms - start_ms))
+    return idx, _handoff(seg, opts), start_ms, end_ms, 0, getattr(opts, "min_rate_tts", 1.0), False, []
+
+
+def _run_in_process_pool(
+    jobs,
+    on_result,
+    opts: DubOptions,
+    *,
+    ui: Optional[UIInterface],
+    max_workers: int,
+    executor: Optional[Executor] = None,
+    feed: Optional[Callable[[float], Optional[list]]] = None,
+) -> dict:
+    """
+    Répartit les répliques sur un pool de processus (un tts_worker par ligne).
+    executor : pool persistant fourni par l'appelant (réutilisé, jamais arrêté ici) ;
+    sinon un pool éphémère est créé pour cette vidéo.
+
+    Chaque réplique a son propre délai (opts.tts_job_timeout_s, compté à partir de son
+    démarrage effectif dans un worker). Une réplique bloquée ou en erreur est resoumise
+    seule au pool après un backoff exponentiel, au plus opts.tts_max_retries fois, puis
+    remplacée par du silence. Le résultat tardif d'une tentative abandonnée est ignoré.
+    Un worker bloqué ne rend jamais la main : sur un TTSWorkerPool, le pool est recyclé
+    (processus terminés) et les autres répliques en cours sont resoumises sans compter
+    de tentative.
+    feed : source de répliques supplémentaires, feed(attente_max) -> liste de jobs
+    (éventuellement vide), None quand plus rien ne viendra ; interrogée à chaque tour.
+    Retourne les statistiques (stalls, retries, errors, failed).
+    """
+    job_timeout_s = float(getattr(opts, "tts_job_timeout_s", 60.0) or 60.0)
+    max_retries = max(0, int(getattr(opts, "tts_max_retries", 2) or 0))
+
+    owned = executor is None
+    ex = TTSWorkerPool(normalize_engine(opts.tts_engine), max_workers) if owned else executor
+
+    by_idx = {j[0]: j for j in jobs}
+    tries = {idx: 0 for idx in by_idx}
+    finished: set = set()
+    live: dict = {}       # future -> idx
+    started: dict = {}    # future -> instant où il a été vu en cours d'exécution
+    tokens: dict = {}     # future -> jeton de démarrage (TTSWorkerPool.started_at)
+    delayed: list = []    # (instant de resoumission, idx)
+    stats = {"stalls": 0, "retries": 0, "errors": 0, "failed": 0}
+    # Un Executor quelconque ne signale pas le démarrage réel : repli sur running(),
+    # vrai dès l'entrée de la tâche dans la file d'appels
+    tracked = isinstance(ex, TTSWorkerPool)
+
+    def _submit(idx: int) -> None:
+        if tracked:
+            fut, token = ex.submit_tracked(tts_worker, by_idx[idx])
+            tokens[fut] = token
+        else:
+            fut = ex.submit(tts_worker, by_idx[idx])
+        live[fut] = idx
+
+    def _drop(fut) -> None:
+        started.pop(fut, None)
+        token = tokens.pop(fut, None)
+        if token:
+            ex.forget(token)
+
+    def _started_at(fut) -> Optional[float]:
+        if tracked:
+            return ex.started_at(tokens[fut])
+        if not fut.running():
+            return None
+        return started.setdefault(fut, time.time())
+
+    def _deliver(idx: int, res) -> None:
+        finished.add(idx)
+        on_result(res)
+
+    def _retry_or_fail(idx: int) -> None:
+        tries[idx] += 1
+        if tries[idx] > max_retries:
+            stats["failed"] += 1
+            _deliver(idx, _silent_result(by_idx[idx], opts))
+            return
+        stats["retries"] += 1
+        delay = min(RETRY_BACKOFF_MAX_S, RETRY_BACKOFF_S * (2 ** (tries[idx] - 1)))
+        delayed.append((time.monotonic() + delay, idx))
+
+    feed_open = feed is not None
+
+    try:
+        for idx in by_idx:
+            _submit(idx)
+
+        while feed_open or len(finished) < len(by_idx):
+            if feed_open:
+                # Sans tâche en cours, on attend la prochaine réplique sur le flux
+                new = feed(0.0 if (live or delayed) else POLL_S)
+                if new is None:
+                    feed_open = False
+                else:
+                    for job in new:
+                        if job[0] in by_idx:
+                            continue
+                        by_idx[job[0]] = job
+                        tries[job[0]] = 0
+                        _submit(job[0])
+
+            now = time.monotonic()
+            for item in [d for d in delayed if d[0] <= now]:
+                delayed.remove(item)
+                if item[1] not in finished:
+                    _submit(item[1])
+
+            if not live:
+                if not delayed:
+                    if feed_open:
+                        continue
+                    break
+                time.sleep(max(0.0, min(d[0] for d in delayed) - now))
+                continue
+
+            done_set, _ = wait(list(live), timeout=POLL_S, return_when=FIRST_COMPLETED)
+            for fut in done_set:
+                idx = live.pop(fut)
+                _drop(fut)
+                if idx in finished:
+                    continue
+                try:
+                    res = fut.result()
+                except Exception:
+                    stats["errors"] += 1
+                    _retry_or_fail(idx)
+                    continue
+                _deliver(idx, res)
+
+            # Délai par réplique : seules les tentatives réellement démarrées sont comptées
+            now = time.time()
+            stuck = []
+            for fut in list(live):
+                if fut.done():
+                    continue
+                at = _started_at(fut)
+                if at is not None and now - at > job_timeout_s:
+                    stuck.append(fut)
+            if not stuck:
+                continue
+
+            if stats["stalls"] == 0:
+                if ui:
+                    ui.message(t("tts_warn_stall", timeout=job_timeout_s))
+                else:
+                    log.warning(t("tts_warn_stall", timeout=job_timeout_s))
+            stats["stalls"] += len(stuck)
+            stuck_idx = [live[fut] for fut in stuck]
+            if tracked:
+                # Pool recyclé : les workers bloqués sont terminés, les autres répliques
+                # en cours repartent sur le pool neuf
+                others = [idx for fut, idx in live.items() if fut not in stuck]
+                for fut in list(live):
+                    _drop(fut)
+                live.clear()
+                ex.recycle()
+                for idx in others:
+                    if idx not in finished:
+                        _submit(idx)
+            else:
+                for fut in stuck:
+                    live.pop(fut)
+                    _drop(fut)
+            for idx in stuck_idx:
+                if idx not in finished:
+                    _retry_or_fail(idx)
+
+    finally:
+        if owned:
+            ex.shutdown(wait=False, cancel_futures=True)
+        else:
+            for fut in list(live):
+                fut.cancel()
+                _drop(fut)
+
+    return stats
+
+
 @log_time
 @log_call()
 def generate_dub_audio(
@@ -116,12 +348,29 @@ def generate_dub_audio(
     duration_limit_sec: Optional[int] = None,
     target_total_duration_ms: Optional[int] = None,
     ui: Optional[UIInterface] = None,
+    executor: Optional[Executor] = None,
+    manifest_key: Optional[str] = None,
+    subtitles: Optional[SubtitleTrack] = None,
+    line_feed: Optional[LineFeed] = None,
 ) -> str:
     """
     Génère la piste TTS alignée sur le SRT et retourne le chemin du WAV généré.
+    executor : pool de workers persistant (batch) à utiliser à la place d'un pool par vidéo.
+    manifest_key : identifiant de la vidéo pour le re-doublage incrémental
+    (opts.redub_manifest) ; par défaut le chemin du SRT.
+    subtitles : piste déjà parsée (et limitée en durée) par l'appelant ; sinon srt_file est lu.
+    line_feed : textes publiés au fil de la traduction (indice dans subtitles, texte) ;
+    subtitles ne fournit alors que les timings et chaque réplique part en synthèse dès
+    réception. srt_file peut ne pas encore exister (il sert de clé de manifeste).
     """
-    subtitles = parse_srt_file(srt_file, duration_limit_sec=duration_limit_sec)
+    if subtitles is None and line_feed is None:
+        subtitles = parse_srt_file(srt_file, duration_limit_sec=duration_limit_sec)
+    else:
+        subtitles = SubtitleTrack.from_tuples(subtitles)
     if not subtitles:
+        if line_feed is not None:
+            while line_feed.take(POLL_S) is not None:
+                pass
         AudioSegment.silent(duration=0).export(output_wav, format="wav")
         return output_wav
 
@@ -129,186 +378,255 @@ def generate_dub_audio(
     if normalize_engine(opts.tts_engine) == "gtts":
         opts = replace(opts, voice_id=_coerce_gtts_lang(opts.voice_id or "fr"))
 
-    jobs: List[Tuple[int, int, int, str, str, DubOptions]] = []
-    for idx, (start, end, text) in enumerate(subtitles):
-        jobs.append((idx, int(start * 1000), int(end * 1000), text, opts.voice_id, opts))
-
-    max_workers = min(20, max(1, cpu_count()))
-    results: List[Optional[Tuple[str, int, int]]] = [None] * len(jobs)
-    total = len(jobs)
-    done = 0
-    if ui:
-        ui.progress(0)
-    else:
-        log.info(t("tts_progress", pct=0, done=0, total=total))
-
-    FREEZE_TIMEOUT = 5
-
-    ex = ProcessPoolExecutor(max_workers=max_workers)
-    try:
-        fut_to_job = {ex.submit(tts_worker, j): j for j in jobs}
-        pending = set(fut_to_job.keys())
-
-        while pending:
-            done_set, pending = wait(pending, timeout=FREEZE_TIMEOUT, return_when=FIRST_COMPLETED)
-
-            if not done_set:
-                if ui:
-                    ui.message(t("tts_warn_freeze"))
-                else:
-                    log.warning(t("tts_warn_freeze"))
-                for fut in list(pending):
-                    job = fut_to_job[fut]
-                    try:
-                        fut.cancel()
-                    except Exception:
-                        pass
-                    res = tts_worker(job)
-                    if len(res) >= 5:
-                        idx, path, s_ms, e_ms, attempts = res[:5]
-                        rate = res[5] if len(res) >= 6 else getattr(opts, "min_rate_tts", 1.0)
-                    else:
-                        idx, path, s_ms, e_ms = res[:4]
-                        attempts = 1
-                        rate = getattr(opts, "min_rate_tts", 1.0)
-                    results[idx] = (path, s_ms, e_ms)
-                    done += 1
-                    pct = int(done * 100 / total)
-                    if DEBUG_TTS_ATTEMPTS:
-                        msg = f"[{pct:3d}%] - {attempts} essai(s) ({rate:.1f}x)"
-                        if ui:
-                            ui.message(msg)
-                        else:
-                            log.info(msg)
-                    else:
-                        if ui:
-                            ui.progress(pct)
-                pending.clear()
-                break
-
-            for fut in done_set:
-                job = fut_to_job[fut]
-                try:
-                    res = fut.result()
-                except Exception:
-                    res = tts_worker(job)
-                if len(res) >= 5:
-                    idx, path, s_ms, e_ms, attempts = res[:5]
-                    rate = res[5] if len(res) >= 6 else getattr(opts, "min_rate_tts", 1.0)
-                else:
-                    idx, path, s_ms, e_ms = res[:4]
-                    attempts = 1
-                    rate = getattr(opts, "min_rate_tts", 1.0)
-                results[idx] = (path, s_ms, e_ms)
-                done += 1
-                pct = int(done * 100 / total)
-                if DEBUG_TTS_ATTEMPTS:
-                    msg = f"[{pct:3d}%] - {attempts} essai(s) ({rate:.1f}x)"
-                    if ui:
-                        ui.message(msg)
-                    else:
-                        log.info(msg)
-                else:
-                    if ui:
-                        ui.progress(pct)
-
-    finally:
-        ex.shutdown(wait=False, cancel_futures=True)
-
-    first_path, _, _ = results[0]  # type: ignore
-    first_seg = AudioSegment.from_file(first_path)
-    target_sr = first_seg.frame_rate
-    target_ch = first_seg.channels
-    target_sw = first_seg.sample_width
-    if target_sw not in (1, 2, 4):
-        target_sw = 2
+    starts = subtitles.start_ms.tolist()
+    ends = subtitles.end_ms.tolist()
 
+    # Re-doublage incrémental : les lignes inchangées sont reprises du manifeste de la vidéo
+    manifest: Optional[RedubManifest] = None
+    if getattr(opts, "redub_manifest", False):
+        manifest = RedubManifest(manifest_key or srt_file)
+    jobs: List[Tuple[int, int, int, str, str, DubOptions]] = []
+    line_keys: Dict[int, str] = {}
+    cache_keys: Dict[int, str] = {}
+    reused: List[Tuple[int, str]] = []
+
+    def _prepare(idx: int, text: str):
+        """
+        Enregistre la réplique idx ; retourne son job, ou None si le segment est repris.
+        """
+        job = (idx, starts[idx], ends[idx], text, opts.voice_id, opts)
+        jobs.append(job)
+        if manifest is not None:
+            key = redub.line_key(opts, text, ends[idx] - starts[idx])
+            line_keys[idx] = key
+            if getattr(opts, "tts_cache", False):
+                # Clé sous laquelle le worker mettra le segment en cache (cf. tts_worker)
+                cache_keys[idx] = tts_cache.segment_key(
+                    normalize_engine(opts.tts_engine), opts.voice_id, text,
+                    getattr(opts, "min_rate_tts", 1.0), getattr(opts, "max_rate_tts", 1.8),
+                    ends[idx] - starts[idx], getattr(opts, "stretch_backend", None),
+                )
+            path = manifest.segment_for(key)
+            if path:
+                reused.append((idx, path))
+                return None
+        return job
+
+    to_run: List[Tuple[int, int, int, str, str, DubOptions]] = []
+    if line_feed is None:
+        for idx, text in enumerate(subtitles.texts):
+            job = _prepare(idx, text)
+            if job is not None:
+                to_run.append(job)
+
+    # Placement de chaque réplique dans la piste finale (offset appliqué, clamp à 0)
+    placements: List[Optional[Tuple[int, int, int]]] = []
     max_end_ms = 0
-    for (start, end, _text), _res in zip(subtitles, results):
-        s = int(start * 1000) + (opts.offset_ms or 0)
-        e = int(end * 1000) + (opts.offset_ms or 0)
-        if e <= 0:
-            continue
-        if s < 0:
-            s = 0
-        if e <= s:
-            continue
-        if e > max_end_ms:
-            max_end_ms = e
-
-    final_ms = target_total_duration_ms if (target_total_duration_ms is not None) else max_end_ms
-    final_ms = max(0, int(final_ms))
-
-    samples_total = int(math.ceil(final_ms * target_sr / 1000.0)) + 1
-    if samples_total <= 1:
-        AudioSegment.silent(duration=0).export(output_wav, format="wav")
-        for res in results:
-            if res:
-                path, _, _ = res
-                try:
-                    if path and os.path.exists(path):
-                        os.remove(path)
-                except Exception:
-                    pass
-        return output_wav
-
-    final_buf = np.zeros((samples_total, target_ch), dtype=np.int16)
-
-    tasks = []
-    for (start, end, _text), res in zip(subtitles, results):
-        path, _s_ms, _e_ms = res  # type: ignore
-        start_ms = int(start * 1000) + (opts.offset_ms or 0)
-        end_ms = int(end * 1000) + (opts.offset_ms or 0)
-
-        if end_ms <= 0:
-            continue
+    for sub_start_ms, sub_end_ms in zip(starts, ends):
+        start_ms = sub_start_ms + (opts.offset_ms or 0)
+        end_ms = sub_end_ms + (opts.offset_ms or 0)
         trim_lead = 0
         if start_ms < 0:
             trim_lead = -start_ms
             start_ms = 0
-        if end_ms <= start_ms:
+        if end_ms <= 0 or end_ms <= start_ms:
+            placements.append(None)
             continue
+        placements.append((start_ms, end_ms - start_ms, trim_lead))
+        if end_ms > max_end_ms:
+            max_end_ms = end_ms
 
-        target_ms = end_ms - start_ms
-        tasks.append((path, start_ms, target_ms, trim_lead))
-
-    def _worker_load_and_place(args):
-        path, start_ms, target_ms, trim_lead = args
-        arr = _load_segment_as_array(
-            path=path,
-            target_sr=target_sr,
-            target_ch=target_ch,
-            target_sw=target_sw,
-            trim_lead_ms=trim_lead,
-            target_ms=target_ms,
-        )
-        i0 = int((start_ms / 1000.0) * target_sr)
-        i1 = i0 + arr.shape[0]
-
-        if i0 >= samples_total:
-            return
-        if i1 > samples_total:
-            arr = arr[: samples_total - i0]
-            i1 = samples_total
+    final_ms = target_total_duration_ms if (target_total_duration_ms is not None) else max_end_ms
+    final_ms = max(0, int(final_ms))
 
-        if arr.size > 0:
-            final_buf[i0:i1, :] = arr
+    max_workers = default_tts_workers(getattr(opts, "tts_workers", 0))
+    total = len(subtitles)
+    done = 0
+    ran = len(to_run)
+    if ui:
+        ui.progress(0)
+    else:
+        log.info(t("tts_progress", pct=0, done=0, total=total))
+
+    cache_hits = 0
+    synth_lines = 0
+    synth_attempts = 0
 
+    # Assemblage au fil de l'eau : le format cible est celui du premier segment reçu,
+    # chaque segment est ensuite converti et posé dans final_buf par un pool de threads.
+    fmt: dict = {}
+    place_futs = []
     max_threads = min(32, max(1, cpu_count() * 2))
-    with ThreadPoolExecutor(max_workers=max_threads) as pool:
-        list(pool.map(_worker_load_and_place, tasks))
+    placer = ThreadPoolExecutor(max_workers=max_threads)
 
-    for res in results:
-        if not res:
-            continue
-        path, _, _ = res
+    def _place(idx: int, payload, keep: bool = False, store: bool = False) -> None:
         try:
-            if path and os.path.exists(path):
-                os.remove(path)
+            if store:
+                manifest.store(line_keys[idx], payload, cache_keys.get(idx))
+            spot = placements[idx]
+            if spot is None or fmt["samples_total"] <= 1:
+                return
+            start_ms, target_ms, trim_lead = spot
+            target_sr, target_ch = fmt["sr"], fmt["ch"]
+            if isinstance(payload, PcmSegment):
+                arr = _segment_to_array(
+                    payload.to_audio(), target_sr, target_ch, 2, trim_lead, target_ms
+                )
+            else:
+                arr = _load_segment_as_array(
+                    path=payload,
+                    target_sr=target_sr,
+                    target_ch=target_ch,
+                    target_sw=2,
+                    trim_lead_ms=trim_lead,
+                    target_ms=target_ms,
+                )
+            samples_total = fmt["samples_total"]
+            i0 = int((start_ms / 1000.0) * target_sr)
+            i1 = i0 + arr.shape[0]
+
+            if i0 >= samples_total:
+                return
+            if i1 > samples_total:
+                arr = arr[: samples_total - i0]
+                i1 = samples_total
+
+            if arr.size > 0:
+                fmt["buf"][i0:i1, :] = arr
+        finally:
+            if not keep:
+                _remove_payload(payload)
+
+    def _accept(idx: int, payload, keep: bool = False, store: bool = False) -> None:
+        nonlocal done
+        if not fmt:
+            sr, ch = _payload_format(payload)
+            fmt["sr"], fmt["ch"] = sr, ch
+            fmt["samples_total"] = int(math.ceil(final_ms * sr / 1000.0)) + 1
+            if fmt["samples_total"] > 1:
+                fmt["buf"] = np.zeros((fmt["samples_total"], ch), dtype=np.int16)
+        place_futs.append(placer.submit(_place, idx, payload, keep, store))
+
+        done += 1
+        if ui and not DEBUG_TTS_ATTEMPTS:
+            ui.progress(int(done * 100 / total))
+
+    def _on_result(res) -> None:
+        nonlocal cache_hits, synth_lines, synth_attempts
+        if len(res) >= 5:
+            idx, payload, s_ms, e_ms, attempts = res[:5]
+            rate = res[5] if len(res) >= 6 else getattr(opts, "min_rate_tts", 1.0)
+        else:
+            idx, payload, s_ms, e_ms = res[:4]
+            attempts = 1
+            rate = getattr(opts, "min_rate_tts", 1.0)
+        cached = len(res) >= 7 and bool(res[6])
+        if cached:
+            cache_hits += 1
+        elif attempts:
+            synth_lines += 1
+            synth_attempts += attempts
+        if len(res) >= 8:
+            rate_model.merge(res[7])
+
+        # Le silence de remplacement (réplique abandonnée) n'est pas conservé
+        _accept(idx, payload, store=manifest is not None and bool(attempts or cached))
+
+        if DEBUG_TTS_ATTEMPTS:
+            msg = f"[{int(done * 100 / total):3d}%] - {attempts} essai(s) ({rate:.1f}x)"
+            if ui:
+                ui.message(msg)
+            else:
+                log.info(msg)
+
+    seen: set = set()
+
+    def _more(timeout: float):
+        """
+        Répliques arrivées sur line_feed, converties en jobs (None : flux terminé).
+        """
+        nonlocal done, ran
+        items = line_feed.take(timeout)
+        if items is None:
+            return None
+        batch = []
+        for idx, text in items:
+            if not (0 <= idx < total) or idx in seen:
+                continue
+            seen.add(idx)
+            if not str(text or "").strip():
+                # Ligne vide après traduction : rien à synthétiser (comme au parsing du SRT)
+                done += 1
+                continue
+            job = _prepare(idx, text)
+            if job is None:
+                _accept(idx, reused[-1][1], keep=True)
+            else:
+                batch.append(job)
+        ran += len(batch)
+        return batch
+
+    engine = normalize_engine(opts.tts_engine)
+    edge_async = engine == "edge" and getattr(opts, "edge_async", False) and _edge_async_available()
+    try:
+        for idx, path in reused:
+            _accept(idx, path, keep=True)
+
+        if line_feed is not None:
+            if edge_async:
+                from add_dub.core.tts_edge_async import run_edge_jobs
+                run_edge_jobs([], opts, _on_result, feed=_more)
+            else:
+                pool_stats = _run_in_process_pool(
+                    [], _on_result, opts, ui=ui, max_workers=max_workers, executor=executor, feed=_more
+                )
+                if any(pool_stats.values()):
+                    log.info(t("tts_stall_stats", **pool_stats))
+        elif not to_run:
+            pass
+        elif edge_async:
+            from add_dub.core.tts_edge_async import run_edge_jobs
+            run_edge_jobs(to_run, opts, _on_result)
+        else:
+            pool_stats = _run_in_process_pool(
+                to_run, _on_result, opts, ui=ui, max_workers=max_workers, executor=executor
+            )
+            if any(pool_stats.values()):
+                log.info(t("tts_stall_stats", **pool_stats))
+    finally:
+        for f in place_futs:
+            try:
+                f.result()
+            except Exception:
+                pass
+        placer.shutdown(wait=True)
+
+    if manifest is not None:
+        if reused:
+            log.info(t("tts_redub_stats", reused=len(reused), total=total))
+        entries = [
+            manifest.entry(idx, text, start_ms, end_ms, line_keys[idx])
+            for idx, start_ms, end_ms, text, _v, _o in sorted(jobs)
+        ]
+        manifest.save([e for e in entries if e], prune=duration_limit_sec is None)
+
+    if engine == "onecore" and synth_lines:
+        log.info(t("tts_rate_stats", avg=synth_attempts / synth_lines, lines=synth_lines))
+        rate_model.save()
+
+    if getattr(opts, "tts_cache", False):
+        log.info(t("tts_cache_stats", hits=cache_hits, misses=ran - cache_hits, total=ran))
+    # Les segments du re-doublage vivent aussi dans tts_cache : même limite de taille
+    if getattr(opts, "tts_cache", False) or manifest is not None:
+        try:
+            tts_cache.prune(int(getattr(opts, "tts_cache_max_mb", 0) or 0) * 1024 * 1024)
         except Exception:
             pass
 
-    _export_int16_wav(final_buf, target_sr, target_ch, output_wav)
+    if "buf" not in fmt:
+        AudioSegment.silent(duration=0).export(output_wav, format="wav")
+        return output_wav
 
+    _export_int16_wav(fmt["buf"], fmt["sr"], fmt["ch"], output_wav)
 
     return output_wav
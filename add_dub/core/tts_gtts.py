@@ -1,9 +1,7 @@
 # add_dub/core/tts_gtts.py
 import io
 import os
-import shutil
 import tempfile
-import subprocess
 import string
 from typing import Optional, List, Dict
 
@@ -12,6 +10,7 @@ from pydub import AudioSegment
 
 # Même signature publique que tts.py / tts_edge.py pour rester plug-and-play
 from add_dub.core.options import DubOptions
+from add_dub.core import audio_utils, voice_catalog
 
 # Dépendances: gTTS + ffmpeg dans le PATH
 try:
@@ -43,17 +42,9 @@ def list_available_voices() -> List[Dict]:
     Retourne la liste des 'voix' gTTS. gTTS ne gère pas de timbres/voix différentes,
     uniquement des langues. On expose donc (id=code_lang, display_name, lang).
     """
-    # Essai dynamique si la lib le permet
-    if tts_langs is not None:
-        try:
-            langs: Dict[str, str] = tts_langs()  # ex: {"fr": "French", "en": "English", ...}
-            out = []
-            for code, name in sorted(langs.items(), key=lambda kv: kv[0].lower()):
-                out.append({"id": code, "display_name": f"{name} (gTTS)", "lang": code})
-            if out:
-                return out
-        except Exception:
-            pass
+    lst = voice_catalog.get_voices("gtts", _fetch_voices)
+    if lst:
+        return lst
 
     # Fallback minimal si indisponible
     return [
@@ -66,6 +57,23 @@ def list_available_voices() -> List[Dict]:
     ]
 
 
+def _fetch_voices() -> List[Dict]:
+    """
+    Listing brut via gtts.lang.tts_langs() (liste vide si indisponible).
+    """
+    # Essai dynamique si la lib le permet
+    if tts_langs is not None:
+        try:
+            langs: Dict[str, str] = tts_langs()  # ex: {"fr": "French", "en": "English", ...}
+            out = []
+            for code, name in sorted(langs.items(), key=lambda kv: kv[0].lower()):
+                out.append({"id": code, "display_name": f"{name} (gTTS)", "lang": code})
+            return out
+        except Exception:
+            pass
+    return []
+
+
 def is_valid_voice_id(voice_id: Optional[str]) -> bool:
     """
     Valide que 'voice_id' est un code de langue gTTS supporté (ex. 'fr', 'en', ...).
@@ -82,59 +90,6 @@ def is_valid_voice_id(voice_id: Optional[str]) -> bool:
 # -------------------------------------------------------------------
 # Outils audio
 # -------------------------------------------------------------------
-def _atempo_chain_for_factor(factor: float) -> list[str]:
-    """
-    Construit une chaîne de filtres atempo pour couvrir un facteur arbitraire > 0
-    en respectant la plage acceptée par ffmpeg (0.5..2.0 par maillon).
-    """
-    if factor <= 0:
-        return []
-    filters: list[str] = []
-    remaining = factor
-    while remaining < 0.5:
-        filters.append("atempo=0.5")
-        remaining /= 0.5
-    while remaining > 2.0:
-        filters.append("atempo=2.0")
-        remaining /= 2.0
-    if abs(remaining - 1.0) > 1e-6:
-        filters.append(f"atempo={remaining:.6f}")
-    return filters
-
-
-def _speed_change_with_ffmpeg(segment: AudioSegment, factor: float) -> AudioSegment:
-    """
-    Change la vitesse (ralentit/accélère) sans changer la hauteur via ffmpeg (filter atempo).
-    factor > 1.0 => plus rapide ; 0 < factor < 1.0 => plus lent.
-    Si factor ~ 1.0, renvoie segment tel quel.
-    """
-    if factor <= 0:
-        return segment
-    if abs(factor - 1.0) <= 1e-6:
-        return segment
-    if shutil.which("ffmpeg") is None:
-        raise RuntimeError("ffmpeg introuvable")
-
-    filters = _atempo_chain_for_factor(factor)
-    if not filters:
-        return segment
-    filt = ",".join(filters)
-
-    with tempfile.TemporaryDirectory(dir=io_fs.TMP_DIR) as td:
-        inp = os.path.join(td, "in.wav")
-        out = os.path.join(td, "out.wav")
-        segment.export(inp, format="wav")
-        cmd = [
-            "ffmpeg", "-y", "-hide_banner", "-loglevel", "error",
-            "-i", inp,
-            "-filter:a", filt,
-            "-vn",
-            out
-        ]
-        subprocess.run(cmd, check=True)
-        return AudioSegment.from_file(out)
-
-
 def _looks_like_silence(text: str) -> bool:
     """
     True si 'text' ne contient que espaces/ellipses/ponctuation/symboles.
@@ -240,10 +195,9 @@ def synthesize_tts_for_subtitle(
     Implémentation gTTS calquée sur tts_edge :
     1) Court-circuit SILENCE si texte vide/ellipses/ponctuation uniquement.
     2) Synthèse protégée (toute erreur → segment muet).
-    3) Si opts.min_rate_tts != 1.0 → post-traitement atempo (vitesse minimale globale).
-    4) Ajustement à target_duration_ms :
-       - si trop long → accélération supplémentaire, bornée par opts.max_rate_tts
-       - si trop court → padding silence
+    3) Un seul changement de vitesse : max(opts.min_rate_tts, durée brute / cible),
+       plafonné par opts.max_rate_tts.
+    4) Trim ou padding silence à target_duration_ms.
     """
     tgt = max(0, int(target_duration_ms))
 
@@ -259,48 +213,5 @@ def synthesize_tts_for_subtitle(
         # Réseau, quota, texte non supporté, etc. → silence propre
         return AudioSegment.silent(duration=tgt)
 
-    # 3) Vitesse minimale pilotée (post-traitement)
-    try:
-        base_rate = float(getattr(opts, "min_rate_tts", 1.0) or 1.0)
-    except Exception:
-        base_rate = 1.0
-
-    if base_rate > 0 and abs(base_rate - 1.0) > 1e-6:
-        try:
-            seg = _speed_change_with_ffmpeg(seg, base_rate)
-        except Exception:
-            # On continue avec la synthèse brute si atempo échoue
-            pass
-
-    # 4) Ajustement à la durée cible
-    cur = len(seg)
-
-    if tgt > 0 and cur > tgt:
-        # facteur d'accélération requis
-        needed_factor = cur / max(1, tgt)  # > 1.0
-        # plafond via max_rate_tts (par défaut 1.8 si non renseigné)
-        try:
-            max_rate = float(getattr(opts, "max_rate_tts", 1.8) or 1.8)
-        except Exception:
-            max_rate = 1.8
-        if max_rate < 1.0:
-            max_rate = 1.0  # sécurité: pas de plafond < 1 pour accélérer
-
-        factor = min(needed_factor, max_rate)
-
-        try:
-            sped = _speed_change_with_ffmpeg(seg, factor)
-            # Ajustement final exact
-            if len(sped) > tgt:
-                seg = sped[:tgt]
-            else:
-                seg = sped + AudioSegment.silent(duration=(tgt - len(sped)))
-        except Exception:
-            # Pas d'ffmpeg ou échec → trim direct
-            seg = seg[:tgt]
-    else:
-        # Padding si trop court
-        if cur < tgt:
-            seg = seg + AudioSegment.silent(duration=(tgt - cur))
-
-    return seg
+    # 3) + 4) Vitesse et ajustement à la durée cible (un seul passage)
+    return audio_utils.fit_to_target(seg, tgt, opts)
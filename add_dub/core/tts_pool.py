@@ -0,0 +1,130 @@
+# add_dub/core/tts_pool.py
+"""
+Pool de workers TTS persistant (batch).
+
+generate_dub_audio crée sinon un ProcessPoolExecutor par vidéo : chaque worker
+réimporte pydub/numpy/moteurs et reconstruit ses caches (synthétiseur OneCore,
+liste des voix, modèle de débit). Ici le pool est créé une fois par le runner batch,
+préchauffé (init_tts_worker) et transmis via Services.tts_executor : les caches
+par processus survivent d'une vidéo à l'autre.
+
+Si un worker meurt (BrokenProcessPool), le pool est recréé à la soumission suivante.
+Un worker bloqué (réplique qui ne rend jamais la main) ne peut pas être récupéré :
+recycle() termine les processus et repart sur un pool neuf. Les tâches soumises via
+submit_tracked signalent leur démarrage effectif (started_at) pour le calcul des délais.
+"""
+from __future__ import annotations
+
+import uuid
+import threading
+import multiprocessing
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import cpu_count
+from typing import Dict, Optional, Tuple
+
+from add_dub.workers import init_tts_worker, tracked_call
+
+
+def default_tts_workers(requested: Optional[int] = None) -> int:
+    """
+    Nombre de processus TTS : valeur demandée, sinon min(20, nb de CPU).
+    """
+    return int(requested or 0) or min(20, max(1, cpu_count()))
+
+
+class TTSWorkerPool(Executor):
+    """
+    ProcessPoolExecutor longue durée, préchauffé pour un moteur TTS donné.
+    S'utilise comme un Executor (submit / shutdown / with).
+    """
+
+    def __init__(self, engine: str, max_workers: Optional[int] = None):
+        self.engine = engine
+        self.max_workers = default_tts_workers(max_workers)
+        self._lock = threading.Lock()
+        self._ex: Optional[ProcessPoolExecutor] = None
+        # Démarrages signalés par les workers : une file par génération de pool
+        # (celle d'un pool recyclé peut avoir été laissée incohérente par un processus tué)
+        self._starts_q = None
+        self._starts: Dict[str, float] = {}
+
+    def _executor(self) -> ProcessPoolExecutor:
+        if self._ex is None:
+            self._starts_q = multiprocessing.SimpleQueue()
+            self._ex = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=init_tts_worker,
+                initargs=(self.engine, self._starts_q),
+            )
+        return self._ex
+
+    def _discard(self, terminate: bool = False) -> None:
+        ex, self._ex = self._ex, None
+        self._starts_q = None
+        self._starts.clear()
+        if ex is None:
+            return
+        if terminate:
+            for proc in list((getattr(ex, "_processes", None) or {}).values()):
+                try:
+                    proc.terminate()
+                except Exception:
+                    pass
+        ex.shutdown(wait=False, cancel_futures=True)
+
+    def warm(self) -> None:
+        """
+        Démarre les workers en tâche de fond (pendant l'extraction de la 1re vidéo).
+        """
+        self.submit(init_tts_worker, self.engine)
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        with self._lock:
+            try:
+                return self._executor().submit(fn, *args, **kwargs)
+            except BrokenProcessPool:
+                # Un worker est mort : on repart sur un pool neuf
+                self._discard()
+                return self._executor().submit(fn, *args, **kwargs)
+
+    def submit_tracked(self, fn, *args) -> Tuple[Future, str]:
+        """
+        Comme submit, avec un jeton pour started_at.
+        """
+        token = uuid.uuid4().hex
+        return self.submit(tracked_call, token, fn, *args), token
+
+    def started_at(self, token: str) -> Optional[float]:
+        """
+        Instant (time.time) où un worker a réellement démarré la tâche, None sinon.
+        """
+        with self._lock:
+            q = self._starts_q
+            try:
+                while q is not None and not q.empty():
+                    tok, _pid, at = q.get()
+                    self._starts[tok] = at
+            except Exception:
+                pass
+            return self._starts.get(token)
+
+    def forget(self, token: str) -> None:
+        with self._lock:
+            self._starts.pop(token, None)
+
+    def recycle(self) -> None:
+        """
+        Termine les workers (y compris bloqués) ; le prochain submit démarre un pool
+        neuf. Les tâches en cours échouent (BrokenProcessPool) : à resoumettre.
+        """
+        with self._lock:
+            self._discard(terminate=True)
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        with self._lock:
+            if self._ex is not None:
+                self._ex.shutdown(wait=wait, cancel_futures=cancel_futures)
+                self._ex = None
+            self._starts_q = None
+            self._starts.clear()
@@ -0,0 +1,106 @@
+# add_dub/core/voice_catalog.py
+"""
+Catalogue des voix par moteur, mis en cache :
+  - en mémoire (une seule lecture par processus),
+  - sur disque (~/.cache/add_dub/voices/<moteur>.json) avec une durée de validité.
+
+Les moteurs (tts.py, tts_edge.py, tts_gtts.py) fournissent leur fonction de listing
+« brute » ; tts_registry.list_voices_for_engine et les is_valid_voice_id passent tous
+par ici, ce qui évite un aller-retour réseau (Edge) ou WinRT (OneCore) par réplique.
+"""
+from __future__ import annotations
+
+import os
+import json
+import time
+import uuid
+from typing import Callable, Dict, List, Optional
+
+from add_dub.config import cfg
+from add_dub.io.fs import join_cache
+
+_MEMO: Dict[str, List[Dict]] = {}
+# Catalogue vide (échec réseau, WinRT absent) : pas de nouvel essai avant cette échéance
+EMPTY_RETRY_S = 60.0
+_EMPTY_UNTIL: Dict[str, float] = {}
+
+
+def _catalog_path(engine: str) -> str:
+    return join_cache("voices", f"{engine}.json")
+
+
+def _read_disk(engine: str, ttl_sec: float) -> Optional[List[Dict]]:
+    path = _catalog_path(engine)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except Exception:
+        return None
+    fetched_at = float(data.get("fetched_at", 0) or 0)
+    voices = data.get("voices") or []
+    if not voices or (time.time() - fetched_at) > ttl_sec:
+        return None
+    return voices
+
+
+def _write_disk(engine: str, voices: List[Dict]) -> None:
+    path = _catalog_path(engine)
+    tmp = f"{path}.{uuid.uuid4().hex}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"fetched_at": time.time(), "voices": voices}, f, ensure_ascii=False)
+        os.replace(tmp, path)
+    except Exception:
+        try:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+        except Exception:
+            pass
+
+
+def get_voices(engine: str, fetch: Callable[[], List[Dict]], ttl_sec: Optional[float] = None) -> List[Dict]:
+    """
+    Retourne le catalogue [{"id","display_name","lang"}, ...] du moteur.
+    Ordre : mémoire du processus > fichier disque encore valide > fetch() (puis persistance).
+    Un catalogue vide n'est jamais écrit sur disque (échec réseau, WinRT absent, ...)
+    ni gardé en mémoire : il est seulement resservi pendant EMPTY_RETRY_S, puis
+    fetch() est retenté.
+    """
+    if engine in _MEMO:
+        return _MEMO[engine]
+    if time.monotonic() < _EMPTY_UNTIL.get(engine, 0.0):
+        return []
+
+    if ttl_sec is None:
+        ttl_sec = float(getattr(cfg, "VOICE_CACHE_TTL_H", 24)) * 3600.0
+
+    voices = _read_disk(engine, ttl_sec) if ttl_sec > 0 else None
+    if voices is None:
+        try:
+            voices = fetch() or []
+        except Exception:
+            voices = []
+        if voices and ttl_sec > 0:
+            _write_disk(engine, voices)
+
+    if voices:
+        _MEMO[engine] = voices
+        _EMPTY_UNTIL.pop(engine, None)
+    else:
+        _EMPTY_UNTIL[engine] = time.monotonic() + EMPTY_RETRY_S
+    return voices
+
+
+def invalidate(engine: Optional[str] = None) -> None:
+    """
+    Oublie le catalogue (mémoire + disque) d'un moteur, ou de tous si engine est None.
+    """
+    engines = [engine] if engine else list(_MEMO.keys()) + ["onecore", "edge", "gtts"]
+    for eng in set(engines):
+        _MEMO.pop(eng, None)
+        _EMPTY_UNTIL.pop(eng, None)
+        try:
+            os.remove(_catalog_path(eng))
+        except Exception:
+            pass
@@ -98,7 +98,14 @@ TRANSLATIONS = {
         "opt_bitrate": "Bitrate",
         "ui_invalid_value": "Valeur invalide, on garde le défaut.",
         "tts_progress": "\rTTS: {pct}% [{done}/{total}]",
-        "tts_warn_freeze": "\n[WARN] Aucune avancée TTS. Relance synchrone des segments restants...",
+        "tts_warn_stall": "\n[WARN] Réplique TTS bloquée depuis plus de {timeout:.0f} s : relance sur un autre worker...",
+        "tts_stall_stats": "TTS : {stalls} blocage(s), {retries} relance(s), {errors} erreur(s) de worker, {failed} réplique(s) remplacée(s) par du silence.",
+        "tts_edge_stats": "Edge TTS : {retries} relance(s), {timeouts} délai(s) dépassé(s), {throttled} refus (429), {failed} réplique(s) remplacée(s) par du silence.",
+        "tts_edge_fetch_failed": "[WARN] Edge TTS : réplique {idx} abandonnée après plusieurs essais, remplacée par du silence.",
+        "tts_edge_decode_failed": "[WARN] Edge TTS : audio de la réplique {idx} illisible ({err}), remplacé par du silence.",
+        "tts_redub_stats": "Re-doublage incrémental : {reused}/{total} réplique(s) reprise(s) sans nouvelle synthèse.",
+        "tts_cache_stats": "Cache TTS : {hits} segment(s) réutilisé(s), {misses} synthétisé(s) sur {total}.",
+        "tts_rate_stats": "OneCore : {avg:.2f} synthèse(s) par réplique en moyenne ({lines} réplique(s)).",
         "sub_mkvtoolnix_required": "MKVToolNix requis pour identifier les pistes (mkvmerge).",
         "sub_no_tracks": "Aucune piste de sous-titres intégrée.",
         "sub_extract_text_success": "SRT extrait (texte) -> {path}",
@@ -119,6 +126,7 @@ TRANSLATIONS = {
         "pipeline_trans_reusing": " -> Réutilisation du fichier existant.",
         "pipeline_trans_done": " -> SRT traduit : {path}",
         "trans_log_start": "Traduction de {count} sous-titres vers {target} (source={source})...",
+        "trans_log_memory": "Mémoire de traduction : {hits}/{total} lignes déjà connues ({pct}%).",
         "trans_log_progress": "Progression traduction : {pct}%",
         "trans_log_completed": "Traduction terminée.",
         "trans_err_subprocess": "Le sous-processus de traduction a échoué (code {code})",
@@ -134,6 +142,7 @@ TRANSLATIONS = {
         "help_tts_engine": "Moteur TTS à utiliser (par défaut: options.conf → effective).",
         "help_audio_index": "Index global FFmpeg de la piste audio source (ffprobe->streams[index]).",
         "help_voice": "Identifiant de la voix TTS à utiliser (optionnel).",
+        "help_edge_concurrency": "Edge TTS : nombre de requêtes simultanées (planificateur asynchrone).",
         "help_sub": "Source des sous-titres: auto (défaut), srt, mkv, mkv:N (ex. mkv:4).",
         "help_offset_ms": "Décalage global des sous-titres/voix (ms).",
         "help_offset_video_ms": "Décalage de la vidéo (ms) appliqué dans le mux final.",
@@ -150,8 +159,16 @@ TRANSLATIONS = {
         "help_output_dir": "Dossier de sortie (défaut: ./output).",
         "help_overwrite": "Écrase les sorties existantes si présent.",
         "help_skip_existing": "Saute les vidéos dont le fichier de sortie existe déjà (évite de refaire le TTS).",
+        "help_resume": "Reprend les vidéos interrompues : saute les étapes déjà terminées (extraction, SRT, traduction, TTS, ducking) dont les entrées n'ont pas changé.",
+        "pipeline_resume_skip": "[REPRISE] Étape « {stage} » déjà faite, entrées inchangées : sautée.",
         "help_dry_run": "Montre ce qui serait fait sans écrire les fichiers.",
+        "help_jobs": "Batch : nombre de vidéos traitées en parallèle (1 = séquentiel).",
+        "help_ffmpeg_jobs": "Batch : nombre maximal de processus ffmpeg simultanés.",
+        "help_tts_jobs": "Batch : nombre de vidéos en synthèse TTS simultanément.",
+        "sched_stage_failed": "Étape {stage} en échec : {err}",
+        "cli_batch_summary": "Batch terminé : {ok} réussie(s), {failed} en échec.",
         "help_limit_duration": "Limite la durée traitée (tests rapides).",
+        "help_no_tts_cache": "Désactive le cache disque des segments TTS (re-synthétise toutes les répliques).",
         "grp_io": "Entrée / Sortie",
         "grp_audio": "Configuration Audio",
         "grp_sub": "Sous-titres",
@@ -261,7 +278,14 @@ TRANSLATIONS = {
         "opt_bitrate": "Bitrate",
         "ui_invalid_value": "Invalid value, keeping default.",
         "tts_progress": "\rTTS: {pct}% [{done}/{total}]",
-        "tts_warn_freeze": "\n[WARN] No TTS progress. Synchronous relaunch of remaining segments...",
+        "tts_warn_stall": "\n[WARN] TTS line stuck for more than {timeout:.0f} s: retrying on another worker...",
+        "tts_stall_stats": "TTS: {stalls} stall(s), {retries} retry(ies), {errors} worker error(s), {failed} line(s) replaced with silence.",
+        "tts_edge_stats": "Edge TTS: {retries} retry(ies), {timeouts} timeout(s), {throttled} refusal(s) (429), {failed} line(s) replaced with silence.",
+        "tts_edge_fetch_failed": "[WARN] Edge TTS: line {idx} abandoned after several attempts, replaced with silence.",
+        "tts_edge_decode_failed": "[WARN] Edge TTS: audio for line {idx} could not be decoded ({err}), replaced with silence.",
+        "tts_redub_stats": "Incremental re-dub: {reused}/{total} line(s) reused without new synthesis.",
+        "tts_cache_stats": "TTS cache: {hits} segment(s) reused, {misses} synthesized out of {total}.",
+        "tts_rate_stats": "OneCore: {avg:.2f} synthesis pass(es) per line on average ({lines} line(s)).",
         "sub_mkvtoolnix_required": "MKVToolNix required to identify tracks (mkvmerge).",
         "sub_no_tracks": "No embedded subtitle tracks.",
         "sub_extract_text_success": "SRT extracted (text) -> {path}",
@@ -282,6 +306,7 @@ TRANSLATIONS = {
         "pipeline_trans_reusing": " -> Reusing existing file.",
         "pipeline_trans_done": " -> SRT translated: {path}",
         "trans_log_start": "Translating {count} subtitles to {target} (source={source})...",
+        "trans_log_memory": "Translation memory: {hits}/{total} lines already known ({pct}%).",
         "trans_log_progress": "Translation progress: {pct}%",
         "trans_log_completed": "Translation completed.",
         "trans_err_subprocess": "Translation subprocess failed (code {code})",
@@ -297,6 +322,7 @@ TRANSLATIONS = {
         "help_tts_engine": "TTS engine to use (default: options.conf → effective).",
         "help_audio_index": "Global FFmpeg index of source audio track (ffprobe->streams[index]).",
         "help_voice": "TTS voice identifier to use (optional).",
+        "help_edge_concurrency": "Edge TTS: number of concurrent requests (async scheduler).",
         "help_sub": "Subtitle source: auto (default), srt, mkv, mkv:N (e.g. mkv:4).",
         "help_offset_ms": "Global subtitle/voice offset (ms).",
         "help_offset_video_ms": "Video offset (ms) applied in final mux.",
@@ -313,8 +339,16 @@ TRANSLATIONS = {
         "help_output_dir": "Output folder (default: ./output).",
         "help_overwrite": "Overwrite existing outputs if present.",
         "help_skip_existing": "Skip videos whose output file already exists (avoids regenerating TTS).",
+        "help_resume": "Resume interrupted videos: skip stages already completed (extraction, SRT, translation, TTS, ducking) whose inputs are unchanged.",
+        "pipeline_resume_skip": "[RESUME] Stage '{stage}' already done with unchanged inputs: skipped.",
         "help_dry_run": "Show what would be done without writing files.",
+        "help_jobs": "Batch: number of videos processed in parallel (1 = sequential).",
+        "help_ffmpeg_jobs": "Batch: maximum number of concurrent ffmpeg processes.",
+        "help_tts_jobs": "Batch: number of videos in TTS synthesis at the same time.",
+        "sched_stage_failed": "Stage {stage} failed: {err}",
+        "cli_batch_summary": "Batch finished: {ok} succeeded, {failed} failed.",
         "help_limit_duration": "Limit processed duration (quick tests).",
+        "help_no_tts_cache": "Disable the on-disk TTS segment cache (re-synthesize every line).",
         "grp_io": "Input / Output",
         "grp_audio": "Audio Configuration",
         "grp_sub": "Subtitles",
@@ -424,7 +458,6 @@ TRANSLATIONS = {
         "opt_bitrate": "Tasa de bits",
         "ui_invalid_value": "Valor no válido, manteniendo el valor predeterminado.",
         "tts_progress": "\rTTS: {pct}% [{done}/{total}]",
-        "tts_warn_freeze": "\n[WARN] Sin progreso TTS. Relanzamiento síncrono de segmentos restantes...",
         "sub_mkvtoolnix_required": "Se requiere MKVToolNix para identificar pistas (mkvmerge).",
         "sub_no_tracks": "No hay pistas de subtítulos integradas.",
         "sub_extract_text_success": "SRT extraído (texto) -> {path}",
@@ -585,7 +618,6 @@ TRANSLATIONS = {
         "opt_bitrate": "Bitrate",
         "ui_invalid_value": "Ungültiger Wert, Standard wird beibehalten.",
         "tts_progress": "\rTTS: {pct}% [{done}/{total}]",
-        "tts_warn_freeze": "\n[WARN] Kein TTS-Fortschritt. Synchroner Neustart der verbleibenden Segmente...",
         "sub_mkvtoolnix_required": "MKVToolNix erforderlich, um Spuren zu identifizieren (mkvmerge).",
         "sub_no_tracks": "Keine eingebetteten Untertitelspuren.",
         "sub_extract_text_success": "SRT extrahiert (Text) -> {path}",
@@ -746,7 +778,6 @@ TRANSLATIONS = {
         "opt_bitrate": "Bitrate",
         "ui_invalid_value": "Valore non valido, mantengo il default.",
         "tts_progress": "\rTTS: {pct}% [{done}/{total}]",
-        "tts_warn_freeze": "\n[WARN] Nessun progresso TTS. Rilancio sincrono dei segmenti rimanenti...",
         "sub_mkvtoolnix_required": "MKVToolNix richiesto per identificare le tracce (mkvmerge).",
         "sub_no_tracks": "Nessuna traccia di sottotitoli integrata.",
         "sub_extract_text_success": "SRT estratto (testo) -> {path}",
@@ -907,7 +938,6 @@ TRANSLATIONS = {
         "opt_bitrate": "ビットレート",
         "ui_invalid_value": "無効な値です。デフォルトを保持します。",
         "tts_progress": "\rTTS: {pct}% [{done}/{total}]",
-        "tts_warn_freeze": "\n[警告] TTSの進行がありません。残りのセグメントを同期的に再実行します...",
         "sub_mkvtoolnix_required": "トラックを識別するにはMKVToolNixが必要です (mkvmerge)。",
         "sub_no_tracks": "埋め込み字幕トラックがありません。",
         "sub_extract_text_success": "SRT抽出 (テキスト) -> {path}",
@@ -1016,7 +1046,6 @@ TRANSLATIONS = {
         "opt_bitrate": "Bitrate",
         "ui_invalid_value": "Valor inválido, mantendo o padrão.",
         "tts_progress": "\rTTS: {pct}% [{done}/{total}]",
-        "tts_warn_freeze": "\n[AVISO] Sem progresso TTS. Reinício síncrono dos segmentos restantes...",
         "sub_mkvtoolnix_required": "MKVToolNix necessário para identificar faixas (mkvmerge).",
         "sub_no_tracks": "Nenhuma faixa de legenda incorporada.",
         "sub_extract_text_success": "SRT extraído (texto) -> {path}",
@@ -1176,7 +1205,6 @@ TRANSLATIONS = {
         "opt_bitrate": "Bitrate",
         "ui_invalid_value": "Ongeldige waarde, standaard behouden.",
         "tts_progress": "\rTTS: {pct}% [{done}/{total}]",
-        "tts_warn_freeze": "\n[WAARSCHUWING] Geen TTS voortgang. Synchrone herstart van resterende segmenten...",
         "sub_mkvtoolnix_required": "MKVToolNix vereist om sporen te identificeren (mkvmerge).",
         "sub_no_tracks": "Geen ingesloten ondertitelsporen.",
         "sub_extract_text_success": "SRT geëxtraheerd (tekst) -> {path}",
@@ -1336,7 +1364,6 @@ TRANSLATIONS = {
         "opt_bitrate": "Bitrate",
         "ui_invalid_value": "Nieprawidłowa wartość, zachowano domyślną.",
         "tts_progress": "\rTTS: {pct}% [{done}/{total}]",
-        "tts_warn_freeze": "\n[OSTRZEŻENIE] Brak postępu TTS. Synchroniczne ponowne uruchomienie pozostałych segmentów...",
         "sub_mkvtoolnix_required": "Wymagany MKVToolNix do identyfikacji ścieżek (mkvmerge).",
         "sub_no_tracks": "Brak osadzonych ścieżek napisów.",
         "sub_extract_text_success": "SRT wyodrębnione (tekst) -> {path}",
@@ -1496,7 +1523,6 @@ TRANSLATIONS = {
         "opt_bitrate": "Битрейт",
         "ui_invalid_value": "Неверное значение, сохраняется по умолчанию.",
         "tts_progress": "\rTTS: {pct}% [{done}/{total}]",
-        "tts_warn_freeze": "\n[ПРЕДУПРЕЖДЕНИЕ] Нет прогресса TTS. Синхронный перезапуск оставшихся сегментов...",
         "sub_mkvtoolnix_required": "Требуется MKVToolNix для идентификации дорожек (mkvmerge).",
         "sub_no_tracks": "Нет встроенных дорожек субтитров.",
         "sub_extract_text_success": "SRT извлечен (текст) -> {path}",
@@ -1656,7 +1682,6 @@ TRANSLATIONS = {
         "opt_bitrate": "Бітрейт",
         "ui_invalid_value": "Невірне значення, зберігається за замовчуванням.",
         "tts_progress": "\rTTS: {pct}% [{done}/{total}]",
-        "tts_warn_freeze": "\n[ПОПЕРЕДЖЕННЯ] Немає прогресу TTS. Синхронний перезапуск сегментів, що залишилися...",
         "sub_mkvtoolnix_required": "Потрібен MKVToolNix для ідентифікації доріжок (mkvmerge).",
         "sub_no_tracks": "Немає вбудованих доріжок субтитрів.",
         "sub_extract_text_success": "SRT вилучено (текст) -> {path}",
@@ -1816,7 +1841,6 @@ TRANSLATIONS = {
         "opt_bitrate": "Bit hızı",
         "ui_invalid_value": "Geçersiz değer, varsayılan korunuyor.",
         "tts_progress": "\rTTS: {pct}% [{done}/{total}]",
-        "tts_warn_freeze": "\n[UYARI] TTS ilerlemesi yok. Kalan segmentlerin senkron yeniden başlatılması...",
         "sub_mkvtoolnix_required": "Parçaları tanımlamak için MKVToolNix gerekli (mkvmerge).",
         "sub_no_tracks": "Gömülü altyazı parçası yok.",
         "sub_extract_text_success": "SRT çıkarıldı (metin) -> {path}",
@@ -1976,7 +2000,6 @@ TRANSLATIONS = {
         "opt_bitrate": "Bithastighet",
         "ui_invalid_value": "Ogiltigt värde, behåller standard.",
         "tts_progress": "\rTTS: {pct}% [{done}/{total}]",
-        "tts_warn_freeze": "\n[VARNING] Ingen TTS-framsteg. Synkron omstart av återstående segment...",
         "sub_mkvtoolnix_required": "MKVToolNix krävs för att identifiera spår (mkvmerge).",
         "sub_no_tracks": "Inga inbäddade undertextspår.",
         "sub_extract_text_success": "SRT extraherad (text) -> {path}",
@@ -2136,7 +2159,6 @@ TRANSLATIONS = {
         "opt_bitrate": "Bitrate",
         "ui_invalid_value": "Neplatná hodnota, ponechávám výchozí.",
         "tts_progress": "\rTTS: {pct}% [{done}/{total}]",
-        "tts_warn_freeze": "\n[VAROVÁNÍ] Žádný postup TTS. Synchronní restart zbývajících segmentů...",
         "sub_mkvtoolnix_required": "Vyžadován MKVToolNix pro identifikaci stop (mkvmerge).",
         "sub_no_tracks": "Žádné vložené stopy titulků.",
         "sub_extract_text_success": "SRT extrahováno (text) -> {path}",
@@ -2296,7 +2318,6 @@ TRANSLATIONS = {
         "opt_bitrate": "Bitrate",
         "ui_invalid_value": "Μη έγκυρη τιμή, διατήρηση προεπιλογής.",
         "tts_progress": "\rTTS: {pct}% [{done}/{total}]",
-        "tts_warn_freeze": "\n[ΠΡΟΕΙΔΟΠΟΙΗΣΗ] Καμία πρόοδος TTS. Σύγχρονη επανεκκίνηση των υπόλοιπων τμημάτων...",
         "sub_mkvtoolnix_required": "Απαιτείται MKVToolNix για την αναγνώριση κομματιών (mkvmerge).",
         "sub_no_tracks": "Δεν υπάρχουν ενσωματωμένα κομμάτια υποτίτλων.",
         "sub_extract_text_success": "SRT εξήχθη (κείμενο) -> {path}",
@@ -2456,7 +2477,6 @@ TRANSLATIONS = {
         "opt_bitrate": "比特率",
         "ui_invalid_value": "无效值，保持默认。",
         "tts_progress": "\rTTS: {pct}% [{done}/{total}]",
-        "tts_warn_freeze": "\n[警告] TTS 无进度。同步重新启动剩余片段...",
         "sub_mkvtoolnix_required": "需要 MKVToolNix 来识别轨道 (mkvmerge)。",
         "sub_no_tracks": "没有嵌入的字幕轨道。",
         "sub_extract_text_success": "SRT 已提取 (文本) -> {path}",
@@ -2616,7 +2636,6 @@ TRANSLATIONS = {
         "opt_bitrate": "معدل البت",
         "ui_invalid_value": "قيمة غير صالحة، الاحتفاظ بالافتراضي.",
         "tts_progress": "\rTTS: {pct}% [{done}/{total}]",
-        "tts_warn_freeze": "\n[تحذير] لا يوجد تقدم في TTS. إعادة تشغيل متزامن للمقاطع المتبقية...",
         "sub_mkvtoolnix_required": "مطلوب MKVToolNix لتحديد المسارات (mkvmerge).",
         "sub_no_tracks": "لا توجد مسارات ترجمة مضمنة.",
         "sub_extract_text_success": "تم استخراج SRT (نص) -> {path}",
@@ -2776,7 +2795,6 @@ TRANSLATIONS = {
         "opt_bitrate": "비트레이트",
         "ui_invalid_value": "잘못된 값, 기본값 유지.",
         "tts_progress": "\rTTS: {pct}% [{done}/{total}]",
-        "tts_warn_freeze": "\n[경고] TTS 진행 상황 없음. 남은 세그먼트의 동기 재시작...",
         "sub_mkvtoolnix_required": "트랙을 식별하려면 MKVToolNix 가 필요합니다 (mkvmerge).",
         "sub_no_tracks": "내장된 자막 트랙이 없습니다.",
         "sub_extract_text_success": "SRT 추출됨 (텍스트) -> {path}",
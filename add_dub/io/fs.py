@@ -26,6 +26,9 @@ TMP_DIR = os.path.join(ROOT, _DEF_TMP_DIR)
 # Dossier SRT **fixe** à la racine (non configurable)
 SRT_DIR = os.path.join(ROOT, _DEF_SRT_DIR)
 
+# Caches persistants entre exécutions (modèles, segments TTS, ...)
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "add_dub")
+
 # Auto-injection des sous-dossiers tools/ dans le PATH (ffmpeg, mkvmerge, etc.)
 for _tp in [
     os.path.join(ROOT, "tools", "ffmpeg", "bin"),
@@ -120,3 +123,7 @@ def join_tmp(path: str) -> str:
 
 def join_srt(filename: str) -> str:
     return os.path.join(SRT_DIR, filename)
+
+
+def join_cache(*parts: str) -> str:
+    return os.path.join(CACHE_DIR, *parts)
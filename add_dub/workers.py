@@ -1,64 +1,173 @@
 # add_dub/workers.py
 import os
+import time
 import uuid
+from dataclasses import dataclass
+
+from pydub import AudioSegment
+
 import add_dub.io.fs as io_fs
+from add_dub.core import rate_model, tts_cache
 from add_dub.core.tts_registry import normalize_engine
 from add_dub.i18n import t
 
+
+@dataclass(frozen=True)
+class PcmSegment:
+    """
+    Segment audio brut (PCM entrelacé) renvoyé par un worker en mode tts_handoff="pcm" :
+    évite l'aller-retour WAV dans TMP_DIR (écriture, relecture, suppression).
+    """
+    data: bytes
+    frame_rate: int
+    channels: int
+    sample_width: int
+
+    @classmethod
+    def from_audio(cls, seg: AudioSegment) -> "PcmSegment":
+        if seg.sample_width != 2:
+            seg = seg.set_sample_width(2)
+        return cls(seg.raw_data, seg.frame_rate, seg.channels, seg.sample_width)
+
+    def to_audio(self) -> AudioSegment:
+        return AudioSegment(
+            data=self.data,
+            sample_width=self.sample_width,
+            frame_rate=self.frame_rate,
+            channels=self.channels,
+        )
+
+
+# File des démarrages de tâches (cf. tracked_call), fournie par TTSWorkerPool
+_STARTS = None
+
+
+def init_tts_worker(engine: str, starts=None) -> None:
+    """
+    Initialiseur des workers du pool persistant : importe le moteur et remplit
+    ses caches de processus (synthétiseur et voix OneCore, catalogue, modèle de débit).
+    starts : file où tracked_call signale le démarrage effectif de chaque tâche.
+    Idempotent ; toute erreur est ignorée (le worker retombera sur le chemin normal).
+    """
+    global _STARTS
+    if starts is not None:
+        _STARTS = starts
+    engine = normalize_engine(engine)
+    try:
+        if engine == "edge":
+            from add_dub.core import tts_edge  # noqa: F401
+        elif engine == "gtts":
+            from add_dub.core import tts_gtts  # noqa: F401
+        else:
+            from add_dub.core import tts
+            tts._get_synth()
+            tts._get_voice_list()
+            tts.list_available_voices()
+        rate_model.predict_rate(None, "", 0, 1.0, 1.0)
+    except Exception:
+        pass
+
+
+def tracked_call(token: str, fn, *args):
+    """
+    Exécute fn(*args) après avoir signalé (token, pid, instant) au parent : le délai
+    d'une tâche est compté à partir de son démarrage réel dans un worker, pas de son
+    entrée dans la file d'appels du pool.
+    """
+    if _STARTS is not None:
+        try:
+            _STARTS.put((token, os.getpid(), time.time()))
+        except Exception:
+            pass
+    return fn(*args)
+
+
+def _unpack_synth_result(res, opts):
+    """
+    Normalise le retour des moteurs : AudioSegment seul, (seg, attempts) ou (seg, attempts, rate).
+    """
+    if isinstance(res, tuple):
+        if len(res) == 3:
+            seg, attempts, rate = res
+        elif len(res) == 2:
+            seg, attempts = res
+            rate = getattr(opts, "min_rate_tts", 1.0)
+        else:
+            seg, attempts, rate = res[0], 1, getattr(opts, "min_rate_tts", 1.0)
+    else:
+        seg, attempts, rate = res, 1, getattr(opts, "min_rate_tts", 1.0)
+    return seg, attempts, rate
+
+
 def tts_worker(args):
     """
     args: (idx, start_ms, end_ms, text, voice_id, opts)
     - On choisit le moteur depuis opts.tts_engine (fallback 'onecore').
+    - Si opts.tts_cache : on consulte d'abord le cache disque des segments.
     - On tente la synthèse avec ce moteur.
     - En cas d'échec (exception), on bascule en **fallback** OneCore + voix par défaut système.
+    Retour : (idx, payload, start_ms, end_ms, attempts, rate, cached, rate_obs)
+      payload = PcmSegment (opts.tts_handoff == "pcm") ou chemin d'un WAV dans TMP_DIR.
+      rate_obs = observations du modèle de débit OneCore à fusionner côté parent.
     """
     idx, start_ms, end_ms, text, voice_id, opts = args
-    
+
     engine = normalize_engine(getattr(opts, "tts_engine", None))
-    
-    # Sélection de la fonction synthèse selon le moteur
-    try:
-        if engine == "onecore":
-            from add_dub.core.tts import synthesize_tts_for_subtitle as _synth
-        elif engine == "edge":
-            from add_dub.core.tts_edge import synthesize_tts_for_subtitle as _synth
-        elif engine == "gtts":
-            from add_dub.core.tts_gtts import synthesize_tts_for_subtitle as _synth
-        else:
-            # Sécurité : valeur inconnue → onecore
-            from add_dub.core.tts import synthesize_tts_for_subtitle as _synth
-
-        target_duration_ms = end_ms - start_ms
-        res = _synth(text, target_duration_ms, voice_id, opts)
-        if isinstance(res, tuple):
-            if len(res) == 3:
-                seg, attempts, rate = res
-            elif len(res) == 2:
-                seg, attempts = res
-                rate = getattr(opts, "min_rate_tts", 1.0)
-            else:
-                seg, attempts, rate = res[0], 1, getattr(opts, "min_rate_tts", 1.0)
-        else:
-            seg, attempts, rate = res, 1, getattr(opts, "min_rate_tts", 1.0)
-        
-    except Exception as e:
-        print(t("workers_warn_tts_fail", engine=engine, e=e))
-        # Fallback OneCore
-        from add_dub.core.tts import synthesize_tts_for_subtitle as _synth_fallback
-        target_duration_ms = end_ms - start_ms
-        res = _synth_fallback(text, target_duration_ms, None, opts)
-        if isinstance(res, tuple):
-            if len(res) == 3:
-                seg, attempts, rate = res
-            elif len(res) == 2:
-                seg, attempts = res
-                rate = getattr(opts, "min_rate_tts", 1.0)
+    target_duration_ms = end_ms - start_ms
+
+    # Cache disque (clé = moteur/voix/texte/vitesses/durée arrondie)
+    cache_key = None
+    seg = None
+    if getattr(opts, "tts_cache", False):
+        cache_key = tts_cache.segment_key(
+            engine, voice_id, text,
+            getattr(opts, "min_rate_tts", 1.0),
+            getattr(opts, "max_rate_tts", 1.8),
+            target_duration_ms,
+            getattr(opts, "stretch_backend", None),
+        )
+        seg = tts_cache.get(cache_key)
+
+    cached = seg is not None
+    if cached:
+        attempts, rate = 0, getattr(opts, "min_rate_tts", 1.0)
+    else:
+        # Sélection de la fonction synthèse selon le moteur
+        try:
+            if engine == "onecore":
+                from add_dub.core.tts import synthesize_tts_for_subtitle as _synth
+            elif engine == "edge":
+                from add_dub.core.tts_edge import synthesize_tts_for_subtitle as _synth
+            elif engine == "gtts":
+                from add_dub.core.tts_gtts import synthesize_tts_for_subtitle as _synth
             else:
-                seg, attempts, rate = res[0], 1, getattr(opts, "min_rate_tts", 1.0)
-        else:
-            seg, attempts, rate = res, 1, getattr(opts, "min_rate_tts", 1.0)
+                # Sécurité : valeur inconnue → onecore
+                from add_dub.core.tts import synthesize_tts_for_subtitle as _synth
+
+            res = _synth(text, target_duration_ms, voice_id, opts)
+            seg, attempts, rate = _unpack_synth_result(res, opts)
+
+            # Les moteurs en ligne renvoient du silence en cas d'échec réseau :
+            # on ne met en cache que des segments audibles.
+            if cache_key and seg.rms > 0:
+                tts_cache.put(cache_key, seg)
 
+        except Exception as e:
+            print(t("workers_warn_tts_fail", engine=engine, e=e))
+            # Fallback OneCore
+            from add_dub.core.tts import synthesize_tts_for_subtitle as _synth_fallback
+            res = _synth_fallback(text, target_duration_ms, None, opts)
+            seg, attempts, rate = _unpack_synth_result(res, opts)
+
+    return idx, _handoff(seg, opts), start_ms, end_ms, attempts, rate, cached, rate_model.drain()
+
+
+def _handoff(seg: AudioSegment, opts):
+    """
+    Prépare le segment pour le processus parent : PCM en mémoire, ou WAV temporaire.
+    """
+    if str(getattr(opts, "tts_handoff", "pcm") or "pcm").lower() == "pcm":
+        return PcmSegment.from_audio(seg)
     out_path = os.path.join(io_fs.TMP_DIR, f"dub_seg_{uuid.uuid4().hex}.wav")
     seg.export(out_path, format="wav")
-    
-    return idx, out_path, start_ms, end_ms, attempts, rate
+    return out_path
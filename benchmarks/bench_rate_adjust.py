@@ -0,0 +1,86 @@
+# benchmarks/bench_rate_adjust.py
+"""
+Compare l'ajustement de vitesse des segments Edge/gTTS :
+  - ancien schéma : passe min_rate_tts, puis seconde passe si encore trop long ;
+  - nouveau schéma : un seul facteur combiné (audio_utils.combined_rate).
+
+Signal synthétique (pas de réseau) ; on mesure le nombre de passes, les échantillons
+traités et le temps par ligne pour le backend choisi.
+
+Usage : python -m benchmarks.bench_rate_adjust [--lines 200] [--backend wsola|ffmpeg]
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+import numpy as np
+from pydub import AudioSegment
+
+from add_dub.core import audio_utils
+
+SR = 24000
+
+
+def _fake_line(duration_ms: int, rng: random.Random) -> AudioSegment:
+    t = np.arange(int(SR * duration_ms / 1000)) / SR
+    f0 = rng.uniform(110, 240)
+    x = 0.4 * np.sin(2 * np.pi * f0 * t) + 0.2 * np.sin(2 * np.pi * 2.7 * f0 * t)
+    pcm = (x * 32767 * 0.5).astype(np.int16)
+    return AudioSegment(data=pcm.tobytes(), sample_width=2, frame_rate=SR, channels=1)
+
+
+def _two_pass(seg: AudioSegment, tgt: int, min_rate: float, max_rate: float, backend: str):
+    passes, samples = 0, 0
+    if abs(min_rate - 1.0) > 1e-6:
+        samples += int(seg.frame_count())
+        seg = audio_utils.speed_change(seg, min_rate, backend)
+        passes += 1
+    if len(seg) > tgt:
+        samples += int(seg.frame_count())
+        seg = audio_utils.speed_change(seg, min(len(seg) / tgt, max(max_rate, 1.0)), backend)
+        passes += 1
+    return seg, passes, samples
+
+
+def _one_pass(seg: AudioSegment, tgt: int, min_rate: float, max_rate: float, backend: str):
+    factor = audio_utils.combined_rate(len(seg), tgt, min_rate, max_rate)
+    if abs(factor - 1.0) <= 1e-6:
+        return seg, 0, 0
+    return audio_utils.speed_change(seg, factor, backend), 1, int(seg.frame_count())
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--lines", type=int, default=200)
+    ap.add_argument("--backend", choices=audio_utils.STRETCH_BACKENDS, default="wsola")
+    ap.add_argument("--min-rate", type=float, default=1.2)
+    ap.add_argument("--max-rate", type=float, default=1.8)
+    ap.add_argument("--seed", type=int, default=0)
+    a = ap.parse_args()
+
+    rng = random.Random(a.seed)
+    lines = []
+    for _ in range(a.lines):
+        tgt = rng.randint(800, 5000)
+        raw = int(tgt * rng.uniform(0.8, 2.2))
+        lines.append((_fake_line(raw, rng), tgt))
+
+    for name, fn in (("2 passes", _two_pass), ("1 passe", _one_pass)):
+        passes = samples = 0
+        t0 = time.perf_counter()
+        for seg, tgt in lines:
+            _, p, s = fn(seg, tgt, a.min_rate, a.max_rate, a.backend)
+            passes += p
+            samples += s
+        dt = time.perf_counter() - t0
+        print(
+            f"{name:9s} : {passes / a.lines:.2f} passe(s)/ligne, "
+            f"{samples / a.lines / SR:.2f} s d'audio traité/ligne, "
+            f"{dt * 1000 / a.lines:.2f} ms/ligne ({a.backend})"
+        )
+
+
+if __name__ == "__main__":
+    main()